@@ -3,9 +3,12 @@ from OTGroundTruther.presenter.presenter import Presenter
 
 
 def main() -> None:
-    model = ModelInitializer().get()
+    model_initializer = ModelInitializer()
+    model = model_initializer.get()
     presenter = Presenter(model=model)
     presenter.run_gui()
+    if model_initializer.get_cli_arguments().print_frame_cache_statistics:
+        print(model.get_frame_cache_statistics())
 
 
 if __name__ == "__main__":
@@ -3,11 +3,19 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from OTGroundTruther.model.config import (
+    DEFAULT_DECODER_BACKEND,
+    DEFAULT_DECODER_THREADS,
+    DEFAULT_FRAME_CACHE_SIZE_IN_MB,
+    DEFAULT_MAX_OPEN_VIDEOS,
+    DEFAULT_PRINT_FRAME_CACHE_STATISTICS,
+    DEFAULT_READ_AHEAD_FRAMES,
+    DEFAULT_RECORD_FRAME_TIMESTAMPS,
     DEFAULT_VIDEO_FILE_SUFFIX,
     GROUND_TRUTH_EVENTS_FILE_SUFFIX,
     OTANALYTICS_FILE_SUFFIX,
     OTEVENTS_FILE_SUFFIX,
 )
+from OTGroundTruther.model.decoder import DECODER_BACKENDS
 
 
 class SectionsFileDoesNotExist(Exception):
@@ -31,6 +39,13 @@ class CliArguments:
     video_files: set[Path]
     sections_file: Path | None
     events_file: Path | None
+    read_ahead_frames: int = DEFAULT_READ_AHEAD_FRAMES
+    frame_cache_size_in_mb: int = DEFAULT_FRAME_CACHE_SIZE_IN_MB
+    max_open_videos: int = DEFAULT_MAX_OPEN_VIDEOS
+    record_frame_timestamps: bool = DEFAULT_RECORD_FRAME_TIMESTAMPS
+    decoder_backend: str = DEFAULT_DECODER_BACKEND
+    decoder_threads: int = DEFAULT_DECODER_THREADS
+    print_frame_cache_statistics: bool = DEFAULT_PRINT_FRAME_CACHE_STATISTICS
 
 
 class CliArgumentParser:
@@ -71,6 +86,56 @@ class CliArgumentParser:
             "containing sections and events.",
             required=False,
         )
+        self._parser.add_argument(
+            "--read-ahead-frames",
+            type=int,
+            default=DEFAULT_READ_AHEAD_FRAMES,
+            help="Number of frames decoded ahead in the background, 0 disables it.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--frame-cache-mb",
+            type=int,
+            default=DEFAULT_FRAME_CACHE_SIZE_IN_MB,
+            help="Memory budget in MB for decoded frames, 0 disables the cache.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--max-open-videos",
+            type=int,
+            default=DEFAULT_MAX_OPEN_VIDEOS,
+            help="Maximum number of videos kept open at the same time.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--frame-timestamps",
+            action="store_true",
+            default=DEFAULT_RECORD_FRAME_TIMESTAMPS,
+            help="Record the timestamp of every frame in the background to convert "
+            "between frames and timestamps of variable frame rate videos.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--decoder",
+            choices=list(DECODER_BACKENDS),
+            default=DEFAULT_DECODER_BACKEND,
+            help="Library used to decode the videos.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--decoder-threads",
+            type=int,
+            default=DEFAULT_DECODER_THREADS,
+            help="Number of threads decoding a video, 0 lets the decoder decide.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--frame-cache-stats",
+            action="store_true",
+            default=DEFAULT_PRINT_FRAME_CACHE_STATISTICS,
+            help="Print the hits and misses of the frame cache on exit.",
+            required=False,
+        )
 
     def parse(self) -> CliArguments:
         args = self._parser.parse_args()
@@ -97,6 +162,13 @@ class CliArgumentParser:
             video_files=video_files,
             sections_file=sections_file,
             events_file=events_file,
+            read_ahead_frames=args.read_ahead_frames,
+            frame_cache_size_in_mb=args.frame_cache_mb,
+            max_open_videos=args.max_open_videos,
+            record_frame_timestamps=args.frame_timestamps,
+            decoder_backend=args.decoder,
+            decoder_threads=args.decoder_threads,
+            print_frame_cache_statistics=args.frame_cache_stats,
         )
 
     @staticmethod
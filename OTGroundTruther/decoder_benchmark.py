@@ -0,0 +1,122 @@
+import random
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Callable
+
+from OTGroundTruther.model.config import DEFAULT_DECODER_THREADS
+from OTGroundTruther.model.decoder import (
+    DECODER_BACKENDS,
+    DecoderBackendNotAvailableError,
+    VideoDecoder,
+    open_decoder,
+)
+
+DEFAULT_NUMBER_OF_FRAMES: int = 200
+RANDOM_SEED: int = 42
+
+
+def benchmark_sequential(decoder: VideoDecoder, number_of_frames: int) -> int:
+    decoder.seek(0)
+    for frames_read in range(number_of_frames):
+        if decoder.read() is None:
+            return frames_read
+    return number_of_frames
+
+
+def benchmark_random(decoder: VideoDecoder, number_of_frames: int) -> int:
+    frame_count = decoder.get_frame_count()
+    generator = random.Random(RANDOM_SEED)
+    frames_read = 0
+    for _ in range(number_of_frames):
+        decoder.seek(generator.randrange(max(frame_count - 1, 1)))
+        if decoder.read() is not None:
+            frames_read += 1
+    return frames_read
+
+
+def benchmark_backward(decoder: VideoDecoder, number_of_frames: int) -> int:
+    last_frame_index = max(min(decoder.get_frame_count() - 2, number_of_frames), 0)
+    frames_read = 0
+    for frame_index in range(last_frame_index, last_frame_index - number_of_frames, -1):
+        if frame_index < 0:
+            break
+        decoder.seek(frame_index)
+        if decoder.read() is not None:
+            frames_read += 1
+    return frames_read
+
+
+BENCHMARKS: dict[str, Callable[[VideoDecoder, int], int]] = {
+    "sequential": benchmark_sequential,
+    "random": benchmark_random,
+    "backward": benchmark_backward,
+}
+
+
+def run(
+    file: Path, backends: list[str], number_of_frames: int, thread_count: int
+) -> None:
+    """Print the decoded frames per second of each backend and access pattern.
+
+    Args:
+        file (Path): the video to decode
+        backends (list[str]): names of the decoder backends to compare
+        number_of_frames (int): number of frames to decode per access pattern
+        thread_count (int): number of decoding threads, 0 lets the decoder decide
+    """
+    print(f"{'backend':<10}" + "".join(f"{name:>14}" for name in BENCHMARKS))
+    for backend in backends:
+        try:
+            decoder = open_decoder(file, backend=backend, thread_count=thread_count)
+        except DecoderBackendNotAvailableError as cause:
+            print(f"{backend:<10}{cause}")
+            continue
+        results = []
+        try:
+            for benchmark in BENCHMARKS.values():
+                start = time.perf_counter()
+                frames_read = benchmark(decoder, number_of_frames)
+                frames_per_second = frames_read / (time.perf_counter() - start)
+                results.append(f"{frames_per_second:>10.1f} fps")
+        finally:
+            decoder.close()
+        print(f"{backend:<10}" + "".join(results))
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        "OTGroundTruther decoder benchmark",
+        description="Compare the throughput of the decoder backends on a video.",
+    )
+    parser.add_argument("video", type=Path, help="Video file to decode.")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=list(DECODER_BACKENDS),
+        default=list(DECODER_BACKENDS),
+        help="Decoder backends to compare.",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=DEFAULT_NUMBER_OF_FRAMES,
+        help="Number of frames to decode per access pattern.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_DECODER_THREADS,
+        help="Number of decoding threads, 0 lets the decoder decide.",
+    )
+    args = parser.parse_args()
+    run(
+        file=args.video,
+        backends=args.backends,
+        number_of_frames=args.frames,
+        thread_count=args.threads,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,9 @@ JUMP_TIME_STEPS: dict[int, float] = {
 
 MINIMUM_WINDOWS_SCROLL_VALUE: int = 120
 FACTOR_LARGE_SCROLLING: int = 10
+ZOOM_STEP: float = 1.25
+PAN_THRESHOLD: int = 5
+"""Distance in pixels the cursor has to move with the left button down to pan."""
 
 
 LEFT_MOUSE_UP: str = "#left mouse button#"
@@ -50,9 +53,12 @@ class TkEvents:
     MOUSE_MOTION_WHILE_LEFT_BUTTON_DOWN: ClassVar[str] = "<B1-Motion>"
     MOUSE_ENTERS_WIDGET: ClassVar[str] = "<Enter>"
     MOUSE_LEAVES_WIDGET: ClassVar[str] = "<Leave>"
+    WIDGET_RESIZED: ClassVar[str] = "<Configure>"
     TREEVIEW_SELECT: ClassVar[str] = "<<TreeviewSelect>>"
-    PLUS_KEY: ClassVar[str] = "+"
+    PLUS_KEY: ClassVar[str] = "<plus>"
     KEYPAD_PLUS_KEY: ClassVar[str] = "<KP_Add>"
+    MINUS_KEY: ClassVar[str] = "<minus>"
+    KEYPAD_MINUS_KEY: ClassVar[str] = "<KP_Subtract>"
     LEFT_ARROW_KEY: ClassVar[str] = "<Left>"
     RIGHT_ARROW_KEY: ClassVar[str] = "<Right>"
     UP_ARROW_KEY: ClassVar[str] = "<Up>"
@@ -64,11 +70,14 @@ class TkEvents:
     SPACE_KEY: ClassVar[str] = "<space>"
     CONTROL_SPACE_KEY: ClassVar[str] = "<Control-space>"
     ESCAPE_KEY: ClassVar[str] = "<Escape>"
+    PLAY_PAUSE_KEY: ClassVar[str] = "<Control-p>"
+    PLAYBACK_SPEED_KEY: ClassVar[str] = "<Control-f>"
     ALPHANUMERIC_KEY: ClassVar[str] = "<Key>"
     MULTI_SELECT_SINGLE: ClassVar[str] = (
         "<Command-ButtonRelease-1>" if ON_MAC else "<Control-ButtonRelease-1>"
     )
     MOUSE_WHEEL_SCROLLED: ClassVar[str] = "<MouseWheel>"
+    CONTROL_MOUSE_WHEEL_SCROLLED: ClassVar[str] = "<Control-MouseWheel>"
     CONTROL_LEFT: ClassVar[str] = "<Control_L>"
     CONTROL_RIGHT: ClassVar[str] = "<Control_R>"
 
@@ -86,12 +95,14 @@ class TkEvents:
             LEFT_MOUSE_UP: "Set new Event for the Active Count",
             self.LEFT_BUTTON_DOUBLE: "",
             self.MOUSE_MOTION: "",
-            self.MOUSE_MOTION_WHILE_LEFT_BUTTON_DOWN: "",
+            self.MOUSE_MOTION_WHILE_LEFT_BUTTON_DOWN: "Move the zoomed videos",
             self.MOUSE_ENTERS_WIDGET: "",
             self.MOUSE_LEAVES_WIDGET: "",
             self.TREEVIEW_SELECT: "",
-            self.PLUS_KEY: "",
+            self.PLUS_KEY: "Zoom in",
             self.KEYPAD_PLUS_KEY: "",
+            self.MINUS_KEY: "Zoom out",
+            self.KEYPAD_MINUS_KEY: "",
             self.LEFT_ARROW_KEY: "Large jump backward in the videos",
             self.RIGHT_ARROW_KEY: "Large jump forward in the videos",
             self.UP_ARROW_KEY: "Increase large time jump",
@@ -103,8 +114,11 @@ class TkEvents:
             self.SPACE_KEY: "Small jump forward in the videos",
             self.CONTROL_SPACE_KEY: "Small jump backward in the videos",
             self.ESCAPE_KEY: "Deselect selection / Abort active count",
+            self.PLAY_PAUSE_KEY: "Play / pause the videos",
+            self.PLAYBACK_SPEED_KEY: "Switch playback speed (1x, 2x, 4x)",
             self.MULTI_SELECT_SINGLE: "",
             self.MOUSE_WHEEL_SCROLLED: "Small jump forward / backward in the videos",
+            self.CONTROL_MOUSE_WHEEL_SCROLLED: "Zoom in / out at the cursor",
             self.CONTROL_LEFT: "",
             self.CONTROL_RIGHT: "",
         }
@@ -10,10 +10,13 @@ from OTGroundTruther.gui.constants import (
     MINIMUM_WINDOWS_SCROLL_VALUE,
     PADX,
     PADY,
+    PAN_THRESHOLD,
     PREVIEW_IMAGE_FILE,
     STICKY,
+    ZOOM_STEP,
     tk_events,
 )
+from OTGroundTruther.gui.frame_timeline import FrameTimeline
 from OTGroundTruther.gui.presenter_interface import PresenterInterface
 from OTGroundTruther.model.config import ON_WINDOWS
 
@@ -21,6 +24,10 @@ FRAME_CANVAS_ROW: int = 0
 FRAME_CANVAS_COLUMN: int = 0
 FRAME_LABEL_ROW: int = FRAME_CANVAS_ROW + 1
 FRAME_LABEL_COLUMN: int = FRAME_CANVAS_COLUMN
+FRAME_TIMELINE_ROW: int = FRAME_LABEL_ROW + 1
+FRAME_TIMELINE_COLUMN: int = FRAME_CANVAS_COLUMN
+MAX_PHOTO_IMAGES: int = 4
+"""Number of resolutions to keep a photo image for."""
 
 
 class FrameCanvas(ctk.CTkFrame):
@@ -36,11 +43,14 @@ class FrameCanvas(ctk.CTkFrame):
             master=self, presenter=self._presenter
         )
         self._canvas_info_text = ctk.CTkLabel(master=self)
+        self.timeline = FrameTimeline(master=self, presenter=self._presenter)
         self._event_translator = CanvasEventTranslator(
             framecanvas=self, presenter=self._presenter
         )
 
     def _place_widgets(self) -> None:
+        self.grid_rowconfigure(FRAME_CANVAS_ROW, weight=1)
+        self.grid_columnconfigure(FRAME_CANVAS_COLUMN, weight=1)
         self.canvas_background.grid(
             row=FRAME_CANVAS_ROW,
             column=FRAME_CANVAS_COLUMN,
@@ -55,17 +65,40 @@ class FrameCanvas(ctk.CTkFrame):
             pady=PADY,
             sticky=STICKY,
         )
+        self.timeline.grid(
+            row=FRAME_TIMELINE_ROW,
+            column=FRAME_TIMELINE_COLUMN,
+            padx=PADX,
+            pady=PADY,
+            sticky=STICKY,
+        )
 
     def clear_image(self) -> None:
         self.canvas_background.clear_image()
 
+    def show_info_text(self, text: str) -> None:
+        self._canvas_info_text.configure(text=text)
+        self.update_idletasks()
+
+    def refresh_info_text(self) -> None:
+        self._event_translator._refresh_canvas_info_text()
+
 
 class CanvasBackground(ctk.CTkCanvas):
+    """Canvas showing the current frame.
+
+    The canvas takes the space the window leaves it, the frames are rendered to
+    fit into it. One photo image is kept per resolution and updated in place, so
+    that showing a frame neither creates Tk images nor canvas items.
+    """
+
     def __init__(self, presenter: PresenterInterface, **kwargs: Any):
         super().__init__(**kwargs)
         self._presenter = presenter
-        self._current_image: ImageTk.PhotoImage
+        self._photo_images: dict[tuple[int, int], ImageTk.PhotoImage] = {}
+        self._current_image: ImageTk.PhotoImage | None = None
         self._current_id: Any = None
+        self.config(highlightthickness=0)
         self.update_image(self._get_preview_image())
 
     def _get_preview_image(self) -> Image.Image:
@@ -73,26 +106,30 @@ class CanvasBackground(ctk.CTkCanvas):
             return Image.open(PREVIEW_IMAGE_FILE)
 
     def update_image(self, image: Image.Image) -> None:
-        photo_image = ImageTk.PhotoImage(image)
-        if self._current_id:
-            self.delete(self._current_id)
-        self._current_image = photo_image
-        self.resize_canvas_by_image()
-        self._draw()
+        """Show an image on the canvas.
 
-    def resize_canvas_by_image(self):
-        self.config(
-            width=self._current_image.width(), height=self._current_image.height()
-        )
-
-    def _draw(self) -> None:
-        self._current_id = self.create_image(
-            0, 0, image=self._current_image, anchor=ctk.NW
-        )
-        self.config(
-            width=self._current_image.width(), height=self._current_image.height()
-        )
-        self.config(highlightthickness=0)
+        Args:
+            image (Image.Image): the image to show
+        """
+        photo_image = self._get_photo_image(image)
+        if photo_image is self._current_image:
+            return
+        self._current_image = photo_image
+        if self._current_id is None:
+            self._current_id = self.create_image(0, 0, image=photo_image, anchor=ctk.NW)
+        else:
+            self.itemconfig(self._current_id, image=photo_image)
+
+    def _get_photo_image(self, image: Image.Image) -> ImageTk.PhotoImage:
+        photo_image = self._photo_images.pop(image.size, None)
+        if photo_image is None:
+            photo_image = ImageTk.PhotoImage(image)
+            if len(self._photo_images) >= MAX_PHOTO_IMAGES:
+                del self._photo_images[next(iter(self._photo_images))]
+        else:
+            photo_image.paste(image)
+        self._photo_images[image.size] = photo_image
+        return photo_image
 
     def _get_width(self) -> int:
         return self.winfo_width()
@@ -103,6 +140,8 @@ class CanvasBackground(ctk.CTkCanvas):
     def clear_image(self) -> None:
         if self._current_id:
             self.delete(self._current_id)
+        self._current_id = None
+        self._current_image = None
 
 
 class CanvasEventTranslator:
@@ -113,6 +152,8 @@ class CanvasEventTranslator:
         self._middle_button_pressed: bool = False
         self._current_scrolling_time_step_short: bool = True
         self._current_jump_time_step: int = 0
+        self._left_button_down_at: tuple[int, int] | None = None
+        self._panning: bool = False
         self._bind_events()
 
     def _bind_events(self) -> None:
@@ -129,8 +170,15 @@ class CanvasEventTranslator:
         self._canvas.bind(tk_events.MOUSE_ENTERS_WIDGET, self._on_mouse_enters_canvas)
         self._canvas.bind(tk_events.MOUSE_LEAVES_WIDGET, self._on_mouse_leaves_canvas)
         self._canvas.bind(tk_events.MOUSE_WHEEL_SCROLLED, self._on_mouse_wheel_scrolled)
+        self._canvas.bind(
+            tk_events.CONTROL_MOUSE_WHEEL_SCROLLED,
+            self._on_control_mouse_wheel_scrolled,
+        )
+        self._canvas.bind(tk_events.WIDGET_RESIZED, self._on_resized)
         self._canvas.bind(tk_events.PLUS_KEY, self._on_plus)
         self._canvas.bind(tk_events.KEYPAD_PLUS_KEY, self._on_plus)
+        self._canvas.bind(tk_events.MINUS_KEY, self._on_minus)
+        self._canvas.bind(tk_events.KEYPAD_MINUS_KEY, self._on_minus)
 
         self._canvas.bind(tk_events.LEFT_ARROW_KEY, self._on_left_key)
         self._canvas.bind(tk_events.RIGHT_ARROW_KEY, self._on_right_key)
@@ -143,12 +191,19 @@ class CanvasEventTranslator:
         self._canvas.bind(tk_events.CONTROL_SPACE_KEY, self._on_control_space_key)
 
         self._canvas.bind(tk_events.ESCAPE_KEY, self._on_escape_key)
+        self._canvas.bind(tk_events.PLAY_PAUSE_KEY, self._on_play_pause_key)
+        self._canvas.bind(tk_events.PLAYBACK_SPEED_KEY, self._on_playback_speed_key)
         self._canvas.bind(tk_events.ALPHANUMERIC_KEY, self._on_alphanumeric_key)
 
     def _on_left_button_down(self, event: Any) -> None:
-        pass
+        self._left_button_down_at = self._get_mouse_coordinates(event)
+        self._panning = False
 
     def _on_left_button_up(self, event: Any) -> None:
+        self._left_button_down_at = None
+        if self._panning:
+            self._panning = False
+            return
         x, y = self._get_mouse_coordinates(event)
         self._presenter.try_add_event(x=x, y=y)
 
@@ -169,7 +224,21 @@ class CanvasEventTranslator:
         pass
 
     def _on_motion_while_left_button_down(self, event: Any) -> None:
-        pass
+        """Pan once the cursor moved far enough, otherwise the click adds an event.
+
+        Args:
+            event (Any): Event on canvas
+        """
+        if self._left_button_down_at is None:
+            return
+        x, y = self._get_mouse_coordinates(event)
+        previous_x, previous_y = self._left_button_down_at
+        if not self._panning:
+            if max(abs(x - previous_x), abs(y - previous_y)) < PAN_THRESHOLD:
+                return
+            self._panning = True
+        self._left_button_down_at = (x, y)
+        self._presenter.pan(delta_x=x - previous_x, delta_y=y - previous_y)
 
     def _on_mouse_leaves_canvas(self, event: Any) -> None:
         pass
@@ -189,8 +258,26 @@ class CanvasEventTranslator:
             mouse_wheel_pressed=self._middle_button_pressed,
         )
 
+    def _on_control_mouse_wheel_scrolled(self, event: Any) -> None:
+        x, y = self._get_mouse_coordinates(event)
+        factor = ZOOM_STEP if event.delta > 0 else 1 / ZOOM_STEP
+        self._presenter.zoom(factor=factor, x=x, y=y)
+
     def _on_plus(self, event: Any) -> None:
-        pass
+        self._zoom_at_center(factor=ZOOM_STEP)
+
+    def _on_minus(self, event: Any) -> None:
+        self._zoom_at_center(factor=1 / ZOOM_STEP)
+
+    def _zoom_at_center(self, factor: float) -> None:
+        self._presenter.zoom(
+            factor=factor,
+            x=self._canvas.winfo_width() // 2,
+            y=self._canvas.winfo_height() // 2,
+        )
+
+    def _on_resized(self, event: Any) -> None:
+        self._presenter.resize_canvas(width=event.width, height=event.height)
 
     def _on_left_key(self, event: Any) -> None:
         delta_of_time = -1 * JUMP_TIME_STEPS[self._current_jump_time_step]
@@ -232,6 +319,12 @@ class CanvasEventTranslator:
     def _on_escape_key(self, event: Any) -> None:
         self._presenter.abort_active_count()
 
+    def _on_play_pause_key(self, event: Any) -> None:
+        self._presenter.toggle_playback()
+
+    def _on_playback_speed_key(self, event: Any) -> None:
+        self._presenter.switch_playback_speed()
+
     def _on_alphanumeric_key(self, event: Any) -> None:
         key = event.keysym
         self._presenter.set_road_user_class_for_active_count(key)
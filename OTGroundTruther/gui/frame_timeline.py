@@ -0,0 +1,63 @@
+from typing import Any
+
+import customtkinter as ctk
+from PIL import Image, ImageTk
+
+from OTGroundTruther.gui.constants import tk_events
+from OTGroundTruther.gui.presenter_interface import PresenterInterface
+
+TIMELINE_HEIGHT: int = 48
+POSITION_MARKER_COLOR: str = "red"
+POSITION_MARKER_WIDTH: int = 2
+
+
+class FrameTimeline(ctk.CTkCanvas):
+    """Strip of thumbnails over all videos to jump to a position by clicking."""
+
+    def __init__(self, presenter: PresenterInterface, **kwargs: Any) -> None:
+        super().__init__(height=TIMELINE_HEIGHT, highlightthickness=0, **kwargs)
+        self._presenter = presenter
+        self._current_image: ImageTk.PhotoImage | None = None
+        self._image_id: Any = None
+        self._marker_id: Any = None
+        self.bind(tk_events.LEFT_BUTTON_UP, self._on_left_button_up)
+        self.bind(tk_events.WIDGET_RESIZED, self._on_resized)
+
+    def get_size(self) -> tuple[int, int]:
+        return self.winfo_width(), TIMELINE_HEIGHT
+
+    def update_strip(self, strip: Image.Image) -> None:
+        self._current_image = ImageTk.PhotoImage(strip)
+        if self._image_id is None:
+            self._image_id = self.create_image(
+                0, 0, image=self._current_image, anchor=ctk.NW
+            )
+        else:
+            self.itemconfig(self._image_id, image=self._current_image)
+        if self._marker_id is not None:
+            self.tag_raise(self._marker_id)
+
+    def show_position(self, relative_position: float) -> None:
+        x = relative_position * self.winfo_width()
+        if self._marker_id is None:
+            self._marker_id = self.create_line(
+                x,
+                0,
+                x,
+                TIMELINE_HEIGHT,
+                fill=POSITION_MARKER_COLOR,
+                width=POSITION_MARKER_WIDTH,
+            )
+        else:
+            self.coords(self._marker_id, x, 0, x, TIMELINE_HEIGHT)
+
+    def _on_resized(self, event: Any) -> None:
+        self._presenter.refresh_timeline()
+
+    def _on_left_button_up(self, event: Any) -> None:
+        width = self.winfo_width()
+        if width <= 0:
+            return
+        self._presenter.jump_to_timeline_position(
+            relative_position=min(max(event.x / width, 0), 1)
+        )
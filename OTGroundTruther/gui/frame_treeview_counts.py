@@ -1,4 +1,3 @@
-import copy
 import tkinter as tk
 import tkinter.ttk as ttk
 from typing import Any, Callable
@@ -6,7 +5,7 @@ from typing import Any, Callable
 import customtkinter as ctk
 from PIL import Image
 
-from OTGroundTruther.gui.constants import PADX, PADY, STICKY
+from OTGroundTruther.gui.constants import PADX, PADY, STICKY, tk_events
 from OTGroundTruther.gui.presenter_interface import PresenterInterface
 from OTGroundTruther.model.count import (
     COUNT_CLASS_NAME,
@@ -17,8 +16,8 @@ from OTGroundTruther.model.count import (
     COUNT_NUMBER_OF_EVENTS,
     COUNT_TIME_SPAN,
     Count,
-    CountRepository,
 )
+from OTGroundTruther.model.count_table import CountTable
 from OTGroundTruther.model.road_user_class import RoadUserClass
 
 COMBOBOX_FRAME_ROW: int = 0
@@ -31,6 +30,13 @@ CLASS_LABEL_FRAME_ROW: int = TREEVIEW_FRAME_ROW + 1
 CLASS_LABEL_FRAME_COLUMN: int = COMBOBOX_FRAME_COLUMN
 
 TREEVIEW_SELECT: str = "<<TreeviewSelect>>"
+COUNTS_SELECTED: str = "<<CountsSelected>>"
+SCROLL_UP: str = "<Button-4>"
+SCROLL_DOWN: str = "<Button-5>"
+SCROLL_UP_BUTTON: int = 4
+MOUSE_WHEEL_ROWS: int = 3
+SHIFT_MASK: int = 0x0001
+CONTROL_MASK: int = 0x0004
 
 COUNT_PROPERTIES_ORDER: list[str] = [
     COUNT_ID_NAME,
@@ -145,32 +151,45 @@ class Combobox(ctk.CTkComboBox):
 
     def fill_and_set(self, class_names: list[str]) -> None:
         self.class_names = class_names
+        self._classes_of_options: dict[str, frozenset[str]] = {
+            ALL_CLASSES_SELECTION: frozenset(class_names),
+            **{group: frozenset(classes) for group, classes in CLASS_GROUPS.items()},
+            **{class_name: frozenset([class_name]) for class_name in class_names},
+        }
         self.configure(
             variable=self.combobox_var,
             values=[ALL_CLASSES_SELECTION] + list(CLASS_GROUPS.keys()) + class_names,
             command=self.combobox_callback,
         )
         self.set(value=ALL_CLASSES_SELECTION)
-        self.selected_classes: list[str] = copy.deepcopy(class_names)
+        self.selected_classes: frozenset[str] = self._classes_of_options[
+            ALL_CLASSES_SELECTION
+        ]
 
     def combobox_callback(self, selected_option: str) -> None:
-        if selected_option == ALL_CLASSES_SELECTION:
-            self.selected_classes = self.class_names
-        elif selected_option in list(CLASS_GROUPS.keys()):
-            self.selected_classes = CLASS_GROUPS[selected_option]
-        else:
-            self.selected_classes = [selected_option]
+        self.selected_classes = self._classes_of_options[selected_option]
         self._presenter.update_canvas_image_with_new_overlay()
         self._presenter.refresh_treeview()
 
-    def get_selected_classes(self) -> list[str]:
+    def get_selected_classes(self) -> frozenset[str]:
         return self.selected_classes
 
 
 class Treeview(ttk.Treeview):
+    """List of the counts that only holds items for the rows in view.
+
+    The rows are read from a count table by index whenever the list is scrolled,
+    so that listing many counts neither creates many Tk items nor blocks the GUI.
+    The selection is kept for all rows, also for those out of view.
+    """
+
     def __init__(self, presenter: PresenterInterface, **kwargs: Any):
         super().__init__(**kwargs)
         self._presenter = presenter
+        self._table = CountTable(count_repository=presenter.get_count_repository())
+        self._first_row: int = 0
+        self._selected_count_ids: set[str] = set()
+        self._extend_selection: bool = False
         self._add_columns()
 
         self._add_scrollbar()
@@ -178,7 +197,6 @@ class Treeview(ttk.Treeview):
             treeview=self, presenter=self._presenter
         )
         self.add_next_column_sort_direction()
-        self.example_count: Count | None = None
         self.last_sorted_by = COUNT_ENTER_TIME_NAME
 
     def _add_columns(self) -> None:
@@ -188,9 +206,8 @@ class Treeview(ttk.Treeview):
 
     def _add_scrollbar(self) -> None:
         self.scrollbar = ctk.CTkScrollbar(
-            master=self.master, orientation=ctk.VERTICAL, command=self.yview
+            master=self.master, orientation=ctk.VERTICAL, command=self.scroll_rows
         )
-        self.configure(yscrollcommand=self.scrollbar.set)
         self.scrollbar.grid(
             row=TREEVIEW_FRAME_ROW, column=TREEVIEW_FRAME_COLUMN + 1, sticky="ns"
         )
@@ -200,18 +217,15 @@ class Treeview(ttk.Treeview):
         for column in COUNT_PROPERTIES_ORDER:
             self.next_column_sort_direction[column] = False
 
-    def refresh_treeview(self, count_repository: CountRepository) -> None:
-        self.delete(*self.get_children())
-        selected_classes = self._presenter.get_selected_classes_from_gui()
-        for count in list(count_repository.get_all_as_dict().values()):
-            if count.get_road_user_class().get_name() in selected_classes:
-                self.add_count(
-                    count=count,
-                )
-
-        self.example_count = copy.deepcopy(
-            list(count_repository.get_all_as_dict().values())[0]
+    def refresh_treeview(self) -> None:
+        self._table.refresh(
+            selected_classes=self._presenter.get_selected_classes_from_gui()
         )
+        self._selected_count_ids = {
+            id
+            for id in self._selected_count_ids
+            if self._table.get_index(id) is not None
+        }
         self.sort_by_column()
 
     def add_and_select_count_if_in(self, count: Count) -> None:
@@ -220,51 +234,163 @@ class Treeview(ttk.Treeview):
             in self._presenter.get_selected_classes_from_gui()
         ):
             self.add_count(count=count)
-            self.sort_by_column()
-            self.selection_set([str(count.get_road_user_id())])
             self.see(str(count.get_road_user_id()))
-            self.example_count = copy.deepcopy(count)
+            self.selection_set([str(count.get_road_user_id())])
         else:
             self._presenter.update_canvas_image_with_new_overlay()
 
     def add_count(self, count: Count) -> None:
-        properties_random_order = count.get_properties_to_show_as_dict()
-        values_in_correct_order: list[str | float] = []
-        for count_property in COUNT_PROPERTIES_ORDER:
-            values_in_correct_order.append(properties_random_order[count_property])
-
-        self.insert(
-            parent="",
-            index=tk.END,
-            iid=str(count.get_road_user_id()),
-            values=list(values_in_correct_order),
-        )
-        # self.scroll_to_the_end()
+        self._table.add(count)
+        self._show_rows()
 
     def delete_selected_count(self) -> None:
-        for selected_count_id in self.selection():
-            self.delete(selected_count_id)
+        self._table.remove(self._selected_count_ids)
+        self._selected_count_ids = set()
+        self._show_rows()
 
     def get_selected_count_ids(self) -> list[str]:
-        return list(self.selection())
+        """Get the selected counts still in the list in the order of the list.
+
+        Returns:
+            list[str]: ids of the counts
+        """
+        indices: dict[str, int] = {}
+        for id in self._selected_count_ids:
+            index = self._table.get_index(id)
+            if index is not None:
+                indices[id] = index
+        return sorted(indices, key=indices.__getitem__)
+
+    def selection_set(self, *items: Any) -> None:
+        """Select counts and show the first one selected.
+
+        Args:
+            items (Any): ids of the counts or lists of them, "" selects none
+        """
+        self._selected_count_ids = {
+            id
+            for item in items
+            for id in ([item] if isinstance(item, str) else item)
+            if id and self._table.get_index(id) is not None
+        }
+        self._show_rows()
+        self.event_generate(COUNTS_SELECTED)
+
+    def see(self, item: Any) -> None:
+        """Scroll the count into view.
+
+        Args:
+            item (Any): id of the count
+        """
+        index = self._table.get_index(item)
+        if index is None:
+            return
+        if index < self._first_row:
+            self._first_row = index
+        elif index >= self._first_row + self._get_number_of_visible_rows():
+            self._first_row = index - self._get_number_of_visible_rows() + 1
+        self._show_rows()
+
+    def scroll_rows(self, *args: Any) -> None:
+        """Scroll like `yview`, e.g. by the scrollbar.
+
+        Args:
+            args (Any): "moveto" and the relative position of the first row or
+                "scroll", the number of steps and "units" or "pages"
+        """
+        if args[0] == "moveto":
+            self._first_row = round(float(args[1]) * self._table.get_number_of_rows())
+        elif args[0] == "scroll":
+            steps = int(args[1])
+            if args[2] == "pages":
+                steps *= self._get_number_of_visible_rows()
+            self._first_row += steps
+        self._show_rows()
+
+    def move_selection(self, steps: int) -> None:
+        """Select the row next to the first row selected and scroll it into view.
+
+        Args:
+            steps (int): number of rows to move, negative to move up
+        """
+        selected_count_ids = self.get_selected_count_ids()
+        if not self._table.get_number_of_rows():
+            return
+        if selected_count_ids:
+            index = (self._table.get_index(selected_count_ids[0]) or 0) + steps
+        else:
+            index = self._first_row
+        index = min(max(index, 0), self._table.get_number_of_rows() - 1)
+        (id,) = self._table.get_ids(index, index + 1)
+        self.see(id)
+        self.selection_set([id])
+
+    def set_extend_selection(self, extend_selection: bool) -> None:
+        """Set whether the next click adds to the selection instead of replacing it.
+
+        Args:
+            extend_selection (bool): whether a modifier key is pressed
+        """
+        self._extend_selection = extend_selection
+
+    def update_selection_from_rows(self) -> bool:
+        """Take over the selection of the rows in view changed by the user.
+
+        Returns:
+            bool: whether the selection changed
+        """
+        visible = set(self.get_children())
+        selected_in_view = set(self.selection())
+        if selected_in_view == self._selected_count_ids & visible:
+            return False
+        if self._extend_selection:
+            self._selected_count_ids = (
+                self._selected_count_ids - visible
+            ) | selected_in_view
+        else:
+            self._selected_count_ids = selected_in_view
+        return True
+
+    def _get_number_of_visible_rows(self) -> int:
+        return int(self.cget("height"))
+
+    def _show_rows(self) -> None:
+        number_of_rows = self._table.get_number_of_rows()
+        number_of_visible_rows = self._get_number_of_visible_rows()
+        self._first_row = min(
+            max(self._first_row, 0), max(number_of_rows - number_of_visible_rows, 0)
+        )
+        self.delete(*self.get_children())
+        ids = self._table.get_ids(
+            self._first_row, self._first_row + number_of_visible_rows
+        )
+        for id in ids:
+            self.insert(
+                parent="",
+                index=tk.END,
+                iid=id,
+                values=self._table.get_values(id, COUNT_PROPERTIES_ORDER),
+            )
+        super().selection_set([id for id in ids if id in self._selected_count_ids])
+        if number_of_rows:
+            self.scrollbar.set(
+                self._first_row / number_of_rows,
+                min(self._first_row + number_of_visible_rows, number_of_rows)
+                / number_of_rows,
+            )
+        else:
+            self.scrollbar.set(0, 1)
 
     def sort_by_column(
         self,
         sort_column: str = COUNT_ENTER_TIME_NAME,
         change_sort_direction: bool = False,
     ) -> None:
-        if self.example_count is None:
-            return
-
         sort_direction = self._get_sort_direction(
             change_sort_direction=change_sort_direction, sort_column=sort_column
         )
-        column_values_and_row_index = self._get_tuples_of_column(
-            sort_column=sort_column, _example_count=self.example_count
-        )
-        column_values_and_row_index.sort(reverse=sort_direction)
-        for order_index, (value, tv_index) in enumerate(column_values_and_row_index):
-            self.move(tv_index, "", order_index)
+        self._table.sort(column=sort_column, descending=sort_direction)
+        self._show_rows()
 
     def _get_sort_direction(
         self, change_sort_direction: bool, sort_column: str
@@ -276,21 +402,6 @@ class Treeview(ttk.Treeview):
         self.update_next_column_sort_direction(sort_column=sort_column)
         return return_cache
 
-    def _get_tuples_of_column(
-        self, sort_column: str, _example_count: Count
-    ) -> list[tuple[Any, str]]:
-        count_example_properties = _example_count.get_properties_to_show_as_dict()
-        if isinstance(count_example_properties[sort_column], str):
-            return [
-                (self.set(tv_index, sort_column), tv_index)
-                for tv_index in self.get_children("")
-            ]
-        class_ = type(count_example_properties[sort_column])
-        return [
-            (class_(self.set(tv_index, sort_column)), tv_index)
-            for tv_index in self.get_children("")
-        ]
-
     def update_next_column_sort_direction(self, sort_column: str) -> None:
         self.next_column_sort_direction[sort_column] = (
             not self.next_column_sort_direction[sort_column]
@@ -300,7 +411,7 @@ class Treeview(ttk.Treeview):
                 self.next_column_sort_direction[column] = False
 
     def scroll_to_the_end(self) -> None:
-        self.yview_moveto(1)
+        self.scroll_rows("moveto", 1)
 
 
 class TreeviewTranslator:
@@ -310,7 +421,14 @@ class TreeviewTranslator:
         self._bind_events()
 
     def _bind_events(self) -> None:
-        self._treeview.bind(TREEVIEW_SELECT, self._show_selected_count)
+        self._treeview.bind(TREEVIEW_SELECT, self._on_rows_selected)
+        self._treeview.bind(COUNTS_SELECTED, self._show_selected_count)
+        self._treeview.bind(tk_events.LEFT_BUTTON_DOWN, self._on_left_button_down)
+        self._treeview.bind(tk_events.MOUSE_WHEEL_SCROLLED, self._on_mouse_wheel)
+        self._treeview.bind(SCROLL_UP, self._on_mouse_wheel)
+        self._treeview.bind(SCROLL_DOWN, self._on_mouse_wheel)
+        self._treeview.bind(tk_events.UP_ARROW_KEY, self._on_up_key)
+        self._treeview.bind(tk_events.DOWN_ARROW_KEY, self._on_down_key)
 
         for column in COUNT_PROPERTIES_ORDER:
             sort_treeview_by_column: Callable = (
@@ -322,6 +440,31 @@ class TreeviewTranslator:
                 command=sort_treeview_by_column,
             )
 
+    def _on_left_button_down(self, event: Any) -> None:
+        self._treeview.set_extend_selection(
+            bool(event.state & (SHIFT_MASK | CONTROL_MASK))
+        )
+
+    def _on_rows_selected(self, event: Any) -> None:
+        if self._treeview.update_selection_from_rows():
+            self._show_selected_count(event)
+
+    def _on_mouse_wheel(self, event: Any) -> str:
+        if event.num == SCROLL_UP_BUTTON or event.delta > 0:
+            steps = -MOUSE_WHEEL_ROWS
+        else:
+            steps = MOUSE_WHEEL_ROWS
+        self._treeview.scroll_rows("scroll", steps, "units")
+        return "break"
+
+    def _on_up_key(self, event: Any) -> str:
+        self._treeview.move_selection(-1)
+        return "break"
+
+    def _on_down_key(self, event: Any) -> str:
+        self._treeview.move_selection(1)
+        return "break"
+
     def _show_selected_count(self, event: Any) -> None:
         # sourcery skip: use-named-expression
         selected_count_ids = self._treeview.get_selected_count_ids()
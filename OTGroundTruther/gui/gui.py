@@ -42,9 +42,7 @@ class Gui(ctk.CTk):
         self.frame_canvas.pack(
             side=ctk.LEFT, fill=ctk.BOTH, expand=True, padx=PADX, pady=PADY
         )
-        self.frame_treeview.pack(
-            side=ctk.RIGHT, fill=ctk.BOTH, expand=True, padx=PADX, pady=PADY
-        )
+        self.frame_treeview.pack(side=ctk.RIGHT, fill=ctk.Y, padx=PADX, pady=PADY)
 
     def build_key_assignment_window(self, key_assignment_text: dict[str, str]):
         self.key_assigment_window = KeyAssignmentWindow(
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from OTGroundTruther.model.count import CountRepository
+
 
 class PresenterInterface(ABC):
     @abstractmethod
@@ -32,6 +34,18 @@ class PresenterInterface(ABC):
     def try_add_event(self, x: int, y: int) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def resize_canvas(self, width: int, height: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def zoom(self, factor: float, x: int, y: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def pan(self, delta_x: int, delta_y: int) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def set_road_user_class_for_active_count(self, key: str) -> None:
         raise NotImplementedError
@@ -48,6 +62,22 @@ class PresenterInterface(ABC):
     def jump_by_delta_time_in_sec(self, delta_of_time: float) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def toggle_playback(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def switch_playback_speed(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def refresh_timeline(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def jump_to_timeline_position(self, relative_position: float) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def refresh_treeview(self) -> None:
         raise NotImplementedError
@@ -65,7 +95,11 @@ class PresenterInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_selected_classes_from_gui(self) -> list[str]:
+    def get_count_repository(self) -> CountRepository:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_selected_classes_from_gui(self) -> frozenset[str]:
         raise NotImplementedError
 
     @abstractmethod
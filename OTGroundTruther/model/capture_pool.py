@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+
+class CapturePool:
+    """Limits the number of open video captures of all videos.
+
+    Captures are registered when they are used and the least recently used
+    captures are closed once there are more than allowed. Videos reopen closed
+    captures on their own when they need them again.
+
+    Args:
+        max_open_captures (int): maximum number of captures kept open
+    """
+
+    def __init__(self, max_open_captures: int) -> None:
+        self._max_open_captures = max(max_open_captures, 1)
+        self._open_captures: OrderedDict[Path, Callable[[], None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mark_used(self, video_file: Path, close: Callable[[], None]) -> None:
+        """Register the capture of a video as most recently used.
+
+        Args:
+            video_file (Path): the video the capture belongs to
+            close (Callable[[], None]): closes the capture
+        """
+        with self._lock:
+            self._open_captures[video_file] = close
+            self._open_captures.move_to_end(video_file)
+            to_close = []
+            while len(self._open_captures) > self._max_open_captures:
+                _, close_least_recently_used = self._open_captures.popitem(last=False)
+                to_close.append(close_least_recently_used)
+        for close_capture in to_close:
+            close_capture()
+
+    def close_all(self) -> None:
+        with self._lock:
+            to_close = list(self._open_captures.values())
+            self._open_captures.clear()
+        for close_capture in to_close:
+            close_capture()
@@ -0,0 +1,119 @@
+import atexit
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class CoalescingWorker(Generic[T]):
+    """Runs jobs one after another in a background thread, skipping outdated ones.
+
+    A job requested while another one is running replaces the job waiting, so
+    that after the running job only the job requested last is run. The result of
+    the job finished last is kept until it is taken, older results are dropped.
+    Jobs are requested and results taken from one thread, e.g. the GUI thread.
+    Cancelling does not wait for the running job, its result is dropped when it
+    finishes.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending_job: Callable[[], T] | None = None
+        self._running_generation: int | None = None
+        self._result: T | None = None
+        self._error: Exception | None = None
+        self._generation: int = 0
+        self._thread: threading.Thread | None = None
+        self._stopped: bool = False
+        atexit.register(self.stop)
+
+    def request(self, job: Callable[[], T]) -> None:
+        """Run a job after the running one, replacing the job waiting.
+
+        Args:
+            job (Callable[[], T]): the job to run
+        """
+        with self._condition:
+            self._pending_job = job
+            self._condition.notify()
+        self._start()
+
+    def take_result(self) -> T | None:
+        """Take the result of the job finished last.
+
+        Raises:
+            Exception: the error raised by the job finished last
+
+        Returns:
+            T | None: the result or None if there is no new result
+        """
+        with self._condition:
+            result, error = self._result, self._error
+            self._result, self._error = None, None
+        if error is not None:
+            raise error
+        return result
+
+    def is_busy(self) -> bool:
+        """Whether a job is waiting or running or a result was not taken yet.
+
+        A cancelled job still running does not count.
+
+        Returns:
+            bool: True if the worker is busy
+        """
+        with self._condition:
+            return (
+                self._pending_job is not None
+                or self._running_generation == self._generation
+                or self._result is not None
+                or self._error is not None
+            )
+
+    def cancel(self) -> None:
+        """Drop the job waiting, the result of the running job and the result not
+        taken yet."""
+        with self._condition:
+            self._pending_job = None
+            self._generation += 1
+            self._result, self._error = None, None
+
+    def stop(self) -> None:
+        """Cancel the jobs and end the background thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self.cancel()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending_job is None and not self._stopped:
+                    self._condition.wait()
+                job = self._pending_job
+                if self._stopped or job is None:
+                    return
+                self._pending_job = None
+                generation = self._generation
+                self._running_generation = generation
+            result: T | None = None
+            error: Exception | None = None
+            try:
+                result = job()
+            except Exception as cause:
+                error = cause
+            with self._condition:
+                self._running_generation = None
+                if generation == self._generation:
+                    self._result, self._error = result, error
+                self._condition.notify_all()
@@ -1,3 +1,4 @@
+import os
 import platform
 from pathlib import Path
 
@@ -6,6 +7,31 @@ GROUND_TRUTH_EVENTS_FILE_SUFFIX: str = ".otgtevents"
 OTANALYTICS_FILE_SUFFIX: str = ".otflow"
 DEFAULT_VIDEO_FILE_SUFFIX: str = ".mp4"
 DEFAULT_DETECTION_FILE_SUFFIX: str = ".otdet"
+KEYFRAME_INDEX_FILE_SUFFIX: str = ".otkeyframes"
+VIDEO_METADATA_FILE_SUFFIX: str = ".otvideometa"
+THUMBNAIL_TIMELINE_FILE_SUFFIX: str = ".otthumbnails"
+FRAME_TIMESTAMPS_FILE_SUFFIX: str = ".otframetimes"
+
+DEFAULT_READ_AHEAD_FRAMES: int = 10
+"""Number of frames decoded ahead in the background, 0 disables the read ahead."""
+
+DEFAULT_FRAME_CACHE_SIZE_IN_MB: int = 512
+"""Memory budget of the decoded frames shared by all videos, 0 disables the cache."""
+
+DEFAULT_MAX_OPEN_VIDEOS: int = 4
+"""Maximum number of videos kept open at the same time."""
+
+DEFAULT_DECODER_BACKEND: str = "opencv"
+"""Library used to decode the videos."""
+
+DEFAULT_DECODER_THREADS: int = 0
+"""Number of threads decoding a video, 0 lets the decoder decide."""
+
+DEFAULT_RECORD_FRAME_TIMESTAMPS: bool = False
+"""Whether to record the timestamp of every frame for variable frame rate videos."""
+
+DEFAULT_PRINT_FRAME_CACHE_STATISTICS: bool = False
+"""Whether to print the hits and misses of the frame cache on exit."""
 
 LOG_DIR = Path(".logs").absolute()
 """The log save directory."""
@@ -24,3 +50,18 @@ ON_MAC: bool = OS == "Darwin"
 
 if not (ON_LINUX or ON_WINDOWS or ON_MAC):
     raise RuntimeError("OTAnalytics is running on an unknown platform")
+
+
+def _get_user_cache_dir() -> Path:
+    if ON_WINDOWS:
+        return Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    if ON_MAC:
+        return Path.home() / "Library" / "Caches"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+
+THUMBNAIL_CACHE_DIR = _get_user_cache_dir() / "OTGroundTruther" / "thumbnails"
+"""The directory of the thumbnail timelines of previous sessions."""
+
+THUMBNAIL_CACHE_MAX_AGE_IN_DAYS: int = 30
+"""Days after which the thumbnail timeline of a session not opened is deleted."""
@@ -1,14 +1,18 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
+from heapq import merge
 from typing import Iterable, Optional
 
 import cv2
 import numpy as np
-from PIL import Image
 
 from OTGroundTruther.model.coordinate import Coordinate
 from OTGroundTruther.model.event import Event, EventForParsingSerializing
+from OTGroundTruther.model.overlay_layer import ANTI_ALIASING_MARGIN, Region
 from OTGroundTruther.model.road_user_class import RoadUserClass
 from OTGroundTruther.model.video import BackgroundFrame
+from OTGroundTruther.model.viewport import Viewport
 
 ACTIVE_COUNT_ID: str = "active-count-id"
 
@@ -177,10 +181,204 @@ class ActiveCount:
         return self._road_user_class
 
 
+class CountIndex:
+    """Finds counts by time and by the frames of their events.
+
+    For time queries the counts are sorted by the timestamp of their first event.
+    A query looks at the counts starting between the longest duration of all
+    counts before the queried window and its end, and keeps those ending within
+    or after the window.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[tuple[float, int, str]] = []
+        self._durations: list[float] = []
+        self._entries: dict[str, tuple[float, float, int]] = {}
+        self._ids_by_frame: dict[tuple[str, int], set[str]] = {}
+        self._frames: dict[str, list[tuple[str, int]]] = {}
+        self._next_position: int = 0
+
+    def add(self, count: Count) -> None:
+        """Add a count or update it if it is already indexed.
+
+        Args:
+            count (Count): the count to index
+        """
+        self.remove(count.get_road_user_id())
+        start, duration = self._add(count)
+        insort(self._starts, start)
+        insort(self._durations, duration)
+
+    def add_all(self, counts: Iterable[Count]) -> None:
+        """Add several counts or update them, sorting the index once.
+
+        Args:
+            counts (Iterable[Count]): the counts to index
+        """
+        counts_by_id = {count.get_road_user_id(): count for count in counts}
+        for id in counts_by_id:
+            self.remove(id)
+        for count in counts_by_id.values():
+            start, duration = self._add(count)
+            self._starts.append(start)
+            self._durations.append(duration)
+        self._starts.sort()
+        self._durations.sort()
+
+    def _add(self, count: Count) -> tuple[tuple[float, int, str], float]:
+        id = count.get_road_user_id()
+        timestamps = [event.get_timestamp() for event in count.get_events()]
+        start, end = min(timestamps), max(timestamps)
+        position = self._next_position
+        self._next_position += 1
+        self._entries[id] = (start, end, position)
+        frames = [
+            (event.get_video_file_name(), event.get_frame_number())
+            for event in count.get_events()
+        ]
+        for frame in frames:
+            self._ids_by_frame.setdefault(frame, set()).add(id)
+        self._frames[id] = frames
+        return (start, position, id), end - start
+
+    def remove(self, id: str) -> None:
+        entry = self._entries.pop(id, None)
+        if entry is None:
+            return
+        start, end, position = entry
+        del self._starts[bisect_left(self._starts, (start, position, id))]
+        del self._durations[bisect_left(self._durations, end - start)]
+        for frame in self._frames.pop(id):
+            ids = self._ids_by_frame[frame]
+            ids.discard(id)
+            if not ids:
+                del self._ids_by_frame[frame]
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._durations.clear()
+        self._entries.clear()
+        self._ids_by_frame.clear()
+        self._frames.clear()
+        self._next_position = 0
+
+    def get_overlapping(self, start: float, end: float) -> set[str]:
+        """Get the counts whose time span overlaps a time window.
+
+        Args:
+            start (float): start of the window as unix timestamp
+            end (float): end of the window as unix timestamp
+
+        Returns:
+            set[str]: ids of the counts
+        """
+        if not self._starts:
+            return set()
+        first = bisect_left(self._starts, (start - self._durations[-1],))
+        last = bisect_right(self._starts, (end, self._next_position))
+        return {
+            id for _, _, id in self._starts[first:last] if self._entries[id][1] >= start
+        }
+
+    def get_at_frame(self, video_file_name: str, frame_number: int) -> set[str]:
+        """Get the counts with an event at a frame.
+
+        Args:
+            video_file_name (str): name of the video
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            set[str]: ids of the counts
+        """
+        return set(self._ids_by_frame.get((video_file_name, frame_number), ()))
+
+    def sort(self, ids: Iterable[str]) -> list[str]:
+        """Sort counts in the order they were indexed.
+
+        Args:
+            ids (Iterable[str]): ids of indexed counts
+
+        Returns:
+            list[str]: the sorted ids
+        """
+        return sorted(ids, key=lambda id: self._entries[id][2])
+
+
+class CountOrderings:
+    """Counts of each road user class sorted by each property shown in the list.
+
+    An ordering holds the value of the property and the id of each count of a
+    class, so that counts with equal values are ordered by their ids. It is
+    sorted when it is requested first and then kept sorted while counts are added
+    and removed.
+    """
+
+    def __init__(self) -> None:
+        self._orderings: dict[str, dict[str, list[tuple[str | float, str]]]] = {}
+
+    def get(
+        self,
+        column: str,
+        classes: Iterable[str],
+        ids_by_class: dict[str, dict[str, None]],
+        properties: dict[str, dict[str, str | float]],
+    ) -> list[tuple[str | float, str]]:
+        """Get the counts of road user classes sorted by a property.
+
+        Args:
+            column (str): name of the property
+            classes (Iterable[str]): names of the road user classes
+            ids_by_class (dict[str, dict[str, None]]): ids of the counts of each
+                class
+            properties (dict[str, dict[str, str | float]]): the properties of all
+                counts by id
+
+        Returns:
+            list[tuple[str | float, str]]: value and id of the counts in ascending
+                order
+        """
+        orderings_by_class = self._orderings.setdefault(column, {})
+        orderings: list[list[tuple[str | float, str]]] = []
+        for class_name in classes:
+            ordering = orderings_by_class.get(class_name)
+            if ordering is None:
+                ordering = sorted(
+                    (properties[id][column], id)
+                    for id in ids_by_class.get(class_name, ())
+                )
+                orderings_by_class[class_name] = ordering
+            if ordering:
+                orderings.append(ordering)
+        if len(orderings) == 1:
+            return list(orderings[0])
+        return list(merge(*orderings))
+
+    def add(self, id: str, values: dict[str, str | float]) -> None:
+        class_name = str(values[COUNT_CLASS_NAME])
+        for column, orderings_by_class in self._orderings.items():
+            ordering = orderings_by_class.get(class_name)
+            if ordering is not None:
+                insort(ordering, (values[column], id))
+
+    def remove(self, id: str, values: dict[str, str | float]) -> None:
+        class_name = str(values[COUNT_CLASS_NAME])
+        for column, orderings_by_class in self._orderings.items():
+            ordering = orderings_by_class.get(class_name)
+            if ordering is not None:
+                del ordering[bisect_left(ordering, (values[column], id))]
+
+    def clear(self) -> None:
+        self._orderings.clear()
+
+
 class CountRepository:
     def __init__(self) -> None:
         self._counts: dict[str, Count] = {}
         self._current_id: int = 0
+        self._index = CountIndex()
+        self._properties: dict[str, dict[str, str | float]] = {}
+        self._ids_by_class: dict[str, dict[str, None]] = {}
+        self._orderings = CountOrderings()
 
     def add_all(self, counts: Iterable[Count]) -> None:
         """Add several counts at once to the repository.
@@ -188,8 +386,10 @@ class CountRepository:
         Args:
             counts (Iterable[Count]): the counts to add
         """
+        counts = list(counts)
         for count in counts:
-            self.add(count)
+            self._add(count)
+        self._index.add_all(counts)
 
     def add(self, count: Count) -> None:
         """Add a single count.
@@ -197,7 +397,26 @@ class CountRepository:
         Args:
             count (Count): the count to be added
         """
+        self._add(count)
+        self._index.add(count)
+
+    def _add(self, count: Count) -> None:
+        if count.road_user_id in self._properties:
+            self._remove_from_class(count.road_user_id)
         self._counts[count.road_user_id] = count
+        self._properties[count.road_user_id] = count.get_properties_to_show_as_dict()
+        self._ids_by_class.setdefault(count.get_road_user_class().get_name(), {})[
+            count.road_user_id
+        ] = None
+        self._orderings.add(count.road_user_id, self._properties[count.road_user_id])
+
+    def _remove_from_class(self, id: str) -> None:
+        properties = self._properties.pop(id)
+        class_ids = self._ids_by_class[str(properties[COUNT_CLASS_NAME])]
+        del class_ids[id]
+        if not class_ids:
+            del self._ids_by_class[str(properties[COUNT_CLASS_NAME])]
+        self._orderings.remove(id, properties)
 
     def get_all_as_list(self) -> list[Count]:
         """Get all counts from the repository.
@@ -221,6 +440,68 @@ class CountRepository:
         """
         return self._counts.get(id)
 
+    def get_properties_to_show(self, id: str) -> dict[str, str | float]:
+        """Get the properties of a count shown in the count list.
+
+        The properties are determined once when the count is added.
+
+        Args:
+            id (str): id of the count
+
+        Returns:
+            dict[str, str | float]: the properties by column name
+        """
+        return self._properties[id]
+
+    def get_sorted_by(
+        self, column: str, classes: Iterable[str]
+    ) -> list[tuple[str | float, str]]:
+        """Get the counts of road user classes sorted by a property shown in the
+        count list.
+
+        The counts are kept per class, so the time taken depends on the number of
+        counts of the classes only.
+
+        Args:
+            column (str): name of the property
+            classes (Iterable[str]): names of the road user classes
+
+        Returns:
+            list[tuple[str | float, str]]: value and id of the counts in ascending
+                order
+        """
+        return self._orderings.get(
+            column=column,
+            classes=classes,
+            ids_by_class=self._ids_by_class,
+            properties=self._properties,
+        )
+
+    def get_to_show_at(
+        self, unix_timestamp: float, video_file_name: str, frame_number: int
+    ) -> list[Count]:
+        """Get the counts that may have events to show at a frame.
+
+        These are the counts overlapping the time window around the frame and the
+        counts with an event at the frame.
+
+        Args:
+            unix_timestamp (float): timestamp of the frame
+            video_file_name (str): name of the video of the frame
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            list[Count]: the counts in the order they were added
+        """
+        ids = self._index.get_overlapping(
+            start=unix_timestamp - TIME_WINDOW_SHOW_COUNT / 2,
+            end=unix_timestamp + TIME_WINDOW_SHOW_COUNT / 2,
+        )
+        ids |= self._index.get_at_frame(
+            video_file_name=video_file_name, frame_number=frame_number
+        )
+        return [self._counts[id] for id in self._index.sort(ids)]
+
     def get_by_frame_of_events(self, frame: int) -> list[Count]:
         filtered_counts: list[Count] = []
         for count in self._counts.values():
@@ -242,6 +523,8 @@ class CountRepository:
             )
         )
         del self._counts[id]
+        self._index.remove(id)
+        self._remove_from_class(id)
 
     def set_current_id(self, id: str | int):
         """set current id
@@ -272,6 +555,10 @@ class CountRepository:
         Clear the repository.
         """
         self._counts.clear()
+        self._index.clear()
+        self._properties.clear()
+        self._ids_by_class.clear()
+        self._orderings.clear()
 
     def to_event_list(self) -> list[EventForParsingSerializing]:
         """
@@ -299,15 +586,19 @@ class CountRepository:
         events, classes = self._get_events_and_classes_by_id(event_list)
 
         self.clear()
+        counts: list[Count] = []
         for id_ in events.keys():
             if len(events[id_]) >= 2:
-                self._counts[id_] = Count(
-                    road_user_id=id_,
-                    events=events[id_],
-                    road_user_class=classes[id_],
+                counts.append(
+                    Count(
+                        road_user_id=id_,
+                        events=events[id_],
+                        road_user_class=classes[id_],
+                    )
                 )
             else:
                 continue  # TODO: Store in "SingleEventRepository"
+        self.add_all(counts)
         if len(self._counts.keys()) > 0:
             self.set_current_id(list(self._counts.keys())[-1])
 
@@ -342,33 +633,195 @@ class CountRepository:
 
 
 @dataclass
-class CountsOverlay:
-    count_repository: CountRepository
-    active_count: ActiveCount | None
-    selected_count_ids: list[str]
+class CountLayer(ABC):
+    """An overlay layer with counts drawn on it.
+
+    Args:
+        background_frame (BackgroundFrame): the frame the layer is shown on
+    """
+
     background_frame: BackgroundFrame
-    selected_classes: list[str]
+    viewport: Viewport = field(init=False)
     image_array: np.ndarray = field(init=False)
-    image: Image.Image = field(init=False)
+    regions: list[Region] = field(init=False)
 
     def __post_init__(self) -> None:
         self._get_image()
 
-    def get(self) -> Image.Image:
-        return self.image
+    def get_array(self) -> np.ndarray:
+        return self.image_array
+
+    def get_regions(self) -> list[Region]:
+        return self.regions
 
-    def _get_image(self) -> Image.Image:
+    def _get_image(self) -> None:
+        self.viewport = self.background_frame.get_image_viewport()
         self.image_array = np.zeros(
-            (self.background_frame.get_height(), self.background_frame.get_width(), 4),
+            (self.viewport.get_height(), self.viewport.get_width(), 4),
             dtype=np.uint8,
         )
+        self.regions = []
+        self._draw()
+
+    @abstractmethod
+    def _draw(self) -> None:
+        raise NotImplementedError
+
+    def _draw_circle(
+        self,
+        center: list[int],
+        radius: int,
+        color: tuple[int, int, int, int],
+        thickness: int,
+    ) -> None:
+        cv2.circle(
+            img=self.image_array,
+            center=center,
+            radius=radius,
+            color=color,
+            thickness=thickness,
+            lineType=COUNT_LINETYPE,
+        )
+        self.regions.append(
+            Region.around(
+                [(center[0], center[1])],
+                margin=radius + max(thickness, 0) + ANTI_ALIASING_MARGIN,
+            )
+        )
+
+    def _to_image(self, coordinate: Coordinate) -> Coordinate:
+        return self.viewport.to_image(coordinate)
+
+    def _draw_movement_single_count(
+        self,
+        events: list[Event],
+        road_user_class: RoadUserClass | None,
+        color: tuple[int, int, int, int],
+        color_contour: tuple[int, int, int, int],
+        thickness_contour: int,
+    ) -> None:
+        for event, next_event in zip(events[:-1], events[1:]):
+            p0 = self._to_image(event.get_coordinate())
+            p1 = self._to_image(next_event.get_coordinate())
+            self._draw_arrow_with_contour(
+                p0=p0,
+                p1=p1,
+                color=color,
+                color_contour=color_contour,
+                thickness_contour=thickness_contour,
+            )
+            self._draw_class_text_next_to_arrow(
+                p0=p0, p1=p1, road_user_class=road_user_class, color=color
+            )
+
+    def _draw_class_text_next_to_arrow(
+        self,
+        p0: Coordinate,
+        p1: Coordinate,
+        road_user_class: RoadUserClass | None,
+        color: tuple[int, int, int, int],
+    ) -> None:
+        if road_user_class is None:
+            text = PLACEHOLDER_ROAD_USER_CLASS
+        else:
+            text = road_user_class.get_short_label()
+        x, y = self._get_text_position(p0, p1)
+        cv2.putText(
+            img=self.image_array,
+            text=text,
+            org=(x, y),
+            fontFace=COUNT_TEXT_FONT,
+            fontScale=COUNT_TEXT_FONTSCALE,
+            color=color,
+            thickness=COUNT_TEXT_THICKNESS,
+            lineType=COUNT_LINETYPE,
+            bottomLeftOrigin=False,
+        )
+        (width, height), baseline = cv2.getTextSize(
+            text=text,
+            fontFace=COUNT_TEXT_FONT,
+            fontScale=COUNT_TEXT_FONTSCALE,
+            thickness=COUNT_TEXT_THICKNESS,
+        )
+        self.regions.append(
+            Region.around(
+                [(x, y - height), (x + width, y + baseline)],
+                margin=COUNT_TEXT_THICKNESS + ANTI_ALIASING_MARGIN,
+            )
+        )
+
+    def _draw_arrow_with_contour(
+        self,
+        p0: Coordinate,
+        p1: Coordinate,
+        color: tuple[int, int, int, int],
+        color_contour: tuple[int, int, int, int],
+        thickness_contour: int,
+    ) -> None:
+        tiplength = self._tiplength_for_same_arrow_size(p0, p1, ARROW_CONTOUR_SIZE)
+        cv2.arrowedLine(
+            img=self.image_array,
+            pt1=p0.as_list(),
+            pt2=p1.as_list(),
+            color=color_contour,
+            thickness=thickness_contour,
+            line_type=COUNT_LINETYPE,
+            tipLength=tiplength,
+        )
+        tiplength = self._tiplength_for_same_arrow_size(
+            p0,
+            p1,
+            ARROW_CONTOUR_SIZE - (thickness_contour - COUNT_LINE_THICKNESS),
+        )
+        cv2.arrowedLine(
+            img=self.image_array,
+            pt1=p0.as_list(),
+            pt2=p1.as_list(),
+            color=color,
+            thickness=COUNT_LINE_THICKNESS,
+            line_type=COUNT_LINETYPE,
+            tipLength=tiplength,
+        )
+        self.regions.append(
+            Region.around(
+                [p0.as_tuple(), p1.as_tuple()],
+                margin=ARROW_CONTOUR_SIZE + thickness_contour + ANTI_ALIASING_MARGIN,
+            )
+        )
+
+    def _tiplength_for_same_arrow_size(
+        self, p0: Coordinate, p1: Coordinate, size: int = 20
+    ) -> float:
+        length = (
+            (p0.get_x() - p1.get_x()) ** 2 + (p0.get_y() - p1.get_y()) ** 2
+        ) ** 0.5
+        return 1 if length < size or length == 0 else size / length
+
+    def _get_text_position(self, p0: Coordinate, p1: Coordinate) -> tuple[int, int]:
+        return (
+            int((p0.get_x() + p1.get_x()) / 2),
+            int((p0.get_y() + p1.get_y()) / 2),
+        )
+
+
+@dataclass
+class CountsOverlay(CountLayer):
+    """The finished counts around the time of a frame and the selected counts."""
+
+    count_repository: CountRepository
+    selected_count_ids: list[str]
+    selected_classes: frozenset[str]
+
+    def _draw(self) -> None:
         self._draw_finished_counts()
         self._draw_selected_counts()
-        self._draw_active_count()
-        self.image = Image.fromarray(self.image_array)
 
     def _draw_finished_counts(self) -> None:
-        for count in self.count_repository.get_all_as_list():
+        for count in self.count_repository.get_to_show_at(
+            unix_timestamp=self.background_frame.get_unix_timestamp(),
+            video_file_name=self.background_frame.get_video_name(),
+            frame_number=self.background_frame.get_frame_number(),
+        ):
             if count.get_road_user_id() in self.selected_count_ids:
                 continue
             events_to_draw = self._get_events_of_count_to_draw(count)
@@ -428,31 +881,25 @@ class CountsOverlay:
             self._draw_event_circle_with_contour(event)
 
     def _draw_simple_event_circle(self, event: Event) -> None:
-        cv2.circle(
-            img=self.image_array,
-            center=event.get_coordinate().as_list(),
+        self._draw_circle(
+            center=self._to_image(event.get_coordinate()).as_list(),
             radius=COUNT_EVENTPOINT_RADIUS,
             color=COUNT_EVENTPOINT_COLOR,
             thickness=COUNT_EVENTPOINT_THICKNESS,
-            lineType=COUNT_LINETYPE,
         )
 
     def _draw_event_circle_with_contour(self, event) -> None:
-        cv2.circle(
-            img=self.image_array,
-            center=event.get_coordinate().as_list(),
+        self._draw_circle(
+            center=self._to_image(event.get_coordinate()).as_list(),
             radius=EVENTPOINT_MOMENT_BG_RADIUS,
             color=EVENTPOINT_MOMENT_BG_COLOR,
             thickness=EVENTPOINT_MOMENT_BG_THICKNESS,
-            lineType=COUNT_LINETYPE,
         )
-        cv2.circle(
-            img=self.image_array,
-            center=event.get_coordinate().as_list(),
+        self._draw_circle(
+            center=self._to_image(event.get_coordinate()).as_list(),
             radius=EVENTPOINT_MOMENT_RADIUS,
             color=EVENTPOINT_MOMENT_COLOR,
             thickness=EVENTPOINT_MOMENT_THICKNESS,
-            lineType=COUNT_LINETYPE,
         )
 
     def _is_at_current_frame(self, event: Event) -> bool:
@@ -467,85 +914,14 @@ class CountsOverlay:
             <= self.background_frame.get_unix_timestamp() + time_window / 2
         )
 
-    def _draw_movement_single_count(
-        self,
-        events: list[Event],
-        road_user_class: RoadUserClass | None,
-        color: tuple[int, int, int, int],
-        color_contour: tuple[int, int, int, int],
-        thickness_contour: int,
-    ) -> None:
-        for event, next_event in zip(events[:-1], events[1:]):
-            p0 = event.get_coordinate()
-            p1 = next_event.get_coordinate()
-            self._draw_arrow_with_contour(
-                p0=p0,
-                p1=p1,
-                color=color,
-                color_contour=color_contour,
-                thickness_contour=thickness_contour,
-            )
-            self._draw_class_text_next_to_arrow(
-                p0=p0, p1=p1, road_user_class=road_user_class, color=color
-            )
 
-    def _draw_class_text_next_to_arrow(
-        self,
-        p0: Coordinate,
-        p1: Coordinate,
-        road_user_class: RoadUserClass | None,
-        color: tuple[int, int, int, int],
-    ) -> None:
-        if road_user_class is None:
-            text = PLACEHOLDER_ROAD_USER_CLASS
-        else:
-            text = road_user_class.get_short_label()
-        cv2.putText(
-            img=self.image_array,
-            text=text,
-            org=self._get_text_position(p0, p1),
-            fontFace=COUNT_TEXT_FONT,
-            fontScale=COUNT_TEXT_FONTSCALE,
-            color=color,
-            thickness=COUNT_TEXT_THICKNESS,
-            lineType=COUNT_LINETYPE,
-            bottomLeftOrigin=False,
-        )
+@dataclass
+class ActiveCountOverlay(CountLayer):
+    """The count currently being created."""
 
-    def _draw_arrow_with_contour(
-        self,
-        p0: Coordinate,
-        p1: Coordinate,
-        color: tuple[int, int, int, int],
-        color_contour: tuple[int, int, int, int],
-        thickness_contour: int,
-    ) -> None:
-        tiplength = self._tiplength_for_same_arrow_size(p0, p1, ARROW_CONTOUR_SIZE)
-        cv2.arrowedLine(
-            img=self.image_array,
-            pt1=p0.as_list(),
-            pt2=p1.as_list(),
-            color=color_contour,
-            thickness=thickness_contour,
-            line_type=COUNT_LINETYPE,
-            tipLength=tiplength,
-        )
-        tiplength = self._tiplength_for_same_arrow_size(
-            p0,
-            p1,
-            ARROW_CONTOUR_SIZE - (thickness_contour - COUNT_LINE_THICKNESS),
-        )
-        cv2.arrowedLine(
-            img=self.image_array,
-            pt1=p0.as_list(),
-            pt2=p1.as_list(),
-            color=color,
-            thickness=COUNT_LINE_THICKNESS,
-            line_type=COUNT_LINETYPE,
-            tipLength=tiplength,
-        )
+    active_count: ActiveCount | None
 
-    def _draw_active_count(self) -> None:
+    def _draw(self) -> None:
         if self.active_count is None:
             return
         if len(self.active_count.get_events()) >= 2:
@@ -555,21 +931,17 @@ class CountsOverlay:
                 self.draw_active_count_only_one_event(event)
 
     def draw_active_count_only_one_event(self, event: Event) -> None:
-        cv2.circle(
-            img=self.image_array,
-            center=event.get_coordinate().as_list(),
+        self._draw_circle(
+            center=self._to_image(event.get_coordinate()).as_list(),
             radius=ACTIVE_COUNT_EVENTPOINT_BG_RADIUS,
             color=ACTIVE_COUNT_EVENTPOINT_BG_COLOR,
             thickness=ACTIVE_COUNT_EVENTPOINT_BG_THICKNESS,
-            lineType=COUNT_LINETYPE,
         )
-        cv2.circle(
-            img=self.image_array,
-            center=event.get_coordinate().as_list(),
+        self._draw_circle(
+            center=self._to_image(event.get_coordinate()).as_list(),
             radius=ACTIVE_COUNT_EVENTPOINT_RADIUS,
             color=ACTIVE_COUNT_EVENTPOINT_COLOR,
             thickness=ACTIVE_COUNT_EVENTPOINT_THICKNESS,
-            lineType=COUNT_LINETYPE,
         )
 
     def _draw_active_count_multiple_events(self) -> None:
@@ -587,17 +959,3 @@ class CountsOverlay:
                 color_contour=ACTIVE_COUNT_CONTOUR_COLOR,
                 thickness_contour=ACTIVE_COUNT_CONTOUR_THICKNESS,
             )
-
-    def _tiplength_for_same_arrow_size(
-        self, p0: Coordinate, p1: Coordinate, size: int = 20
-    ) -> float:
-        length = (
-            (p0.get_x() - p1.get_x()) ** 2 + (p0.get_y() - p1.get_y()) ** 2
-        ) ** 0.5
-        return 1 if length < size or length == 0 else size / length
-
-    def _get_text_position(self, p0: Coordinate, p1: Coordinate) -> tuple[int, int]:
-        return (
-            int((p0.get_x() + p1.get_x()) / 2),
-            int((p0.get_y() + p1.get_y()) / 2),
-        )
@@ -0,0 +1,116 @@
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from OTGroundTruther.model.count import COUNT_ENTER_TIME_NAME, Count, CountRepository
+
+
+class CountTable:
+    """The rows of the count list in the order they are shown.
+
+    Rows are the value of the sort column and the id of the listed counts in
+    ascending order, taken from the orderings the count repository keeps sorted
+    per road user class.
+    Their values are the properties cached by the count repository. A list
+    widget reads the rows in view by index instead of holding an item per count.
+    """
+
+    def __init__(self, count_repository: CountRepository) -> None:
+        self._count_repository = count_repository
+        self._rows: list[tuple[str | float, str]] = []
+        self._sort_column: str = COUNT_ENTER_TIME_NAME
+        self._descending: bool = False
+        self._classes: frozenset[str] = frozenset()
+
+    def refresh(self, selected_classes: Iterable[str]) -> None:
+        """List the counts of the selected classes.
+
+        Args:
+            selected_classes (Iterable[str]): names of the classes to list
+        """
+        self._classes = frozenset(selected_classes)
+        self._rows = self._count_repository.get_sorted_by(
+            self._sort_column, self._classes
+        )
+
+    def add(self, count: Count) -> None:
+        """List a count of the repository at its place in the order.
+
+        Args:
+            count (Count): the count
+        """
+        id = count.get_road_user_id()
+        properties = self._count_repository.get_properties_to_show(id)
+        insort(self._rows, (properties[self._sort_column], id))
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Stop listing counts.
+
+        Args:
+            ids (Iterable[str]): ids of the counts
+        """
+        to_remove = set(ids)
+        self._rows = [row for row in self._rows if row[1] not in to_remove]
+
+    def sort(self, column: str, descending: bool) -> None:
+        """Order the rows by the values of a column.
+
+        Rows with equal values are ordered by their ids.
+
+        Args:
+            column (str): name of the column
+            descending (bool): whether to start with the largest value
+        """
+        self._descending = descending
+        if column != self._sort_column:
+            self._sort_column = column
+            self._rows = self._count_repository.get_sorted_by(column, self._classes)
+
+    def get_number_of_rows(self) -> int:
+        return len(self._rows)
+
+    def get_ids(self, start: int, end: int) -> list[str]:
+        """Get the ids of a range of rows.
+
+        Args:
+            start (int): index of the first row
+            end (int): index after the last row
+
+        Returns:
+            list[str]: the ids of the counts
+        """
+        start, end = max(start, 0), min(end, len(self._rows))
+        if self._descending:
+            rows = self._rows[len(self._rows) - end : len(self._rows) - start][::-1]
+        else:
+            rows = self._rows[start:end]
+        return [id for _, id in rows]
+
+    def get_values(self, id: str, columns: Iterable[str]) -> list[str | float]:
+        """Get the values of a row.
+
+        Args:
+            id (str): id of the count
+            columns (Iterable[str]): names of the columns in the order to return
+
+        Returns:
+            list[str | float]: the values
+        """
+        properties = self._count_repository.get_properties_to_show(id)
+        return [properties[column] for column in columns]
+
+    def get_index(self, id: str) -> int | None:
+        """Get the index of a row.
+
+        Args:
+            id (str): id of the count
+
+        Returns:
+            int | None: the index or None if the count is not listed
+        """
+        if self._count_repository.get(id) is None:
+            return None
+        row = (self._count_repository.get_properties_to_show(id)[self._sort_column], id)
+        index = bisect_left(self._rows, row)
+        if index == len(self._rows) or self._rows[index] != row:
+            return None
+        return len(self._rows) - 1 - index if self._descending else index
@@ -0,0 +1,387 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import cv2
+import numpy.typing as npt
+
+from OTGroundTruther.model.config import (
+    DEFAULT_DECODER_BACKEND,
+    DEFAULT_DECODER_THREADS,
+)
+
+try:
+    import av
+except ImportError:
+    av = None  # type: ignore[assignment]
+
+OPENCV: str = "opencv"
+PYAV: str = "pyav"
+PYAV_THREAD_TYPE: str = "AUTO"
+BGR_FORMAT: str = "bgr24"
+
+
+class DecoderBackendNotAvailableError(Exception):
+    pass
+
+
+def get_frame_index(frame_number: int) -> int:
+    """Get the index a decoder addresses a frame of a video by.
+
+    Frame numbers count the frames of a video from 1, frame number 0 is shown as
+    the first frame as well.
+
+    Args:
+        frame_number (int): number of the frame in the video
+
+    Returns:
+        int: zero based index of the frame
+    """
+    return max(frame_number - 1, 0)
+
+
+class VideoDecoder(ABC):
+    """Decodes the frames of a video file.
+
+    Frames are addressed by their zero based index in presentation order.
+    """
+
+    @abstractmethod
+    def get_frame_rate(self) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_frame_count(self) -> int:
+        """Get the number of frames as reported by the container.
+
+        Returns:
+            int: the number of frames, might differ from the decodable frames
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_width(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_height(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_position(self) -> int:
+        """Get the index of the frame read next.
+
+        Returns:
+            int: zero based index of the next frame
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def seek(self, frame_index: int) -> None:
+        """Move to a frame so that it is read next.
+
+        Args:
+            frame_index (int): zero based index of the frame
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self) -> npt.NDArray | None:
+        """Decode the next frame.
+
+        Returns:
+            npt.NDArray | None: the frame in BGR or None at the end of the video
+        """
+        raise NotImplementedError
+
+    def grab(self) -> bool:
+        """Skip the next frame.
+
+        Returns:
+            bool: whether there was a frame to skip
+        """
+        return self.read() is not None
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class OpenCvDecoder(VideoDecoder):
+    """Decodes videos with `cv2.VideoCapture`.
+
+    Seeking by frame number is not exact in OpenCV, it may land a frame behind
+    the requested one. The frame landed on is therefore identified by its
+    presentation time. If it lies behind the requested frame, seeking starts
+    further before it, and the frames up to the requested one are skipped.
+
+    Args:
+        file (Path): the video file
+        thread_count (int): number of decoding threads, 0 lets OpenCV decide
+
+    Raises:
+        ValueError: if the video can not be opened
+    """
+
+    def __init__(self, file: Path, thread_count: int = DEFAULT_DECODER_THREADS):
+        self._file = file
+        self._thread_count = thread_count
+        self._cap = self._open()
+        self._position: int = 0
+        self._has_grabbed_frame: bool = False
+        self._frame_duration_in_ms: float | None = None
+
+    def _open(self) -> cv2.VideoCapture:
+        if self._thread_count > 0:
+            cap = cv2.VideoCapture(
+                str(self._file),
+                cv2.CAP_ANY,
+                [cv2.CAP_PROP_N_THREADS, self._thread_count],
+            )
+        else:
+            cap = cv2.VideoCapture(str(self._file))
+        if not cap.isOpened():
+            raise ValueError(f"Konnte das Video {self._file} nicht öffnen.")
+        return cap
+
+    def get_frame_rate(self) -> float:
+        return self._cap.get(cv2.CAP_PROP_FPS)
+
+    def get_frame_count(self) -> int:
+        return int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def get_width(self) -> int:
+        return int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+
+    def get_height(self) -> int:
+        return int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def get_position(self) -> int:
+        return self._position
+
+    def seek(self, frame_index: int) -> None:
+        self._has_grabbed_frame = False
+        if frame_index > 0 and self._seek_to_or_before(frame_index):
+            return
+        # Seeking to the start is not exact for some codecs, reopening is.
+        self._cap.release()
+        self._cap = self._open()
+        self._position = 0
+        for _ in range(frame_index):
+            if not self.grab():
+                return
+
+    def _seek_to_or_before(self, frame_index: int) -> bool:
+        """Seek to a frame and grab it, so that it is retrieved by the next read.
+
+        Args:
+            frame_index (int): zero based index of the frame
+
+        Returns:
+            bool: whether the frame was reached without seeking to the start
+        """
+        distance = 0
+        while distance < frame_index:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index - distance)
+            landed_index = self._grab_and_get_index()
+            if landed_index is not None and landed_index <= frame_index:
+                while landed_index is not None and landed_index < frame_index:
+                    landed_index = self._grab_and_get_index()
+                if landed_index != frame_index:
+                    return False
+                self._position = frame_index
+                self._has_grabbed_frame = True
+                return True
+            distance = max(2 * distance, 1)
+        return False
+
+    def _grab_and_get_index(self) -> int | None:
+        if not self._cap.grab():
+            return None
+        return round(self._cap.get(cv2.CAP_PROP_POS_MSEC) / self._get_frame_duration())
+
+    def _get_frame_duration(self) -> float:
+        """Get the duration of a frame from the presentation times of the first
+        frames, the frame rate of the container can be an average.
+
+        Returns:
+            float: duration of a frame in milliseconds
+        """
+        if self._frame_duration_in_ms is None:
+            cap = self._open()
+            times = [cap.get(cv2.CAP_PROP_POS_MSEC) for _ in range(2) if cap.grab()]
+            cap.release()
+            if len(times) == 2 and times[1] > times[0]:
+                self._frame_duration_in_ms = times[1] - times[0]
+            else:
+                self._frame_duration_in_ms = 1000 / (self.get_frame_rate() or 1)
+        return self._frame_duration_in_ms
+
+    def read(self) -> npt.NDArray | None:
+        if self._has_grabbed_frame:
+            self._has_grabbed_frame = False
+            ret, frame = self._cap.retrieve()
+        else:
+            ret, frame = self._cap.read()
+        if not ret:
+            return None
+        self._position += 1
+        return frame
+
+    def grab(self) -> bool:
+        if self._has_grabbed_frame:
+            self._has_grabbed_frame = False
+        elif not self._cap.grab():
+            return False
+        self._position += 1
+        return True
+
+    def close(self) -> None:
+        self._cap.release()
+
+
+class PyAvDecoder(VideoDecoder):
+    """Decodes videos with PyAV.
+
+    Seeking jumps to the keyframe before the requested frame and decodes the
+    frames in between. Frame indexes are derived from the presentation
+    timestamps using the frame rate of the stream's timestamps, which can differ
+    from the average frame rate reported for the video.
+
+    Args:
+        file (Path): the video file
+        thread_count (int): number of decoding threads, 0 lets FFmpeg decide
+
+    Raises:
+        DecoderBackendNotAvailableError: if PyAV is not installed
+        ValueError: if the video can not be opened
+    """
+
+    def __init__(self, file: Path, thread_count: int = DEFAULT_DECODER_THREADS):
+        if av is None:
+            raise DecoderBackendNotAvailableError(
+                "The PyAV decoder requires PyAV, install it with 'pip install av'."
+            )
+        try:
+            self._container = av.open(str(file))
+            self._stream = self._container.streams.video[0]
+        except (av.FFmpegError, IndexError) as cause:
+            raise ValueError(f"Konnte das Video {file} nicht öffnen.") from cause
+        self._stream.thread_type = PYAV_THREAD_TYPE
+        self._stream.thread_count = thread_count
+        self._time_base = float(self._stream.time_base or 0)
+        self._frame_rate = float(
+            self._stream.average_rate or self._stream.guessed_rate or 0
+        )
+        self._index_rate = float(self._stream.guessed_rate or self._frame_rate)
+        self._start_pts: int = self._stream.start_time or 0
+        self._frames: Iterator[Any] = self._container.decode(self._stream)
+        self._next_frame: Any = None
+        self._position: int = 0
+
+    def get_frame_rate(self) -> float:
+        return self._frame_rate
+
+    def get_frame_count(self) -> int:
+        if self._stream.frames:
+            return self._stream.frames
+        if self._stream.duration is None:
+            return 0
+        return round(self._stream.duration * self._time_base * self._frame_rate)
+
+    def get_width(self) -> int:
+        return self._stream.codec_context.width
+
+    def get_height(self) -> int:
+        return self._stream.codec_context.height
+
+    def get_position(self) -> int:
+        return self._position
+
+    def seek(self, frame_index: int) -> None:
+        if frame_index == self._position:
+            return
+        target_pts = self._start_pts + round(
+            frame_index / self._index_rate / self._time_base
+        )
+        self._container.seek(
+            target_pts, stream=self._stream, backward=True, any_frame=False
+        )
+        self._frames = self._container.decode(self._stream)
+        self._next_frame = None
+        self._position = frame_index
+        for frame in self._frames:
+            if self._get_index(frame) >= frame_index:
+                self._next_frame = frame
+                return
+
+    def read(self) -> npt.NDArray | None:
+        frame = self._decode_next()
+        if frame is None:
+            return None
+        return frame.to_ndarray(format=BGR_FORMAT)
+
+    def grab(self) -> bool:
+        return self._decode_next() is not None
+
+    def _decode_next(self) -> Any:
+        frame = self._next_frame
+        self._next_frame = None
+        if frame is None:
+            frame = next(self._frames, None)
+        if frame is not None:
+            self._position = self._get_index(frame) + 1
+        return frame
+
+    def _get_index(self, frame: Any) -> int:
+        if frame.pts is None:
+            return self._position
+        return round((frame.pts - self._start_pts) * self._time_base * self._index_rate)
+
+    def close(self) -> None:
+        self._container.close()
+
+
+DECODER_BACKENDS: dict[str, Callable[[Path, int], VideoDecoder]] = {
+    OPENCV: OpenCvDecoder,
+    PYAV: PyAvDecoder,
+}
+"""Decoder backends selectable by name."""
+
+
+def open_decoder(
+    file: Path,
+    backend: str = DEFAULT_DECODER_BACKEND,
+    thread_count: int = DEFAULT_DECODER_THREADS,
+) -> VideoDecoder:
+    """Open a video with a decoder backend.
+
+    Args:
+        file (Path): the video file
+        backend (str): name of the backend, one of `DECODER_BACKENDS`
+        thread_count (int): number of decoding threads, 0 lets the backend decide
+
+    Raises:
+        DecoderBackendNotAvailableError: if the backend is unknown or not installed
+        ValueError: if the video can not be opened
+
+    Returns:
+        VideoDecoder: the opened decoder
+    """
+    if backend not in DECODER_BACKENDS:
+        raise DecoderBackendNotAvailableError(
+            f"Unknown decoder backend {backend}, use one of {list(DECODER_BACKENDS)}"
+        )
+    return DECODER_BACKENDS[backend](file, thread_count)
+
+
+@dataclass(frozen=True)
+class DecoderSettings:
+    backend: str = DEFAULT_DECODER_BACKEND
+    thread_count: int = DEFAULT_DECODER_THREADS
+
+    def open(self, file: Path) -> VideoDecoder:
+        return open_decoder(
+            file=file, backend=self.backend, thread_count=self.thread_count
+        )
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy.typing as npt
+
+BYTES_PER_MEGABYTE: int = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FrameCacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    number_of_frames: int
+    size_in_bytes: int
+    max_size_in_bytes: int
+
+    def __str__(self) -> str:
+        return (
+            f"Frame cache: {self.hits} hits, {self.misses} misses, "
+            f"{self.evictions} evictions, {self.number_of_frames} frames using "
+            f"{self.size_in_bytes / BYTES_PER_MEGABYTE:.0f} of "
+            f"{self.max_size_in_bytes / BYTES_PER_MEGABYTE:.0f} MB"
+        )
+
+
+class FrameCache:
+    """Least recently used cache of decoded frames shared by all videos.
+
+    The cache is bounded by the number of bytes of the cached frames instead of
+    their number, so the same budget fits videos of every resolution.
+
+    Args:
+        max_size_in_bytes (int): memory budget of the cache, 0 disables caching
+    """
+
+    def __init__(self, max_size_in_bytes: int) -> None:
+        self._max_size_in_bytes = max_size_in_bytes
+        self._frames: OrderedDict[tuple[Path, int], npt.NDArray] = OrderedDict()
+        self._size_in_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, video_file: Path, frame_number: int) -> npt.NDArray | None:
+        """Get a cached frame and mark it as most recently used.
+
+        Args:
+            video_file (Path): video the frame belongs to
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            npt.NDArray | None: the frame if it is cached
+        """
+        key = (video_file, frame_number)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self._misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self._hits += 1
+            return frame
+
+    def put(self, video_file: Path, frame_number: int, frame: npt.NDArray) -> None:
+        """Cache a frame and evict the least recently used frames if the budget
+        is exceeded.
+
+        Args:
+            video_file (Path): video the frame belongs to
+            frame_number (int): number of the frame in the video
+            frame (npt.NDArray): the decoded frame
+        """
+        if frame.nbytes > self._max_size_in_bytes:
+            return
+        key = (video_file, frame_number)
+        with self._lock:
+            previous_frame = self._frames.pop(key, None)
+            if previous_frame is not None:
+                self._size_in_bytes -= previous_frame.nbytes
+            self._frames[key] = frame
+            self._size_in_bytes += frame.nbytes
+            while self._size_in_bytes > self._max_size_in_bytes:
+                _, evicted_frame = self._frames.popitem(last=False)
+                self._size_in_bytes -= evicted_frame.nbytes
+                self._evictions += 1
+
+    def get_statistics(self) -> FrameCacheStatistics:
+        with self._lock:
+            return FrameCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                number_of_frames=len(self._frames),
+                size_in_bytes=self._size_in_bytes,
+                max_size_in_bytes=self._max_size_in_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._size_in_bytes = 0
@@ -0,0 +1,205 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+from PIL import Image
+
+from OTGroundTruther.model.overlay_layer import OverlayLayer, merge_regions
+
+RGBA_MODE: str = "RGBA"
+ALPHA_CHANNEL: int = 3
+MAX_ALPHA: int = 255
+ALPHA_MASK: np.uint32 = np.frombuffer(bytes([0, 0, 0, MAX_ALPHA]), dtype=np.uint32)[0]
+"""Selects the alpha channel of an RGBA pixel read as one 32 bit integer."""
+MAX_COMPOSITIONS: int = 4
+"""Number of resolutions to keep a composition for, e.g. full and scrub
+resolution."""
+
+
+@dataclass
+class Composition:
+    """The buffers of the last frame composed at a resolution.
+
+    The base holds the background with all overlays but the top one. The output
+    is the base itself as long as the top overlay is empty, otherwise a second
+    buffer with the top overlay blended over the base.
+    """
+
+    base: npt.NDArray
+    top: npt.NDArray
+    output: npt.NDArray
+    background: npt.NDArray | None = None
+    lower_overlays: list[OverlayLayer] = field(default_factory=list)
+    top_overlay: OverlayLayer | None = None
+
+    def has_base(
+        self, background: npt.NDArray, lower_overlays: list[OverlayLayer]
+    ) -> bool:
+        return (
+            self.background is background
+            and len(self.lower_overlays) == len(lower_overlays)
+            and all(
+                composed is overlay
+                for composed, overlay in zip(self.lower_overlays, lower_overlays)
+            )
+        )
+
+
+class FrameCompositor:
+    """Composes video frames and their overlays in reusable buffers.
+
+    The buffers are kept per resolution. The background is converted into them
+    and the overlays are blended into them in place, so that showing a frame does
+    not allocate and copy full frame images. Overlays are only blended in the
+    regions they drew in.
+
+    Composition is incremental: if only the top overlay differs from the last
+    frame composed at the resolution, the regions of the previous top overlay are
+    restored from the base buffer and only the new top overlay is blended.
+    Overlays are compared by identity and must not change once composed.
+
+    The composed image shares the memory of the buffers. It is valid until the
+    next frame of the same resolution is composed and has to be handed to the
+    GUI before. Frames composed in another thread than the GUI's are rendered
+    into images of their own instead.
+    """
+
+    def __init__(self) -> None:
+        self._compositions: dict[tuple[int, int], Composition] = {}
+        self._lock = threading.RLock()
+
+    def compose(
+        self, background: npt.NDArray, overlays: Iterable[OverlayLayer]
+    ) -> Image.Image:
+        """Compose a frame with overlays.
+
+        Args:
+            background (npt.NDArray): the frame in BGR
+            overlays (Iterable[OverlayLayer]): overlays of the same size as the
+                frame, blended in the given order
+
+        Returns:
+            Image.Image: the composed RGBA image backed by a reused buffer
+        """
+        height, width = background.shape[:2]
+        with self._lock:
+            composition = self._get_composition(width=width, height=height)
+            overlays = list(overlays)
+            lower_overlays = overlays[:-1]
+            top_overlay = overlays[-1] if overlays else None
+            if not composition.has_base(background, lower_overlays):
+                self._compose_base(composition, background, lower_overlays)
+            if top_overlay is not composition.top_overlay:
+                self._compose_top(composition, top_overlay)
+            return Image.frombuffer(
+                RGBA_MODE, (width, height), composition.output, "raw", RGBA_MODE, 0, 1
+            )
+
+    def render(
+        self,
+        background: npt.NDArray,
+        overlays: Iterable[OverlayLayer],
+        size: tuple[int, int],
+    ) -> Image.Image:
+        """Compose a frame with overlays into an image of its own.
+
+        The image does not share memory with the buffers, so that it stays valid
+        while the next frame is composed, e.g. in another thread.
+
+        Args:
+            background (npt.NDArray): the frame in BGR
+            overlays (Iterable[OverlayLayer]): overlays of the same size as the
+                frame, blended in the given order
+            size (tuple[int, int]): width and height to show the image at, a
+                reduced resolution image is enlarged to it
+
+        Returns:
+            Image.Image: the composed RGBA image
+        """
+        with self._lock:
+            image = self.compose(background=background, overlays=overlays)
+            if image.size != size:
+                return image.resize(size, resample=Image.Resampling.NEAREST)
+            return image.copy()
+
+    def _get_composition(self, width: int, height: int) -> Composition:
+        size = (width, height)
+        composition = self._compositions.pop(size, None)
+        if composition is None:
+            base = np.empty((height, width, 4), dtype=np.uint8)
+            composition = Composition(base=base, top=np.empty_like(base), output=base)
+            if len(self._compositions) >= MAX_COMPOSITIONS:
+                del self._compositions[next(iter(self._compositions))]
+        self._compositions[size] = composition
+        return composition
+
+    def _compose_base(
+        self,
+        composition: Composition,
+        background: npt.NDArray,
+        lower_overlays: list[OverlayLayer],
+    ) -> None:
+        cv2.cvtColor(background, cv2.COLOR_BGR2RGBA, dst=composition.base)
+        for overlay in lower_overlays:
+            self._blend(buffer=composition.base, overlay=overlay)
+        composition.background = background
+        composition.lower_overlays = lower_overlays
+        composition.output = composition.base
+        composition.top_overlay = None
+
+    def _compose_top(
+        self, composition: Composition, top_overlay: OverlayLayer | None
+    ) -> None:
+        if composition.top_overlay is not None:
+            self._restore(composition, composition.top_overlay)
+        composition.top_overlay = top_overlay
+        if top_overlay is None or not top_overlay.get_regions():
+            return
+        if composition.output is composition.base:
+            np.copyto(composition.top, composition.base)
+            composition.output = composition.top
+        self._blend(buffer=composition.output, overlay=top_overlay)
+
+    def _restore(self, composition: Composition, overlay: OverlayLayer) -> None:
+        """Undo blending an overlay into the output by copying the base over it.
+
+        Args:
+            composition (Composition): the composition to restore
+            overlay (OverlayLayer): the top overlay blended into the output
+        """
+        if composition.output is composition.base:
+            return
+        height, width = composition.base.shape[:2]
+        for region in merge_regions(overlay.get_regions(), width=width, height=height):
+            slices = region.get_slices()
+            composition.output[slices] = composition.base[slices]
+
+    def _blend(self, buffer: npt.NDArray, overlay: OverlayLayer) -> None:
+        """Blend an overlay over the opaque buffer in place.
+
+        Within the regions of the overlay only its visible pixels are blended.
+        They are found by reading each RGBA pixel as one 32 bit integer.
+
+        Args:
+            buffer (npt.NDArray): the opaque RGBA buffer
+            overlay (OverlayLayer): the overlay
+        """
+        overlay_array = overlay.get_array()
+        height, width = overlay_array.shape[:2]
+        for region in merge_regions(overlay.get_regions(), width=width, height=height):
+            slices = region.get_slices()
+            self._blend_region(buffer=buffer[slices], overlay=overlay_array[slices])
+
+    def _blend_region(self, buffer: npt.NDArray, overlay: npt.NDArray) -> None:
+        pixels = overlay.view(np.uint32)[..., 0]
+        rows, columns = np.divmod(np.flatnonzero(pixels & ALPHA_MASK), overlay.shape[1])
+        overlay_pixels = overlay[rows, columns]
+        alpha = overlay_pixels[:, ALPHA_CHANNEL : ALPHA_CHANNEL + 1].astype(np.uint16)
+        blended = overlay_pixels[:, :ALPHA_CHANNEL] * alpha
+        blended += buffer[rows, columns, :ALPHA_CHANNEL] * (MAX_ALPHA - alpha)
+        blended += MAX_ALPHA // 2
+        blended //= MAX_ALPHA
+        buffer[rows, columns, :ALPHA_CHANNEL] = blended
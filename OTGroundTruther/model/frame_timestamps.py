@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+from OTGroundTruther.model.config import FRAME_TIMESTAMPS_FILE_SUFFIX
+from OTGroundTruther.model.keyframe_index import RAW_STREAM_FORMAT
+from OTGroundTruther.model.video_scanner import VideoScanner
+from OTGroundTruther.model.video_sidecar import read_array_sidecar, write_array_sidecar
+
+MILLISECONDS_PER_SECOND: int = 1000
+
+
+class FrameTimestamps:
+    """Presentation times of all decoded frames of a video.
+
+    Frame numbers follow the convention of the video: frame number n > 0 shows
+    the decoded frame n - 1 and is placed one frame duration after it, so that
+    videos with a constant frame rate get the timestamps computed from their
+    frame rate.
+
+    Args:
+        presentation_times (npt.NDArray): sorted presentation times of the decoded
+            frames in seconds after the first frame
+    """
+
+    def __init__(self, presentation_times: npt.NDArray) -> None:
+        self._presentation_times = presentation_times.astype(np.float64)
+
+    def get_presentation_times(self) -> npt.NDArray:
+        return self._presentation_times
+
+    def get_offset(self, frame_number: int, frame_duration: float) -> float:
+        """Get the time of a frame after the start of the video.
+
+        Args:
+            frame_number (int): number of the frame
+            frame_duration (float): nominal duration of a frame in seconds
+
+        Returns:
+            float: seconds after the start of the video
+        """
+        if frame_number <= 0:
+            return 0
+        index = min(frame_number - 1, len(self._presentation_times) - 1)
+        return float(self._presentation_times[index]) + frame_duration
+
+    def get_frame_number(self, offset: float, frame_duration: float) -> int:
+        """Get the frame closest to a time after the start of the video.
+
+        Args:
+            offset (float): seconds after the start of the video
+            frame_duration (float): nominal duration of a frame in seconds
+
+        Returns:
+            int: number of the frame
+        """
+        position = int(
+            np.searchsorted(self._presentation_times, offset - frame_duration)
+        )
+        candidates = [0] + [
+            index + 1
+            for index in (position - 1, position)
+            if 0 <= index < len(self._presentation_times)
+        ]
+        return min(
+            candidates,
+            key=lambda frame_number: abs(
+                self.get_offset(frame_number, frame_duration) - offset
+            ),
+        )
+
+
+class FrameTimestampRecorder(VideoScanner[FrameTimestamps]):
+    """Provides videos with the presentation times of their frames.
+
+    The times are read from the packets of a video without decoding them, if the
+    backend supports it, and saved as compressed sidecar file for the next start.
+    """
+
+    def _read_sidecar(self, video_file: Path) -> FrameTimestamps | None:
+        presentation_times = read_array_sidecar(
+            video_file, FRAME_TIMESTAMPS_FILE_SUFFIX
+        )
+        if presentation_times is None:
+            return None
+        return FrameTimestamps(presentation_times)
+
+    def _write_sidecar(self, video_file: Path, result: FrameTimestamps) -> None:
+        write_array_sidecar(
+            video_file, FRAME_TIMESTAMPS_FILE_SUFFIX, result.get_presentation_times()
+        )
+
+    def _scan(self, video_file: Path) -> FrameTimestamps | None:
+        """Record the presentation time of every frame of a video.
+
+        Packets are read in decoding order, so the times are sorted afterwards.
+
+        Args:
+            video_file (Path): the video to scan
+
+        Raises:
+            VideoScanAbortedError: if the recorder was stopped during the scan
+
+        Returns:
+            FrameTimestamps | None: the times or None if the video has no frames
+        """
+        cap = cv2.VideoCapture(str(video_file))
+        try:
+            if not cap.isOpened():
+                return None
+            cap.set(cv2.CAP_PROP_FORMAT, RAW_STREAM_FORMAT)
+            times_in_ms: list[float] = []
+            while cap.grab():
+                self._raise_if_stopped()
+                times_in_ms.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+        finally:
+            cap.release()
+        if not times_in_ms:
+            return None
+        presentation_times = np.sort(np.array(times_in_ms)) / MILLISECONDS_PER_SECOND
+        return FrameTimestamps(presentation_times - presentation_times[0])
@@ -0,0 +1,88 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+
+from OTGroundTruther.model.config import KEYFRAME_INDEX_FILE_SUFFIX
+from OTGroundTruther.model.video_scanner import VideoScanner
+from OTGroundTruther.model.video_sidecar import read_sidecar, write_sidecar
+
+KEYFRAMES: str = "keyframes"
+RAW_STREAM_FORMAT: int = -1
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    keyframes: list[int]
+
+    def get_preceding_keyframe(self, frame_index: int) -> int:
+        """Get the last keyframe at or before a frame.
+
+        Args:
+            frame_index (int): zero based index of the decoded frame
+
+        Returns:
+            int: zero based index of the keyframe
+        """
+        position = bisect_right(self.keyframes, frame_index)
+        if position == 0:
+            return 0
+        return self.keyframes[position - 1]
+
+    def to_dict(self) -> dict:
+        return {KEYFRAMES: self.keyframes}
+
+    @staticmethod
+    def from_dict(content: dict) -> "KeyframeIndex":
+        return KeyframeIndex(keyframes=[int(frame) for frame in content[KEYFRAMES]])
+
+
+class KeyframeIndexer(VideoScanner[KeyframeIndex]):
+    """Provides videos with keyframe indexes.
+
+    Indexes are read from sidecar files next to the videos. Missing indexes are
+    built by scanning the videos one after another in a background thread and
+    saved as sidecar files for the next start.
+    """
+
+    def _read_sidecar(self, video_file: Path) -> KeyframeIndex | None:
+        content = read_sidecar(video_file, KEYFRAME_INDEX_FILE_SUFFIX)
+        if content is None:
+            return None
+        return KeyframeIndex.from_dict(content)
+
+    def _write_sidecar(self, video_file: Path, result: KeyframeIndex) -> None:
+        write_sidecar(video_file, KEYFRAME_INDEX_FILE_SUFFIX, result.to_dict())
+
+    def _scan(self, video_file: Path) -> KeyframeIndex | None:
+        """Find the keyframes of a video by reading its packets without decoding.
+
+        Args:
+            video_file (Path): the video to scan
+
+        Raises:
+            VideoScanAbortedError: if the indexer was stopped during the scan
+
+        Returns:
+            KeyframeIndex | None: the index or None if the backend can not provide
+                raw packets
+        """
+        cap = cv2.VideoCapture(str(video_file))
+        try:
+            if not cap.isOpened() or not cap.set(
+                cv2.CAP_PROP_FORMAT, RAW_STREAM_FORMAT
+            ):
+                return None
+            keyframes: list[int] = []
+            frame_index = 0
+            while cap.grab():
+                self._raise_if_stopped()
+                if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(frame_index)
+                frame_index += 1
+        finally:
+            cap.release()
+        if not keyframes:
+            return None
+        return KeyframeIndex(keyframes=keyframes)
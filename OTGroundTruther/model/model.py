@@ -1,5 +1,9 @@
+import dataclasses
 import datetime as dt
 from pathlib import Path
+from typing import Callable
+
+from PIL import Image
 
 from OTGroundTruther.gui.constants import tk_events
 from OTGroundTruther.gui.key_assignment import (
@@ -9,6 +13,7 @@ from OTGroundTruther.gui.key_assignment import (
 from OTGroundTruther.model.coordinate import Coordinate
 from OTGroundTruther.model.count import (
     ActiveCount,
+    ActiveCountOverlay,
     Count,
     CountRepository,
     CountsOverlay,
@@ -19,14 +24,17 @@ from OTGroundTruther.model.event import (
     EventForParsingSerializing,
     EventListParser,
 )
+from OTGroundTruther.model.frame_cache import FrameCacheStatistics
+from OTGroundTruther.model.frame_compositor import FrameCompositor
 from OTGroundTruther.model.overlayed_frame import OverlayedFrame
 from OTGroundTruther.model.road_user_class import RoadUserClass, ValidRoadUserClasses
 from OTGroundTruther.model.section import (
     LineSection,
     SectionParser,
     SectionRepository,
-    SectionsOverlay,
+    SectionsOverlayCache,
 )
+from OTGroundTruther.model.thumbnail_timeline import ThumbnailTimeline
 from OTGroundTruther.model.video import (
     BackgroundFrame,
     NoVideoError,
@@ -34,6 +42,8 @@ from OTGroundTruther.model.video import (
     Video,
     VideoRepository,
 )
+from OTGroundTruther.model.video_metadata import load_all_video_metadata
+from OTGroundTruther.model.viewport import ViewportSettings
 
 DEFAULT_CLASS_KEY: str | None = None
 
@@ -58,13 +68,76 @@ class Model:
         self._valid_road_user_classes = valid_road_user_classes
         self._section_parser: SectionParser = SectionParser()
         self._eventlistparser: EventListParser = EventListParser()
+        self._thumbnail_timeline: ThumbnailTimeline | None = None
+        self._frame_compositor: FrameCompositor = FrameCompositor()
+        self._sections_overlay_cache = SectionsOverlayCache(section_repository)
+        self._viewport_settings: ViewportSettings = ViewportSettings()
 
-    def load_videos_from_files(self, files: list[Path]):
+    def load_videos_from_files(
+        self,
+        files: list[Path],
+        on_progress: Callable[[int, int], None] | None = None,
+    ):
+        self._stop_thumbnail_timeline()
         self._video_repository.clear()
-        videos = [Video(file) for file in files]
+        all_metadata = load_all_video_metadata(
+            files=files,
+            on_progress=on_progress,
+            decoder_settings=self._video_repository.get_decoder_settings(),
+        )
+        videos = [Video(file, metadata=all_metadata[file]) for file in files]
         self._video_repository.add_all(videos)
         print(f"Videos loaded: {files}")
 
+    def start_thumbnail_timeline(self) -> None:
+        """Start extracting the thumbnails of the loaded videos in the background."""
+        self._stop_thumbnail_timeline()
+        if self._video_repository.get_number_of_frames() == 0:
+            return
+        self._thumbnail_timeline = ThumbnailTimeline(
+            videos=self._video_repository.to_list()
+        )
+        self._thumbnail_timeline.start()
+
+    def _stop_thumbnail_timeline(self) -> None:
+        if self._thumbnail_timeline is not None:
+            self._thumbnail_timeline.stop()
+            self._thumbnail_timeline = None
+
+    def thumbnail_timeline_is_complete(self) -> bool:
+        if self._thumbnail_timeline is None:
+            return True
+        return self._thumbnail_timeline.is_complete()
+
+    def get_thumbnail_timeline_strip(
+        self, width: int, height: int
+    ) -> Image.Image | None:
+        if self._thumbnail_timeline is None:
+            return None
+        return self._thumbnail_timeline.get_strip(width=width, height=height)
+
+    def get_position_on_thumbnail_timeline(
+        self, current_frame: OverlayedFrame
+    ) -> float | None:
+        if self._thumbnail_timeline is None:
+            return None
+        return self._thumbnail_timeline.get_relative_position(
+            video_name=current_frame.background_frame.get_video_name(),
+            frame_number=current_frame.background_frame.frame_number,
+        )
+
+    def get_global_frame_number_by_thumbnail_timeline_position(
+        self, relative_position: float
+    ) -> int | None:
+        if self._thumbnail_timeline is None:
+            return None
+        entry = self._thumbnail_timeline.get_entry_by_relative_position(
+            relative_position
+        )
+        return self._video_repository.get_global_frame_number(
+            file_name=entry.video_name, frame_number=entry.frame_number
+        )
+
     def read_sections_from_file(self, file: Path) -> None:
         self._section_repository.clear()
         sections, otanalytics_file_content = self._section_parser.parse(file=file)
@@ -97,7 +170,7 @@ class Model:
     def get_frame_by_timestamp(
         self,
         unix_timestamp: float,
-        selected_classes: list[str],
+        selected_classes: frozenset[str],
         selected_count_ids: list[str],
     ) -> OverlayedFrame:
         if self._video_repository == []:
@@ -115,10 +188,11 @@ class Model:
     def get_frame_by_delta_frames_or_time(
         self,
         current_frame: OverlayedFrame,
-        selected_classes: list[str],
+        selected_classes: frozenset[str],
         selected_count_ids: list[str],
         delta_of_frames: int = 0,
         delta_of_time: float = 0,
+        scale: float = 1.0,
     ) -> OverlayedFrame:
         (
             video,
@@ -129,15 +203,63 @@ class Model:
             delta_of_frames=delta_of_frames,
             delta_of_time=delta_of_time,
         )
-        background_frame = video.get_frame_by_number(frame_number)
+        background_frame = video.get_frame_by_number(frame_number, scale=scale)
         return self._get_overlayed_frame(
             background_frame=background_frame,
             selected_classes=selected_classes,
             selected_count_ids=selected_count_ids,
         )
 
+    def get_global_frame_number(self, current_frame: OverlayedFrame) -> int:
+        return self._video_repository.get_global_frame_number(
+            file_name=current_frame.background_frame.get_video_name(),
+            frame_number=current_frame.background_frame.frame_number,
+        )
+
+    def get_number_of_frames_of_all_videos(self) -> int:
+        return self._video_repository.get_number_of_frames()
+
+    def get_global_frame_number_by_delta(
+        self,
+        global_frame_number: int,
+        delta_of_frames: int = 0,
+        delta_of_time: float = 0,
+    ) -> int:
+        return self._video_repository.get_global_frame_number_by_delta(
+            global_frame_number=global_frame_number,
+            delta_of_frames=delta_of_frames,
+            delta_of_time=delta_of_time,
+        )
+
+    def get_frame_by_global_frame_number(
+        self,
+        global_frame_number: int,
+        selected_classes: frozenset[str],
+        selected_count_ids: list[str],
+        scale: float = 1.0,
+    ) -> OverlayedFrame:
+        (
+            video,
+            frame_number,
+        ) = self._video_repository.get_video_and_frame_by_global_frame_number(
+            global_frame_number
+        )
+        background_frame = self._video_repository.get_video_by_name(
+            video.get_full_name()
+        ).get_frame_by_number(frame_number, scale=scale)
+        return self._get_overlayed_frame(
+            background_frame=background_frame,
+            selected_classes=selected_classes,
+            selected_count_ids=selected_count_ids,
+        )
+
+    def get_frame_rate_of(self, current_frame: OverlayedFrame) -> float:
+        return self._video_repository.get_frame_rate_of_video(
+            current_frame.background_frame.get_video_name()
+        )
+
     def get_first_frame(
-        self, selected_classes: list[str], selected_count_ids: list[str]
+        self, selected_classes: frozenset[str], selected_count_ids: list[str]
     ) -> OverlayedFrame:
         first_video = self._video_repository.get_first_video()
         background_frame = first_video.get_frame_by_number(0)
@@ -150,7 +272,7 @@ class Model:
     def refresh_current_frame(
         self,
         current_frame: OverlayedFrame,
-        selected_classes: list[str],
+        selected_classes: frozenset[str],
         selected_count_ids: list[str],
     ) -> OverlayedFrame:
         current_video = self._video_repository.get_video_by_name(
@@ -168,18 +290,21 @@ class Model:
     def _get_overlayed_frame(
         self,
         background_frame: BackgroundFrame,
-        selected_classes: list[str],
+        selected_classes: frozenset[str],
         selected_count_ids: list[str],
     ) -> OverlayedFrame:
-        sections_overlay = SectionsOverlay(
-            sections=self._section_repository.to_list(),
-            width=background_frame.get_width(),
-            height=background_frame.get_height(),
+        background_frame = background_frame.with_viewport(
+            self._viewport_settings.get_viewport(
+                frame_width=background_frame.get_width(),
+                frame_height=background_frame.get_height(),
+            )
+        )
+        sections_overlay = self._sections_overlay_cache.get(
+            background_frame.get_image_viewport()
         )
         counts_overlay = CountsOverlay(
             background_frame=background_frame,
             count_repository=self._count_repository,
-            active_count=self._active_count,
             selected_classes=selected_classes,
             selected_count_ids=selected_count_ids,
         )
@@ -187,8 +312,95 @@ class Model:
             background_frame=background_frame,
             sections_overlay=sections_overlay,
             counts_overlay=counts_overlay,
+            active_count_overlay=self._get_active_count_overlay(background_frame),
+            compositor=self._frame_compositor,
+        )
+
+    def _get_active_count_overlay(
+        self, background_frame: BackgroundFrame
+    ) -> ActiveCountOverlay:
+        return ActiveCountOverlay(
+            background_frame=background_frame, active_count=self._active_count
+        )
+
+    def refresh_active_count_overlay(
+        self, current_frame: OverlayedFrame
+    ) -> OverlayedFrame:
+        """Redraw only the active count of a frame.
+
+        Args:
+            current_frame (OverlayedFrame): the frame shown
+
+        Returns:
+            OverlayedFrame: the frame with the other overlays reused
+        """
+        return dataclasses.replace(
+            current_frame,
+            active_count_overlay=self._get_active_count_overlay(
+                current_frame.background_frame
+            ),
         )
 
+    def resize_canvas(self, width: int, height: int) -> None:
+        """Fit the frames shown from now on into a canvas of a new size.
+
+        Args:
+            width (int): width of the canvas
+            height (int): height of the canvas
+        """
+        self._viewport_settings = self._viewport_settings.resize(
+            canvas_width=width, canvas_height=height
+        )
+
+    def zoom(
+        self, current_frame: OverlayedFrame, factor: float, x: int, y: int
+    ) -> None:
+        """Zoom the frames shown from now on at a point of the canvas.
+
+        Args:
+            current_frame (OverlayedFrame): the frame shown
+            factor (float): factor to multiply the zoom with
+            x (int): x of the point on the canvas
+            y (int): y of the point on the canvas
+        """
+        self._viewport_settings = self._viewport_settings.zoom_at(
+            factor=factor,
+            x=x,
+            y=y,
+            frame_width=current_frame.background_frame.get_width(),
+            frame_height=current_frame.background_frame.get_height(),
+        )
+
+    def pan(self, current_frame: OverlayedFrame, delta_x: int, delta_y: int) -> None:
+        """Move the part of the frames shown from now on with the cursor.
+
+        Args:
+            current_frame (OverlayedFrame): the frame shown
+            delta_x (int): horizontal movement of the cursor on the canvas
+            delta_y (int): vertical movement of the cursor on the canvas
+        """
+        self._viewport_settings = self._viewport_settings.pan(
+            delta_x=delta_x,
+            delta_y=delta_y,
+            frame_width=current_frame.background_frame.get_width(),
+            frame_height=current_frame.background_frame.get_height(),
+        )
+
+    def get_video_coordinate(
+        self, current_frame: OverlayedFrame, x: int, y: int
+    ) -> Coordinate:
+        """Get the video pixel shown at a point of the canvas.
+
+        Args:
+            current_frame (OverlayedFrame): the frame shown
+            x (int): x of the point on the canvas
+            y (int): y of the point on the canvas
+
+        Returns:
+            Coordinate: the coordinate in the video
+        """
+        return current_frame.background_frame.get_viewport().to_video(x, y)
+
     def get_event_for(
         self, coordinate: Coordinate, current_frame: OverlayedFrame | None
     ) -> Event | None:
@@ -207,6 +419,9 @@ class Model:
             time_created=now,
         )
 
+    def get_frame_cache_statistics(self) -> FrameCacheStatistics:
+        return self._video_repository.get_frame_cache_statistics()
+
     def get_section_by_coordinate(self, coordinate: Coordinate) -> LineSection | None:
         return self._section_repository.get_by_coordinate(coordinate)
 
@@ -286,11 +501,12 @@ class Model:
     def clear_repositories(self) -> None:
         self._section_repository.clear()
         self._count_repository.clear()
+        self._stop_thumbnail_timeline()
         self._video_repository.clear()
         self.active_count = None
 
     def get_start_frame_of_last_count(
-        self, selected_classes: list[str], selected_count_ids: list[str]
+        self, selected_classes: frozenset[str], selected_count_ids: list[str]
     ) -> OverlayedFrame:
         last_added_count = list(self._count_repository.get_all_as_dict().values())[-1]
         event = last_added_count.get_first_event()
@@ -301,7 +517,10 @@ class Model:
         )
 
     def get_frame_by_event(
-        self, event: Event, selected_classes: list[str], selected_count_ids: list[str]
+        self,
+        event: Event,
+        selected_classes: frozenset[str],
+        selected_count_ids: list[str],
     ) -> OverlayedFrame:
         video = self._video_repository.get_video_by_name(event.get_video_file_name())
         background_frame = video.get_frame_by_number(event.get_frame_number())
@@ -312,7 +531,10 @@ class Model:
         )
 
     def get_start_frame_of_count(
-        self, count_id: str, selected_classes: list[str], selected_count_ids: list[str]
+        self,
+        count_id: str,
+        selected_classes: frozenset[str],
+        selected_count_ids: list[str],
     ):
         event = self._count_repository.get_all_as_dict()[count_id].get_first_event()
         return self.get_frame_by_event(
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+TILE_SIZE: int = 64
+"""Edge length in pixels of the tiles that overlapping regions are merged on."""
+ANTI_ALIASING_MARGIN: int = 1
+"""Pixels that anti-aliased drawings extend beyond their nominal shape."""
+
+
+@dataclass(frozen=True)
+class Region:
+    """Rectangle of an image, the right and bottom borders are exclusive."""
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    @staticmethod
+    def around(points: Iterable[tuple[int, int]], margin: int) -> "Region":
+        """Get the bounding box of points.
+
+        Args:
+            points (Iterable[tuple[int, int]]): x and y of the points
+            margin (int): pixels to add on every side, e.g. for the line thickness
+
+        Returns:
+            Region: the bounding box
+        """
+        xs, ys = zip(*points)
+        return Region(
+            left=min(xs) - margin,
+            top=min(ys) - margin,
+            right=max(xs) + margin + 1,
+            bottom=max(ys) + margin + 1,
+        )
+
+    def clip(self, width: int, height: int) -> "Region | None":
+        """Restrict the region to an image.
+
+        Args:
+            width (int): width of the image
+            height (int): height of the image
+
+        Returns:
+            Region | None: the part inside the image or None if there is none
+        """
+        left, top = max(self.left, 0), max(self.top, 0)
+        right, bottom = min(self.right, width), min(self.bottom, height)
+        if left >= right or top >= bottom:
+            return None
+        return Region(left=left, top=top, right=right, bottom=bottom)
+
+    def get_slices(self) -> tuple[slice, slice]:
+        return slice(self.top, self.bottom), slice(self.left, self.right)
+
+
+class OverlayLayer(Protocol):
+    """An RGBA image drawn over a frame that knows where it drew."""
+
+    def get_array(self) -> npt.NDArray: ...
+
+    def get_regions(self) -> list[Region]:
+        """Get the regions containing everything drawn on the layer.
+
+        Returns:
+            list[Region]: possibly overlapping bounding boxes of the drawings
+        """
+        ...
+
+
+def merge_regions(regions: Iterable[Region], width: int, height: int) -> list[Region]:
+    """Merge regions into disjoint regions covering them.
+
+    The regions are rounded up to tiles. Adjacent marked tiles of a row of tiles
+    form one merged region, so every pixel is covered exactly once.
+
+    Args:
+        regions (Iterable[Region]): the possibly overlapping regions
+        width (int): width of the image
+        height (int): height of the image
+
+    Returns:
+        list[Region]: disjoint regions inside the image
+    """
+    tiles = np.zeros((-(-height // TILE_SIZE), -(-width // TILE_SIZE)), dtype=np.int8)
+    for region in regions:
+        clipped = region.clip(width=width, height=height)
+        if clipped is None:
+            continue
+        tiles[
+            clipped.top // TILE_SIZE : (clipped.bottom - 1) // TILE_SIZE + 1,
+            clipped.left // TILE_SIZE : (clipped.right - 1) // TILE_SIZE + 1,
+        ] = 1
+    merged: list[Region] = []
+    for row in np.flatnonzero(tiles.any(axis=1)):
+        changes = np.diff(tiles[row], prepend=0, append=0)
+        for start, end in zip(
+            np.flatnonzero(changes == 1), np.flatnonzero(changes == -1)
+        ):
+            merged.append(
+                Region(
+                    left=int(start) * TILE_SIZE,
+                    top=int(row) * TILE_SIZE,
+                    right=min(int(end) * TILE_SIZE, width),
+                    bottom=min((int(row) + 1) * TILE_SIZE, height),
+                )
+            )
+    return merged
@@ -1,25 +1,80 @@
-import copy
 from dataclasses import dataclass
 
 from PIL import Image
 
-from OTGroundTruther.model.count import CountsOverlay
+from OTGroundTruther.model.count import ActiveCountOverlay, CountsOverlay
+from OTGroundTruther.model.frame_compositor import FrameCompositor
+from OTGroundTruther.model.overlay_layer import OverlayLayer
 from OTGroundTruther.model.section import SectionsOverlay
 from OTGroundTruther.model.video import BackgroundFrame
 
 
+@dataclass(frozen=True)
+class RenderedFrame:
+    """A frame composed with its overlays at the size it is shown at.
+
+    Args:
+        overlayed_frame (OverlayedFrame): the frame and its overlays
+        image (Image.Image): the composed image, independent of the compositor
+    """
+
+    overlayed_frame: "OverlayedFrame"
+    image: Image.Image
+
+
 @dataclass
 class OverlayedFrame:
     background_frame: BackgroundFrame
     sections_overlay: SectionsOverlay
     counts_overlay: CountsOverlay
+    active_count_overlay: ActiveCountOverlay
+    compositor: FrameCompositor
 
     def get(
         self, overlay_sections: bool = True, overlay_counts: bool = True
     ) -> Image.Image:
-        image = copy.deepcopy(self.background_frame)
+        """Compose the frame with its overlays.
+
+        Args:
+            overlay_sections (bool): whether to show the sections. Defaults to True.
+            overlay_counts (bool): whether to show the counts. Defaults to True.
+
+        Only overlays differing from the frame composed last are blended anew, so
+        changing the active count only redraws the active count.
+
+        Returns:
+            Image.Image: the composed image, valid until the compositor composes
+                the next frame of the same resolution
+        """
+        return self.compositor.compose(
+            background=self.background_frame.get_scaled_array(),
+            overlays=self._get_overlays(overlay_sections, overlay_counts),
+        )
+
+    def render(self) -> RenderedFrame:
+        """Compose the frame with all overlays at the size of its viewport.
+
+        Rendering can run in a background thread, the image is handed to the GUI
+        as it is.
+
+        Returns:
+            RenderedFrame: the frame and its image
+        """
+        viewport = self.background_frame.get_viewport()
+        image = self.compositor.render(
+            background=self.background_frame.get_scaled_array(),
+            overlays=self._get_overlays(overlay_sections=True, overlay_counts=True),
+            size=(viewport.get_width(), viewport.get_height()),
+        )
+        return RenderedFrame(overlayed_frame=self, image=image)
+
+    def _get_overlays(
+        self, overlay_sections: bool, overlay_counts: bool
+    ) -> list[OverlayLayer]:
+        overlays: list[OverlayLayer] = []
         if overlay_sections:
-            image.add_overlay(overlay=self.sections_overlay.get())
+            overlays.append(self.sections_overlay)
         if overlay_counts:
-            image.add_overlay(overlay=self.counts_overlay.get())
-        return image.get()
+            overlays.append(self.counts_overlay)
+            overlays.append(self.active_count_overlay)
+        return overlays
@@ -0,0 +1,67 @@
+import time
+
+PLAYBACK_SPEEDS: tuple[float, ...] = (1, 2, 4)
+MILLISECONDS_PER_SECOND: int = 1000
+
+
+class PlaybackClock:
+    """Paces playback by the wall clock.
+
+    The clock tells how many frames playback has to advance to keep up with real
+    time at the chosen speed. If showing a frame takes longer than a frame lasts,
+    several frames are due at once and the frames in between are dropped instead
+    of playback falling behind.
+
+    Args:
+        speed (float): playback speed relative to real time
+    """
+
+    def __init__(self, speed: float = PLAYBACK_SPEEDS[0]) -> None:
+        self._speed = speed
+        self._last_time: float = time.monotonic()
+        self._pending_frames: float = 0
+
+    def restart(self) -> None:
+        self._last_time = time.monotonic()
+        self._pending_frames = 0
+
+    def get_speed(self) -> float:
+        return self._speed
+
+    def switch_to_next_speed(self) -> float:
+        """Switch to the next faster speed or back to the slowest one.
+
+        Returns:
+            float: the new speed
+        """
+        if self._speed in PLAYBACK_SPEEDS:
+            index = PLAYBACK_SPEEDS.index(self._speed)
+        else:
+            index = -1
+        self._speed = PLAYBACK_SPEEDS[(index + 1) % len(PLAYBACK_SPEEDS)]
+        return self._speed
+
+    def get_frames_due(self, frame_rate: float) -> int:
+        """Get the number of frames to advance since the last call.
+
+        Args:
+            frame_rate (float): frame rate of the video being played
+
+        Returns:
+            int: number of frames to advance, frames beyond the first one are dropped
+        """
+        now = time.monotonic()
+        self._pending_frames += (now - self._last_time) * self._speed * frame_rate
+        self._last_time = now
+        frames_due = int(self._pending_frames)
+        self._pending_frames -= frames_due
+        return frames_due
+
+    def get_delay_until_next_frame_in_ms(self, frame_rate: float) -> int:
+        remaining_frames = 1 - self._pending_frames
+        return max(
+            round(
+                MILLISECONDS_PER_SECOND * remaining_frames / (frame_rate * self._speed)
+            ),
+            1,
+        )
@@ -0,0 +1,121 @@
+import threading
+from typing import Callable
+
+import numpy.typing as npt
+
+
+class FrameReadAhead:
+    """Decodes the frames following the last requested frame of a video in a
+    background thread and keeps them in a bounded buffer.
+
+    The read ahead follows the current navigation direction: after stepping
+    backwards it decodes the preceding frames instead of the following ones.
+
+    Args:
+        decode (Callable[[int], npt.NDArray | None]): decodes the frame with the
+            given number, returns None if the frame can not be decoded
+        number_of_frames_in_video (int): number of frames of the video
+        buffer_size (int): maximum number of frames to decode ahead
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[int], npt.NDArray | None],
+        number_of_frames_in_video: int,
+        buffer_size: int,
+    ) -> None:
+        self._decode = decode
+        self._number_of_frames_in_video = number_of_frames_in_video
+        self._buffer_size = buffer_size
+        self._buffer: dict[int, npt.NDArray] = {}
+        self._not_decodable: set[int] = set()
+        self._position: int | None = None
+        self._direction: int = 1
+        self._in_progress: int | None = None
+        self._stopped: bool = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._buffer.clear()
+            self._condition.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def get(self, frame_number: int) -> npt.NDArray | None:
+        """Get a frame from the buffer.
+
+        Waits if the frame is decoded by the background thread at the moment.
+
+        Args:
+            frame_number (int): number of the frame
+
+        Returns:
+            npt.NDArray | None: the frame if it has already been decoded
+        """
+        with self._condition:
+            while self._in_progress == frame_number:
+                self._condition.wait()
+            return self._buffer.get(frame_number)
+
+    def move_to(self, frame_number: int) -> None:
+        """Set the frame currently shown and read ahead from there.
+
+        Args:
+            frame_number (int): number of the frame currently shown
+        """
+        with self._condition:
+            if self._position is not None and frame_number != self._position:
+                self._direction = 1 if frame_number > self._position else -1
+            self._position = frame_number
+            window = set(self._get_window())
+            self._buffer = {
+                number: frame
+                for number, frame in self._buffer.items()
+                if number in window
+            }
+            self._condition.notify_all()
+
+    def _get_window(self) -> list[int]:
+        if self._position is None:
+            return []
+        window = [
+            self._position + self._direction * step
+            for step in range(1, self._buffer_size + 1)
+        ]
+        return [
+            frame_number
+            for frame_number in window
+            if 0 <= frame_number < self._number_of_frames_in_video
+        ]
+
+    def _get_next_frame_number_to_decode(self) -> int | None:
+        for frame_number in self._get_window():
+            if frame_number in self._buffer or frame_number in self._not_decodable:
+                continue
+            return frame_number
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                frame_number = self._get_next_frame_number_to_decode()
+                while not self._stopped and frame_number is None:
+                    self._condition.wait()
+                    frame_number = self._get_next_frame_number_to_decode()
+                if self._stopped or frame_number is None:
+                    return
+                self._in_progress = frame_number
+            frame = self._decode(frame_number)
+            with self._condition:
+                self._in_progress = None
+                if frame is None:
+                    self._not_decodable.add(frame_number)
+                elif frame_number in self._get_window():
+                    self._buffer[frame_number] = frame
+                self._condition.notify_all()
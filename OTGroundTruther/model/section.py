@@ -1,14 +1,16 @@
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
 import cv2
 import numpy as np
-from PIL import Image
 
 from OTGroundTruther.model.coordinate import Coordinate
 from OTGroundTruther.model.ellipse import Ellipse
+from OTGroundTruther.model.overlay_layer import ANTI_ALIASING_MARGIN, Region
 from OTGroundTruther.model.parse import parse
+from OTGroundTruther.model.viewport import Viewport
 
 SECTIONS: str = "sections"
 ID: str = "id"
@@ -26,6 +28,8 @@ SECTION_LINETYPE: int = cv2.LINE_AA
 ELLIPSE_COLOR = (127, 255, 0, 255)
 SECTION_THICKNESS = 1
 ELLIPSE_THICKNESS = 2
+MAX_CACHED_SECTIONS_OVERLAYS: int = 4
+"""Number of viewports to keep the sections overlay for."""
 
 
 class UnambigousSectionEllipsesError(Exception):
@@ -74,40 +78,54 @@ class LineSection:
 @dataclass
 class SectionsOverlay:
     sections: list[LineSection]
-    width: int
-    height: int
+    viewport: Viewport
     image_array: np.ndarray = field(init=False)
-    image: Image.Image = field(init=False)
+    regions: list[Region] = field(init=False)
 
     def __post_init__(self) -> None:
         self._get_image()
 
-    def get(self) -> Image.Image:
-        return self.image
+    def get_array(self) -> np.ndarray:
+        return self.image_array
 
-    def _get_image(self) -> Image.Image:
-        self.image_array = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+    def get_regions(self) -> list[Region]:
+        return self.regions
+
+    def _get_image(self) -> None:
+        self.image_array = np.zeros(
+            (self.viewport.get_height(), self.viewport.get_width(), 4), dtype=np.uint8
+        )
+        self.regions = []
         for section in self.sections:
             for ellipse in section.ellipses:
                 self._draw_line(ellipse)
                 self._draw_ellipse(ellipse)
-        self.image = Image.fromarray(self.image_array)
 
     def _draw_line(self, ellipse: Ellipse) -> None:
+        start = self.viewport.to_image(ellipse.start).as_tuple()
+        end = self.viewport.to_image(ellipse.end).as_tuple()
         cv2.line(
             img=self.image_array,
-            pt1=ellipse.start.as_tuple(),
-            pt2=ellipse.end.as_tuple(),
+            pt1=start,
+            pt2=end,
             color=SECTION_COLOR,
             thickness=SECTION_THICKNESS,
             lineType=SECTION_LINETYPE,
         )
+        self.regions.append(
+            Region.around([start, end], margin=SECTION_THICKNESS + ANTI_ALIASING_MARGIN)
+        )
 
     def _draw_ellipse(self, ellipse: Ellipse) -> None:
+        center = self.viewport.to_image(ellipse.center).as_tuple()
+        axes = (
+            round(ellipse.major_axis_length * self.viewport.scale),
+            round(ellipse.minor_axis_length * self.viewport.scale),
+        )
         cv2.ellipse(
             img=self.image_array,
-            center=ellipse.center.as_tuple(),
-            axes=(round(ellipse.major_axis_length), round(ellipse.minor_axis_length)),
+            center=center,
+            axes=axes,
             angle=ellipse.angle,
             startAngle=0,
             endAngle=360,
@@ -115,12 +133,26 @@ class SectionsOverlay:
             thickness=ELLIPSE_THICKNESS,
             lineType=SECTION_LINETYPE,
         )
+        self.regions.append(self._get_ellipse_region(center, axes, ellipse.angle))
+
+    def _get_ellipse_region(
+        self, center: tuple[int, int], axes: tuple[int, int], angle: float
+    ) -> Region:
+        cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        half_width = math.ceil(math.hypot(axes[0] * cos, axes[1] * sin))
+        half_height = math.ceil(math.hypot(axes[0] * sin, axes[1] * cos))
+        x, y = center
+        return Region.around(
+            [(x - half_width, y - half_height), (x + half_width, y + half_height)],
+            margin=ELLIPSE_THICKNESS + ANTI_ALIASING_MARGIN,
+        )
 
 
 class SectionRepository:
     def __init__(self) -> None:
         self._sections: dict[str, LineSection] = {}
         self._otanalytics_file_content: dict = {}
+        self._version: int = 0
 
     def add_all(self, sections: Iterable[LineSection]) -> None:
         """Add several sections at once to the repository.
@@ -131,6 +163,7 @@ class SectionRepository:
         for section in sections:
             self._add(section)
             # TODO: Check if ellipses around different sections touch each other
+        self._version += 1
 
     def _add(self, section: LineSection) -> None:
         """Internal method to add sections without notifying observers.
@@ -167,6 +200,14 @@ class SectionRepository:
         """
         return self._sections.get(id)
 
+    def get_version(self) -> int:
+        """Get the version of the sections, which changes whenever they change.
+
+        Returns:
+            int: the version
+        """
+        return self._version
+
     def get_by_coordinate(self, coordinate: Coordinate) -> LineSection | None:
         filtered_sections = [
             section
@@ -195,6 +236,46 @@ class SectionRepository:
         """
         self._sections.clear()
         self._otanalytics_file_content.clear()
+        self._version += 1
+
+
+class SectionsOverlayCache:
+    """Provides the sections overlay for a viewport, drawn only once.
+
+    Overlays are kept until the sections of the repository change.
+
+    Args:
+        section_repository (SectionRepository): the sections to draw
+    """
+
+    def __init__(self, section_repository: SectionRepository) -> None:
+        self._section_repository = section_repository
+        self._version: int = section_repository.get_version()
+        self._overlays: dict[Viewport, SectionsOverlay] = {}
+
+    def get(self, viewport: Viewport) -> SectionsOverlay:
+        """Get the overlay of the current sections.
+
+        Args:
+            viewport (Viewport): the part of the frame shown and its resolution
+
+        Returns:
+            SectionsOverlay: the overlay, its image must not be changed
+        """
+        version = self._section_repository.get_version()
+        if version != self._version:
+            self._overlays.clear()
+            self._version = version
+        overlay = self._overlays.pop(viewport, None)
+        if overlay is None:
+            overlay = SectionsOverlay(
+                sections=self._section_repository.to_list(), viewport=viewport
+            )
+            overlay.get_array().setflags(write=False)
+            if len(self._overlays) >= MAX_CACHED_SECTIONS_OVERLAYS:
+                del self._overlays[next(iter(self._overlays))]
+        self._overlays[viewport] = overlay
+        return overlay
 
 
 class SectionParser:
@@ -0,0 +1,312 @@
+import atexit
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import ujson
+from PIL import Image
+
+from OTGroundTruther.model.config import (
+    THUMBNAIL_CACHE_DIR,
+    THUMBNAIL_CACHE_MAX_AGE_IN_DAYS,
+    THUMBNAIL_TIMELINE_FILE_SUFFIX,
+)
+from OTGroundTruther.model.decoder import get_frame_index
+from OTGroundTruther.model.video import Video
+from OTGroundTruther.model.video_sidecar import get_fingerprint
+
+THUMBNAIL_INTERVAL_IN_SECONDS: float = 10
+THUMBNAIL_WIDTH: int = 128
+MISSING_THUMBNAIL_COLOR: int = 64
+LETTERBOX_COLOR: int = 0
+SECONDS_PER_DAY: int = 24 * 60 * 60
+PENDING: int = 0
+FILLED: int = 1
+FAILED: int = 2
+FIRST_FRAME_NUMBER: int = 1
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    """A thumbnail of the timeline.
+
+    Args:
+        video_name (str): name of the video
+        frame_number (int): number of the frame in the video, counted from 1 like
+            the frames of a video
+    """
+
+    video_name: str
+    frame_number: int
+
+
+class ThumbnailTimeline:
+    """Thumbnails of all videos of a session taken every few seconds.
+
+    The thumbnails are extracted in a background thread into one memory-mapped
+    file per session. The file is reused by later sessions with the same videos,
+    files of sessions not opened for a while are deleted. All thumbnails have the
+    aspect ratio of the first video, frames of other videos are letterboxed.
+
+    Args:
+        videos (list[Video]): the videos of the session in their order, at least
+            one of them with frames
+        interval_in_seconds (float): time between two thumbnails
+        thumbnail_width (int): width of a thumbnail in pixels
+        cache_dir (Path): directory to store the memory-mapped files in
+    """
+
+    def __init__(
+        self,
+        videos: list[Video],
+        interval_in_seconds: float = THUMBNAIL_INTERVAL_IN_SECONDS,
+        thumbnail_width: int = THUMBNAIL_WIDTH,
+        cache_dir: Path = THUMBNAIL_CACHE_DIR,
+    ) -> None:
+        self._videos = videos
+        self._interval_in_seconds = interval_in_seconds
+        self._thumbnail_width = thumbnail_width
+        self._thumbnail_height = max(
+            round(thumbnail_width * videos[0].get_height() / videos[0].get_width()), 1
+        )
+        self._entries: list[TimelineEntry] = []
+        self._first_entry_by_video: dict[str, int] = {}
+        self._step_by_video: dict[str, int] = {}
+        self._number_of_entries_by_video: dict[str, int] = {}
+        self._fill_entries()
+        self._thumbnails: np.memmap = self._open_cache_file(cache_dir)
+        self._stopped: bool = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _fill_entries(self) -> None:
+        for video in self._videos:
+            video_name = video.get_full_name()
+            step = max(round(self._interval_in_seconds * video.get_frame_rate()), 1)
+            number_of_frames = video.get_number_of_frames()
+            # Navigation numbers the frames of a video up to one less than their
+            # number, so a video with a single frame only has frame number 0.
+            frame_numbers = range(
+                min(FIRST_FRAME_NUMBER, max(number_of_frames - 1, 0)),
+                number_of_frames,
+                step,
+            )
+            self._first_entry_by_video[video_name] = len(self._entries)
+            self._step_by_video[video_name] = step
+            self._number_of_entries_by_video[video_name] = len(frame_numbers)
+            self._entries.extend(
+                TimelineEntry(video_name=video_name, frame_number=frame_number)
+                for frame_number in frame_numbers
+            )
+
+    def _get_session_key(self) -> str:
+        session = {
+            "videos": [
+                [str(video.get_filepath()), get_fingerprint(video.get_filepath())]
+                for video in self._videos
+            ],
+            "interval_in_seconds": self._interval_in_seconds,
+            "thumbnail_width": self._thumbnail_width,
+            "thumbnail_height": self._thumbnail_height,
+        }
+        return hashlib.sha1(ujson.dumps(session).encode()).hexdigest()
+
+    def _open_cache_file(self, cache_dir: Path) -> np.memmap:
+        """Open the memory-mapped thumbnails of the session.
+
+        Each row holds one RGB thumbnail followed by a flag telling whether it is
+        pending, extracted or could not be extracted.
+
+        Args:
+            cache_dir (Path): directory of the memory-mapped files
+
+        Returns:
+            np.memmap: the memory-mapped thumbnails
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        file = cache_dir / f"{self._get_session_key()}{THUMBNAIL_TIMELINE_FILE_SUFFIX}"
+        _delete_stale_cache_files(cache_dir, keep=file)
+        shape = (
+            len(self._entries),
+            self._thumbnail_height * self._thumbnail_width * 3 + 1,
+        )
+        is_reusable = file.exists() and file.stat().st_size == shape[0] * shape[1]
+        if is_reusable:
+            file.touch()
+            return np.memmap(file, dtype=np.uint8, mode="r+", shape=shape)
+        return np.memmap(file, dtype=np.uint8, mode="w+", shape=shape)
+
+    def start(self) -> None:
+        atexit.register(self.stop)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        if self._thread.is_alive():
+            self._thread.join()
+        self._thumbnails.flush()
+        atexit.unregister(self.stop)
+
+    def is_complete(self) -> bool:
+        return not bool(np.any(self._thumbnails[:, -1] == PENDING))
+
+    def get_number_of_entries(self) -> int:
+        return len(self._entries)
+
+    def get_entry(self, index: int) -> TimelineEntry:
+        return self._entries[index]
+
+    def get_index(self, video_name: str, frame_number: int) -> int:
+        """Get the entry of the timeline at or before a frame.
+
+        Args:
+            video_name (str): name of the video
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            int: index of the entry
+        """
+        offset = min(
+            get_frame_index(frame_number) // self._step_by_video[video_name],
+            max(self._number_of_entries_by_video[video_name] - 1, 0),
+        )
+        return min(
+            self._first_entry_by_video[video_name] + offset, len(self._entries) - 1
+        )
+
+    def get_relative_position(self, video_name: str, frame_number: int) -> float:
+        """Get the position of a frame on the timeline.
+
+        Args:
+            video_name (str): name of the video
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            float: position between 0 (start) and 1 (end of the timeline)
+        """
+        return self.get_index(video_name, frame_number) / len(self._entries)
+
+    def get_entry_by_relative_position(self, relative_position: float) -> TimelineEntry:
+        index = int(relative_position * len(self._entries))
+        return self._entries[min(max(index, 0), len(self._entries) - 1)]
+
+    def get_thumbnail(self, index: int) -> npt.NDArray | None:
+        row = self._thumbnails[index]
+        if row[-1] != FILLED:
+            return None
+        return np.asarray(row[:-1]).reshape(
+            self._thumbnail_height, self._thumbnail_width, 3
+        )
+
+    def get_strip(self, width: int, height: int) -> Image.Image:
+        """Get thumbnails spread evenly over the timeline side by side.
+
+        Args:
+            width (int): width of the strip in pixels
+            height (int): height of the strip in pixels
+
+        Returns:
+            Image.Image: the strip, not yet extracted thumbnails are grey
+        """
+        thumbnail_width = max(
+            round(height * self._thumbnail_width / self._thumbnail_height), 1
+        )
+        number_of_thumbnails = max(width // thumbnail_width, 1)
+        strip = np.full(
+            (self._thumbnail_height, number_of_thumbnails * self._thumbnail_width, 3),
+            MISSING_THUMBNAIL_COLOR,
+            dtype=np.uint8,
+        )
+        for position in range(number_of_thumbnails):
+            index = position * len(self._entries) // number_of_thumbnails
+            thumbnail = self.get_thumbnail(index)
+            if thumbnail is not None:
+                start = position * self._thumbnail_width
+                strip[:, start : start + self._thumbnail_width] = thumbnail
+        return Image.fromarray(strip).resize((width, height))
+
+    def _run(self) -> None:
+        for video in self._videos:
+            first_entry = self._first_entry_by_video[video.get_full_name()]
+            number_of_entries = self._number_of_entries_by_video[video.get_full_name()]
+            indices = [
+                index
+                for index in range(first_entry, first_entry + number_of_entries)
+                if self._thumbnails[index, -1] == PENDING
+            ]
+            if indices:
+                self._extract(video, indices)
+                self._thumbnails.flush()
+            if self._stopped:
+                return
+
+    def _extract(self, video: Video, indices: list[int]) -> None:
+        try:
+            decoder = video.get_decoder_settings().open(video.get_filepath())
+        except ValueError:
+            self._thumbnails[indices, -1] = FAILED
+            return
+        try:
+            for index in indices:
+                if self._stopped:
+                    return
+                decoder.seek(get_frame_index(self._entries[index].frame_number))
+                frame = decoder.read()
+                if frame is None:
+                    self._thumbnails[index, -1] = FAILED
+                    continue
+                thumbnail = self._to_thumbnail(frame)
+                self._thumbnails[index, :-1] = thumbnail.reshape(-1)
+                self._thumbnails[index, -1] = FILLED
+        finally:
+            decoder.close()
+
+    def _to_thumbnail(self, frame: npt.NDArray) -> npt.NDArray:
+        """Scale a frame to fit into a thumbnail, keeping its aspect ratio.
+
+        Args:
+            frame (npt.NDArray): the frame in BGR
+
+        Returns:
+            npt.NDArray: the thumbnail in RGB, letterboxed if the aspect ratio of
+                the frame differs from the thumbnails
+        """
+        frame_height, frame_width = frame.shape[:2]
+        factor = min(
+            self._thumbnail_width / frame_width, self._thumbnail_height / frame_height
+        )
+        width = min(max(round(frame_width * factor), 1), self._thumbnail_width)
+        height = min(max(round(frame_height * factor), 1), self._thumbnail_height)
+        thumbnail = np.full(
+            (self._thumbnail_height, self._thumbnail_width, 3),
+            LETTERBOX_COLOR,
+            dtype=np.uint8,
+        )
+        top = (self._thumbnail_height - height) // 2
+        left = (self._thumbnail_width - width) // 2
+        thumbnail[top : top + height, left : left + width] = cv2.resize(
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB),
+            dsize=(width, height),
+            interpolation=cv2.INTER_AREA,
+        )
+        return thumbnail
+
+
+def _delete_stale_cache_files(cache_dir: Path, keep: Path) -> None:
+    """Delete the thumbnail timelines of sessions not opened for a while.
+
+    Args:
+        cache_dir (Path): directory of the memory-mapped files
+        keep (Path): file of the current session, kept in any case
+    """
+    oldest_time = time.time() - THUMBNAIL_CACHE_MAX_AGE_IN_DAYS * SECONDS_PER_DAY
+    for file in cache_dir.glob(f"*{THUMBNAIL_TIMELINE_FILE_SUFFIX}"):
+        try:
+            if file != keep and file.stat().st_mtime < oldest_time:
+                file.unlink()
+        except OSError:
+            continue
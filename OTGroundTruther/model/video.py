@@ -1,13 +1,43 @@
 import datetime as dt
 import re
-from dataclasses import dataclass, field
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import cv2
 import numpy.typing as npt
 from PIL import Image
 
+from OTGroundTruther.model.capture_pool import CapturePool
+from OTGroundTruther.model.config import (
+    DEFAULT_DECODER_BACKEND,
+    DEFAULT_DECODER_THREADS,
+    DEFAULT_FRAME_CACHE_SIZE_IN_MB,
+    DEFAULT_MAX_OPEN_VIDEOS,
+    DEFAULT_READ_AHEAD_FRAMES,
+    DEFAULT_RECORD_FRAME_TIMESTAMPS,
+)
+from OTGroundTruther.model.decoder import DecoderSettings, VideoDecoder, get_frame_index
+from OTGroundTruther.model.frame_cache import (
+    BYTES_PER_MEGABYTE,
+    FrameCache,
+    FrameCacheStatistics,
+)
+from OTGroundTruther.model.frame_timestamps import (
+    FrameTimestampRecorder,
+    FrameTimestamps,
+)
+from OTGroundTruther.model.keyframe_index import KeyframeIndex, KeyframeIndexer
+from OTGroundTruther.model.read_ahead import FrameReadAhead
+from OTGroundTruther.model.video_metadata import VideoMetadata, load_video_metadata
+from OTGroundTruther.model.viewport import Viewport
+
+BACKWARD_CHUNK_SIZE_IN_MB: int = 256
+"""Memory budget of the frames decoded at once when stepping backwards, limits
+the chunk if a GOP does not fit in."""
+
 
 class NoVideoError(Exception):
     pass
@@ -43,10 +73,6 @@ def _get_datetime_from_filename(
     return seconds_since_epoch, datetime
 
 
-class NumberOfFramesUnknownError(Exception):
-    pass
-
-
 class FrameNotFoundInVideoError(Exception):
     pass
 
@@ -65,10 +91,23 @@ class BackgroundFrame:
     video_file: Path
     frame_number: int
     unix_timestamp: float
-    image: Image.Image = field(init=False)
+    scale: float = 1.0
+    viewport: Viewport | None = None
+    scaled_array: npt.NDArray | None = field(default=None, init=False, repr=False)
+
+    def get_scaled_array(self) -> npt.NDArray:
+        """Get the part of the frame shown in BGR at the resolution of the image.
 
-    def __post_init__(self):
-        self.image = Image.fromarray(cv2.cvtColor(self.np_array, cv2.COLOR_BGR2RGB))
+        Returns:
+            npt.NDArray: the frame itself if shown whole and not scaled, otherwise
+                the image made on the first call
+        """
+        viewport = self.get_image_viewport()
+        if viewport == Viewport.of_frame(self.get_width(), self.get_height()):
+            return self.np_array
+        if self.scaled_array is None:
+            self.scaled_array = viewport.render(self.np_array)
+        return self.scaled_array
 
     def get_width(self) -> int:
         return self.np_array.shape[1]
@@ -76,17 +115,49 @@ class BackgroundFrame:
     def get_height(self) -> int:
         return self.np_array.shape[0]
 
+    def get_viewport(self) -> Viewport:
+        """Get the part of the frame shown and its size on the canvas.
+
+        Returns:
+            Viewport: the viewport, the whole frame at full size if not set
+        """
+        if self.viewport is None:
+            return Viewport.of_frame(self.get_width(), self.get_height())
+        return self.viewport
+
+    def get_image_viewport(self) -> Viewport:
+        """Get the viewport at the resolution of the image, reduced by the scale.
+
+        Returns:
+            Viewport: the viewport the image and its overlays are drawn at
+        """
+        return self.get_viewport().rescale(self.scale)
+
+    def with_viewport(self, viewport: Viewport) -> "BackgroundFrame":
+        """Get the frame showing another part of it.
+
+        Args:
+            viewport (Viewport): the part of the frame to show
+
+        Returns:
+            BackgroundFrame: the frame itself if it already shows the viewport
+        """
+        if viewport == self.get_viewport():
+            return self
+        return replace(self, viewport=viewport)
+
+    def get_image_width(self) -> int:
+        return self.get_image_viewport().get_width()
+
+    def get_image_height(self) -> int:
+        return self.get_image_viewport().get_height()
+
     def get(self) -> Image.Image:
-        return self.image
+        return Image.fromarray(cv2.cvtColor(self.get_scaled_array(), cv2.COLOR_BGR2RGB))
 
     def get_unix_timestamp(self) -> float:
         return self.unix_timestamp
 
-    def add_overlay(self, overlay: Image.Image) -> None:
-        self.image = Image.alpha_composite(
-            self.image.convert("RGBA"), overlay.convert(mode="RGBA")
-        )
-
     def get_frame_number(self) -> int:
         return self.frame_number
 
@@ -98,26 +169,90 @@ class BackgroundFrame:
 
 
 class Video:
-    def __init__(self, file: Path):
+    """A video file.
+
+    The video is opened on the first frame access. Its metadata is read from a
+    sidecar file or probed on first use. If a capture pool closes the capture,
+    it is reopened at the same position on the next frame access.
+
+    Args:
+        file (Path): the video file
+        metadata (VideoMetadata | None): metadata if already known
+    """
+
+    def __init__(self, file: Path, metadata: VideoMetadata | None = None):
         self.file: Path = file
-        self._load()
-        self._set_frame_rate()
-        self._set_number_of_frames()
+        self._decoder: VideoDecoder | None = None
+        self._decoder_settings = DecoderSettings()
+        self._metadata: VideoMetadata | None = metadata
+        self._lock = threading.RLock()
+        self._metadata_lock = threading.Lock()
+        self._read_ahead: FrameReadAhead | None = None
+        self._frame_cache: FrameCache | None = None
+        self._keyframe_index: KeyframeIndex | None = None
+        self._frame_timestamps: FrameTimestamps | None = None
+        self._capture_pool: CapturePool | None = None
+        self._position_to_restore: int = 0
+        self._backward_chunk: dict[int, npt.NDArray] = {}
         self._start_timestamp, self._start_datetime = self._parse_start_time()
 
-    def _load(self):
-        self.cap = cv2.VideoCapture(str(self.file))
-        if not self._is_loaded():
-            raise ValueError(f"Konnte das Video {self.file} nicht öffnen.")
+    def _load(self) -> VideoDecoder:
+        self._decoder = self._decoder_settings.open(self.file)
+        return self._decoder
 
     def _is_loaded(self) -> bool:
-        return self.cap.isOpened()
+        return self._decoder is not None
+
+    def _get_decoder(self) -> VideoDecoder:
+        if self._decoder is None:
+            decoder = self._load()
+            self._restore_position()
+            return decoder
+        return self._decoder
+
+    def _restore_position(self) -> None:
+        position = self._position_to_restore
+        self._position_to_restore = 0
+        if position == 0:
+            return
+        if self._keyframe_index is not None:
+            self._seek_via_keyframe(frame_index=position)
+        else:
+            self.set_frame_number(position)
+
+    def _release_decoder(self) -> None:
+        with self._lock:
+            if self._decoder is None:
+                return
+            self._position_to_restore = self._get_current_frame_number()
+            self._decoder.close()
+            self._decoder = None
+            self._backward_chunk = {}
+
+    def _get_metadata(self) -> VideoMetadata:
+        """Get the metadata, reading it from the file on first access.
+
+        The metadata has its own lock, so that reading it does not wait for frames
+        being decoded, e.g. by the read ahead.
+
+        Returns:
+            VideoMetadata: the metadata
+        """
+        metadata = self._metadata
+        if metadata is not None:
+            return metadata
+        with self._metadata_lock:
+            if self._metadata is None:
+                self._metadata = load_video_metadata(
+                    self.file, decoder_settings=self._decoder_settings
+                )
+            return self._metadata
 
     def get_width(self) -> int:
-        return self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+        return self._get_metadata().width
 
     def get_height(self) -> int:
-        return self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        return self._get_metadata().height
 
     def get_filepath(self) -> Path:
         return self.file
@@ -129,26 +264,7 @@ class Video:
         return self.file.stem
 
     def get_frame_rate(self) -> float:
-        return self.frame_rate
-
-    def _set_frame_rate(self) -> None:
-        self.frame_rate = self.cap.get(cv2.CAP_PROP_FPS)
-
-    def _set_number_of_frames(self) -> None:
-        calculated_frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        for frame_number in range(
-            calculated_frame_count - 3, calculated_frame_count + 3
-        ):
-            try:
-                self._get_frame_by_number(frame_number=frame_number)
-            except FrameNotFoundInVideoError:
-                self.number_of_frames = frame_number
-                if frame_number == calculated_frame_count - 3:
-                    raise NumberOfFramesUnknownError
-                else:
-                    break
-            else:
-                pass
+        return self._get_metadata().frame_rate
 
     def _parse_start_time(self) -> tuple[float, str]:
         return _get_datetime_from_filename(filename=self.file.stem)
@@ -159,16 +275,76 @@ class Video:
     def get_start_datetime(self) -> str:
         return self._start_datetime
 
-    def get_number_of_frames(self):
-        return self.number_of_frames
+    def get_number_of_frames(self) -> int:
+        return self._get_metadata().number_of_frames
 
     def get_duration_in_seconds(self) -> float:
-        return self.get_number_of_frames / self.frame_rate
+        return self.get_number_of_frames() / self.get_frame_rate()
 
     def set_frame_number(self, frame_number: int) -> None:
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        with self._lock:
+            self._get_decoder().seek(frame_number)
+
+    def start_read_ahead(self, buffer_size: int) -> None:
+        """Start decoding the frames following the requested ones in the background.
+
+        Args:
+            buffer_size (int): number of frames to decode ahead, 0 disables it
+        """
+        if self._read_ahead is not None or buffer_size <= 0:
+            return
+        self._read_ahead = FrameReadAhead(
+            decode=self._try_decode_frame,
+            number_of_frames_in_video=self.get_number_of_frames(),
+            buffer_size=buffer_size,
+        )
+        self._read_ahead.start()
+
+    def set_frame_cache(self, frame_cache: FrameCache) -> None:
+        self._frame_cache = frame_cache
+
+    def set_decoder_settings(self, decoder_settings: DecoderSettings) -> None:
+        with self._lock:
+            self._release_decoder()
+            self._decoder_settings = decoder_settings
+
+    def get_decoder_settings(self) -> DecoderSettings:
+        return self._decoder_settings
+
+    def set_capture_pool(self, capture_pool: CapturePool) -> None:
+        self._capture_pool = capture_pool
+
+    def set_keyframe_index(self, keyframe_index: KeyframeIndex) -> None:
+        with self._lock:
+            self._keyframe_index = keyframe_index
+
+    def set_frame_timestamps(self, frame_timestamps: FrameTimestamps) -> None:
+        """Use recorded frame times instead of the nominal frame rate.
+
+        Args:
+            frame_timestamps (FrameTimestamps): the presentation times of the frames
+        """
+        self._frame_timestamps = frame_timestamps
+
+    def stop_read_ahead(self) -> None:
+        if self._read_ahead is None:
+            return
+        self._read_ahead.stop()
+        self._read_ahead = None
+
+    def get_frame_by_number(
+        self, frame_number: int, scale: float = 1.0
+    ) -> "BackgroundFrame":
+        """Get a frame of the video.
 
-    def get_frame_by_number(self, frame_number: int) -> "BackgroundFrame":
+        Args:
+            frame_number (int): number of the frame
+            scale (float): resolution of the image shown relative to its viewport,
+                the frame itself keeps the full resolution. Defaults to 1.0.
+
+        Returns:
+            BackgroundFrame: the frame
+        """
         frame = self._get_frame_by_number(frame_number)
         unix_timestamp = self.get_timestamp_by_frame_number(frame_number)
         return BackgroundFrame(
@@ -176,6 +352,7 @@ class Video:
             frame_number=frame_number,
             unix_timestamp=unix_timestamp,
             video_file=self.file,
+            scale=scale,
         )
 
     def get_frame_by_timestamp(self, unix_timestamp: float) -> "BackgroundFrame":
@@ -185,29 +362,168 @@ class Video:
         return self.get_frame_by_number(frame_number)
 
     def _get_frame_by_number(self, frame_number: int) -> npt.NDArray:
+        frame = self._get_cached_frame(frame_number)
+        if frame is None:
+            frame = self._get_read_ahead_frame(frame_number)
+            if frame is None:
+                frame = self._decode_frame(frame_number)
+            if self._frame_cache is not None:
+                self._frame_cache.put(self.file, frame_number, frame)
+        if self._read_ahead is not None:
+            self._read_ahead.move_to(frame_number)
+        return frame
+
+    def _get_cached_frame(self, frame_number: int) -> npt.NDArray | None:
+        if self._frame_cache is None:
+            return None
+        return self._frame_cache.get(self.file, frame_number)
+
+    def _get_read_ahead_frame(self, frame_number: int) -> npt.NDArray | None:
+        if self._read_ahead is None:
+            return None
+        return self._read_ahead.get(frame_number)
+
+    def _decode_frame(self, frame_number: int) -> npt.NDArray:
+        frame_index = get_frame_index(frame_number)
+        with self._lock:
+            frame = self._backward_chunk.pop(frame_index, None)
+            if frame is None and self._is_backward_step(frame_index):
+                frame = self._read_backward_chunk(frame_index)
+            if frame is None:
+                self._drop_backward_chunk_before(frame_index)
+                frame = self._read_frame(frame_number)
+        if self._capture_pool is not None:
+            self._capture_pool.mark_used(self.file, self._release_decoder)
+        if frame is None:
+            raise FrameNotFoundInVideoError()
+        return frame
+
+    def _read_frame(self, frame_number: int) -> npt.NDArray | None:
         if frame_number == self._get_current_frame_number() + 1:
             pass
-        elif frame_number == 0:
-            self.cap.release()
-            self._load()
+        elif self._keyframe_index is not None:
+            self._seek_via_keyframe(frame_index=get_frame_index(frame_number))
         else:
-            self.set_frame_number(frame_number - 1)
-        ret, frame = self.cap.read()
-        if not ret:
-            raise FrameNotFoundInVideoError()
-        return frame
+            self.set_frame_number(get_frame_index(frame_number))
+        return self._get_decoder().read()
+
+    def _get_backward_chunk_size(self, frame_index: int) -> int:
+        """Get the number of frames to decode at once when stepping back to a frame.
+
+        The chunk spans the GOP up to the frame, starting at the preceding
+        keyframe, so that stepping backwards decodes each GOP once. It is limited
+        by the memory budget, which also sets its size without a keyframe index.
+
+        Args:
+            frame_index (int): zero based index of the requested frame
+
+        Returns:
+            int: number of frames up to and including the requested one
+        """
+        frame_size_in_bytes = self.get_width() * self.get_height() * 3
+        budget = max(
+            BACKWARD_CHUNK_SIZE_IN_MB * BYTES_PER_MEGABYTE // frame_size_in_bytes, 1
+        )
+        if self._keyframe_index is None:
+            return budget
+        keyframe = self._keyframe_index.get_preceding_keyframe(frame_index)
+        return min(frame_index - keyframe + 1, budget)
+
+    def _is_backward_step(self, frame_index: int) -> bool:
+        if self._decoder is None:
+            return False
+        last_read_frame_index = self._get_current_frame_number() - 1
+        return (
+            0
+            < last_read_frame_index - frame_index
+            <= self._get_backward_chunk_size(frame_index)
+        )
+
+    def _drop_backward_chunk_before(self, frame_index: int) -> None:
+        """Free the frames decoded when stepping backwards once reading moved past
+        them.
+
+        Args:
+            frame_index (int): zero based index of the frame read next
+        """
+        if self._backward_chunk and frame_index > next(reversed(self._backward_chunk)):
+            self._backward_chunk = {}
+
+    def _read_backward_chunk(self, frame_index: int) -> npt.NDArray | None:
+        """Decode the frames up to a frame in one go when stepping backwards.
+
+        Decoding starts at the preceding keyframe, so a whole GOP costs a single
+        seek. The frames before the requested one are kept to serve the next
+        steps backwards.
+
+        Args:
+            frame_index (int): zero based index of the requested frame
+
+        Returns:
+            npt.NDArray | None: the requested frame if it could be decoded
+        """
+        first_frame_index = max(
+            frame_index - self._get_backward_chunk_size(frame_index) + 1, 0
+        )
+        if self._keyframe_index is not None:
+            self._seek_via_keyframe(frame_index=first_frame_index)
+        else:
+            self.set_frame_number(first_frame_index)
+        decoder = self._get_decoder()
+        self._backward_chunk = {}
+        for index in range(first_frame_index, frame_index + 1):
+            frame = decoder.read()
+            if frame is None:
+                break
+            self._backward_chunk[index] = frame
+        return self._backward_chunk.pop(frame_index, None)
+
+    def _seek_via_keyframe(self, frame_index: int) -> None:
+        """Move to a frame by seeking to the preceding keyframe and skipping the
+        frames in between, unless the current position is already in between.
+
+        Keyframes are counted in decode order, so the frames are skipped from the
+        position the decoder reports after seeking instead of from the keyframe.
+
+        Args:
+            frame_index (int): zero based index of the frame to read next
+        """
+        if self._keyframe_index is None:
+            return
+        keyframe = self._keyframe_index.get_preceding_keyframe(frame_index)
+        position = self._get_current_frame_number()
+        if not keyframe <= position <= frame_index:
+            self.set_frame_number(keyframe)
+            position = self._get_current_frame_number()
+        for _ in range(frame_index - position):
+            self._get_decoder().grab()
+
+    def _try_decode_frame(self, frame_number: int) -> npt.NDArray | None:
+        try:
+            return self._decode_frame(frame_number)
+        except FrameNotFoundInVideoError:
+            return None
 
     def _get_current_frame_number(self) -> int:
-        return self.cap.get(cv2.CAP_PROP_POS_FRAMES)
+        return self._get_decoder().get_position()
 
     def get_timestamp_by_frame_number(self, frame_number: int) -> float:
-        return self._start_timestamp + frame_number / self.frame_rate
+        if self._frame_timestamps is not None:
+            return self._start_timestamp + self._frame_timestamps.get_offset(
+                frame_number, frame_duration=1 / self.get_frame_rate()
+            )
+        return self._start_timestamp + frame_number / self.get_frame_rate()
 
     def get_frame_number_by_timestamp(self, unix_timestamp: float) -> int:
         if not self.includes_timestamp(unix_timestamp):
             raise FrameNotFoundInVideoError()
+        if self._frame_timestamps is not None:
+            return self._frame_timestamps.get_frame_number(
+                unix_timestamp - self._start_timestamp,
+                frame_duration=1 / self.get_frame_rate(),
+            )
         return int(
-            round(((unix_timestamp - self._start_timestamp) * self.frame_rate), 0)
+            round(((unix_timestamp - self._start_timestamp) * self.get_frame_rate()), 0)
         )
 
     def get_time_period(self) -> tuple[float, float]:
@@ -221,13 +537,43 @@ class Video:
         return start <= unix_timestamp <= end
 
     def __del__(self):
-        if self.cap:
-            self.cap.release()
+        self.stop_read_ahead()
+        if self._decoder is not None:
+            self._decoder.close()
 
 
 class VideoRepository:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        read_ahead_frames: int = DEFAULT_READ_AHEAD_FRAMES,
+        frame_cache_size_in_mb: int = DEFAULT_FRAME_CACHE_SIZE_IN_MB,
+        max_open_videos: int = DEFAULT_MAX_OPEN_VIDEOS,
+        record_frame_timestamps: bool = DEFAULT_RECORD_FRAME_TIMESTAMPS,
+        decoder_backend: str = DEFAULT_DECODER_BACKEND,
+        decoder_threads: int = DEFAULT_DECODER_THREADS,
+    ) -> None:
         self._videos: dict[str, Video] = {}
+        self._ordered_videos: list[Video] = []
+        self._index_by_name: dict[str, int] = {}
+        self._frame_offsets: list[int] | None = None
+        self._number_of_frames: int = 0
+        self._frame_offsets_lock = threading.Lock()
+        self._start_timestamps: list[float] = []
+        self._videos_by_start_timestamp: list[Video] = []
+        self._read_ahead_frames = read_ahead_frames
+        self._decoder_settings = DecoderSettings(
+            backend=decoder_backend, thread_count=decoder_threads
+        )
+        self._active_video: Video | None = None
+        self._activation_lock = threading.Lock()
+        self._frame_cache = FrameCache(
+            max_size_in_bytes=frame_cache_size_in_mb * BYTES_PER_MEGABYTE
+        )
+        self._keyframe_indexer = KeyframeIndexer()
+        self._frame_timestamp_recorder: FrameTimestampRecorder | None = (
+            FrameTimestampRecorder() if record_frame_timestamps else None
+        )
+        self._capture_pool = CapturePool(max_open_captures=max_open_videos)
 
     def add(self, video: Video) -> None:
         """Add one video to the repository.
@@ -235,7 +581,12 @@ class VideoRepository:
         Args:
             video (Video): the video to add
         """
+        if video.get_full_name() in self._videos:
+            self._add(video)
+            self._rebuild_index()
+            return
         self._add(video)
+        self._index(video)
 
     def add_all(self, videos: Iterable[Video]) -> None:
         """Add several videos at once to the repository.
@@ -246,6 +597,7 @@ class VideoRepository:
         for video in videos:
             self._add(video)
         self._videos = dict(sorted(self._videos.items()))
+        self._rebuild_index()
 
     def _add(self, video: Video) -> None:
         """Internal method to add a video.
@@ -253,12 +605,107 @@ class VideoRepository:
         Args:
             video (Video): the video to be added
         """
+        video.set_decoder_settings(self._decoder_settings)
+        video.set_frame_cache(self._frame_cache)
+        video.set_capture_pool(self._capture_pool)
+        self._keyframe_indexer.request(
+            video_file=video.get_filepath(), on_result=video.set_keyframe_index
+        )
+        if self._frame_timestamp_recorder is not None:
+            self._frame_timestamp_recorder.request(
+                video_file=video.get_filepath(), on_result=video.set_frame_timestamps
+            )
         self._videos[video.get_full_name()] = video
 
-    def get_by_timestamp(self, unix_timestamp: float) -> Video | None:
+    def _index(self, video: Video) -> None:
+        """Append a video to the index of the repository.
+
+        The index holds the order of the videos and the videos sorted by start
+        time. The number of frames before each video is counted again on the next
+        lookup of a frame in the stream of all videos.
+
+        Args:
+            video (Video): the video to append
+        """
+        self._index_by_name[video.get_full_name()] = len(self._ordered_videos)
+        self._ordered_videos.append(video)
+        self._frame_offsets = None
+        position = bisect_right(self._start_timestamps, video.get_start_timestamp())
+        self._start_timestamps.insert(position, video.get_start_timestamp())
+        self._videos_by_start_timestamp.insert(position, video)
+
+    def _rebuild_index(self) -> None:
+        self._clear_index()
         for video in self._videos.values():
+            self._index(video)
+
+    def _clear_index(self) -> None:
+        self._ordered_videos.clear()
+        self._index_by_name.clear()
+        self._frame_offsets = None
+        self._start_timestamps.clear()
+        self._videos_by_start_timestamp.clear()
+
+    def _get_frame_offsets(self) -> list[int]:
+        """Get the number of frames before each video, counted on first use.
+
+        Counting the frames reads the metadata of every video, which is left to
+        the first lookup of a frame in the stream of all videos, so that adding
+        videos does not wait for it.
+
+        Returns:
+            list[int]: the number of frames before each video in their order
+        """
+        frame_offsets = self._frame_offsets
+        if frame_offsets is not None:
+            return frame_offsets
+        with self._frame_offsets_lock:
+            if self._frame_offsets is None:
+                frame_offsets = []
+                number_of_frames = 0
+                for video in self._ordered_videos:
+                    frame_offsets.append(number_of_frames)
+                    number_of_frames += video.get_number_of_frames()
+                self._number_of_frames = number_of_frames
+                self._frame_offsets = frame_offsets
+            return self._frame_offsets
+
+    def _activate(self, video: Video) -> Video:
+        """Let only the video handed out last decode frames ahead.
+
+        Args:
+            video (Video): the video frames are requested from next
+
+        Returns:
+            Video: the activated video
+        """
+        with self._activation_lock:
+            if video is not self._active_video:
+                if self._active_video is not None:
+                    self._active_video.stop_read_ahead()
+                video.start_read_ahead(self._read_ahead_frames)
+                self._active_video = video
+        return video
+
+    def get_by_timestamp(self, unix_timestamp: float) -> Video | None:
+        """Get the video recorded at a timestamp.
+
+        The videos are expected not to overlap in time. Of videos starting at the
+        same time the first one including the timestamp is returned.
+
+        Args:
+            unix_timestamp (float): the timestamp
+
+        Returns:
+            Video | None: the video or None if no video includes the timestamp
+        """
+        end = bisect_right(self._start_timestamps, unix_timestamp)
+        if end == 0:
+            return None
+        start = bisect_left(self._start_timestamps, self._start_timestamps[end - 1])
+        for video in self._videos_by_start_timestamp[start:end]:
             if video.includes_timestamp(unix_timestamp):
-                return video
+                return self._activate(video)
         return None
 
     def get_video_and_frame_by_delta_frame_or_time(
@@ -268,7 +715,7 @@ class VideoRepository:
         delta_of_frames: int = 0,
         delta_of_time: float = 0,
     ) -> tuple[Video, int]:
-        current_video = self.get_video_by_name(file_name=current_file_name)
+        current_video = self._videos[current_file_name]
         delta_of_frames += round(delta_of_time * current_video.get_frame_rate())
         return self.get_video_and_frame_by_delta_frame(
             current_file_name=current_file_name,
@@ -282,81 +729,219 @@ class VideoRepository:
         current_frame_number: int,
         delta_of_frames: int = 0,
     ) -> tuple[Video, int]:
-        current_video = self.get_video_by_name(file_name=current_file_name)
+        video, frame_number = self._get_video_and_frame_by_delta_frame(
+            current_file_name=current_file_name,
+            current_frame_number=current_frame_number,
+            delta_of_frames=delta_of_frames,
+        )
+        return self._activate(video), frame_number
 
-        new_frame_number = current_frame_number + delta_of_frames
-        current_video_number_of_frames = current_video.get_number_of_frames()
+    def _get_video_and_frame_by_delta_frame(
+        self,
+        current_file_name: str,
+        current_frame_number: int,
+        delta_of_frames: int = 0,
+    ) -> tuple[Video, int]:
+        """Move by a number of frames through the concatenated videos.
 
-        if 0 <= new_frame_number < current_video_number_of_frames:
-            return current_video, new_frame_number
+        Steps beyond the first or last frame of all videos stop at that frame.
 
-        if new_frame_number < 0:
-            return self._try_get_by_delta_from_previous(
-                current_video=current_video,
-                current_frame_number=current_frame_number,
-                delta_of_frames=delta_of_frames,
-            )
-        else:
-            return self._try_get_by_delta_from_next(
-                current_video=current_video,
-                current_frame_number=current_frame_number,
-                delta_of_frames=delta_of_frames,
-            )
+        Args:
+            current_file_name (str): name of the current video
+            current_frame_number (int): number of the current frame in the video
+            delta_of_frames (int): number of frames to move
 
-    def _try_get_by_delta_from_next(
-        self, current_video: Video, current_frame_number: int, delta_of_frames: int
-    ):
-        if self.is_last_video(current_video):
-            return current_video, current_video.get_number_of_frames() - 1
-        current_video_index = self._get_index_by_video(current_video)
-        new_video_index = current_video_index + 1
-        new_video = self._get_video_by_index(new_video_index)
-        new_delta_of_frames = delta_of_frames - (
-            current_video.get_number_of_frames() - current_frame_number
+        Returns:
+            tuple[Video, int]: the new video and the frame number in it
+        """
+        target = (
+            self.get_global_frame_number(current_file_name, current_frame_number)
+            + delta_of_frames
         )
-        return self.get_video_and_frame_by_delta_frame(
-            current_file_name=new_video.get_full_name(),
-            current_frame_number=0,
-            delta_of_frames=new_delta_of_frames,
+        return self.get_video_and_frame_by_global_frame_number(
+            min(max(target, 0), self.get_number_of_frames() - 1)
         )
 
-    def _try_get_by_delta_from_previous(
-        self, current_video: Video, current_frame_number: int, delta_of_frames: int
-    ):
-        current_video_index = self._get_index_by_video(current_video)
-        new_video_index = current_video_index - 1
-        if new_video_index < 0:
-            return self._get_video_by_index(current_video_index), 0
-        new_video = self._get_video_by_index(new_video_index)
-        new_delta_of_frames = delta_of_frames + current_frame_number
-        return self.get_video_and_frame_by_delta_frame(
-            current_file_name=new_video.get_full_name(),
-            current_frame_number=new_video.get_number_of_frames(),
-            delta_of_frames=new_delta_of_frames,
+    def get_global_frame_number_by_delta(
+        self,
+        global_frame_number: int,
+        delta_of_frames: int = 0,
+        delta_of_time: float = 0,
+    ) -> int:
+        """Move by a number of frames or seconds through the stream of all videos.
+
+        Seconds are converted to frames with the frame rate of the video of the
+        start frame. Steps beyond the first or last frame stop at that frame.
+
+        Args:
+            global_frame_number (int): number of the start frame in the stream
+            delta_of_frames (int): number of frames to move
+            delta_of_time (float): number of seconds to move
+
+        Returns:
+            int: number of the reached frame in the stream
+        """
+        video, _ = self.get_video_and_frame_by_global_frame_number(global_frame_number)
+        delta_of_frames += round(delta_of_time * video.get_frame_rate())
+        return min(
+            max(global_frame_number + delta_of_frames, 0),
+            self.get_number_of_frames() - 1,
         )
 
-    def is_last_video(self, current_video: Video) -> bool:
-        current_video_index = self._get_index_by_video(current_video)
-        new_video_index = current_video_index + 1
-        return new_video_index > len(self._videos) - 1
+    def get_number_of_frames(self) -> int:
+        """Get the number of frames of all videos concatenated to one stream.
+
+        Returns:
+            int: the number of frames
+        """
+        self._get_frame_offsets()
+        return self._number_of_frames
+
+    def get_global_frame_number(self, file_name: str, frame_number: int) -> int:
+        """Get the number of a frame in the stream of all videos.
+
+        Args:
+            file_name (str): name of the video
+            frame_number (int): number of the frame in the video
+
+        Returns:
+            int: number of the frame in the stream of all videos
+        """
+        return self._get_frame_offsets()[self._index_by_name[file_name]] + frame_number
 
-    def _get_video_by_index(self, index: int) -> Video:
-        return list(self._videos.values())[index]
+    def get_video_and_frame_by_global_frame_number(
+        self, global_frame_number: int
+    ) -> tuple[Video, int]:
+        """Get the video and its frame of a frame in the stream of all videos.
 
-    def _get_index_by_file_name(self, file_name: str) -> int:
-        return list(self._videos.keys()).index(file_name)
+        Args:
+            global_frame_number (int): number of the frame in the stream
 
-    def _get_index_by_video(self, video: Video) -> int:
-        return list(self._videos.values()).index(video)
+        Raises:
+            FrameNotFoundInVideoError: if the stream has no such frame
+
+        Returns:
+            tuple[Video, int]: the video and the number of the frame in it
+        """
+        frame_offsets = self._get_frame_offsets()
+        number_of_frames = self.get_number_of_frames()
+        if not 0 <= global_frame_number < number_of_frames:
+            raise FrameNotFoundInVideoError(
+                f"Frame {global_frame_number} not in the {number_of_frames} "
+                "frames of all videos"
+            )
+        index = bisect_right(frame_offsets, global_frame_number) - 1
+        return (
+            self._ordered_videos[index],
+            global_frame_number - frame_offsets[index],
+        )
+
+    def get_timestamp_by_global_frame_number(self, global_frame_number: int) -> float:
+        video, frame_number = self.get_video_and_frame_by_global_frame_number(
+            global_frame_number
+        )
+        return video.get_timestamp_by_frame_number(frame_number)
+
+    def get_global_frame_number_by_timestamp(self, unix_timestamp: float) -> int:
+        """Get the frame of the stream of all videos recorded at a timestamp.
+
+        Args:
+            unix_timestamp (float): the timestamp
+
+        Raises:
+            TimestampNotFoundInVideosError: if no video includes the timestamp
+
+        Returns:
+            int: number of the frame in the stream
+        """
+        video = self.get_by_timestamp(unix_timestamp)
+        if video is None:
+            raise TimestampNotFoundInVideosError
+        frame_number = min(
+            video.get_frame_number_by_timestamp(unix_timestamp),
+            video.get_number_of_frames() - 1,
+        )
+        return self.get_global_frame_number(video.get_full_name(), frame_number)
+
+    def iter_global_frames(
+        self, start: int, stop: int, step: int = 1
+    ) -> Iterator[tuple[Video, int]]:
+        """Iterate over a range of frames of the stream of all videos.
+
+        The range is limited to the frames of the stream.
+
+        Args:
+            start (int): first frame of the range
+            stop (int): frame after the last frame of the range
+            step (int): positive distance between two frames
+
+        Yields:
+            Iterator[tuple[Video, int]]: each video and the number of the frame in it
+        """
+        frame_offsets = self._get_frame_offsets()
+        stop = min(stop, self.get_number_of_frames())
+        global_frame_number = max(start, 0)
+        if global_frame_number >= stop:
+            return
+        index = bisect_right(frame_offsets, global_frame_number) - 1
+        while global_frame_number < stop:
+            while global_frame_number >= self._get_end_of_video(index):
+                index += 1
+            yield (
+                self._ordered_videos[index],
+                global_frame_number - frame_offsets[index],
+            )
+            global_frame_number += step
+
+    def _get_end_of_video(self, index: int) -> int:
+        frame_offsets = self._get_frame_offsets()
+        if index + 1 < len(frame_offsets):
+            return frame_offsets[index + 1]
+        return self.get_number_of_frames()
+
+    def is_last_video(self, current_video: Video) -> bool:
+        return (
+            self._index_by_name[current_video.get_full_name()]
+            == len(self._ordered_videos) - 1
+        )
+
+    def to_list(self) -> list[Video]:
+        return list(self._ordered_videos)
 
     def get_video_by_name(self, file_name: str) -> Video:
-        return self._videos[file_name]
+        return self._activate(self._videos[file_name])
+
+    def get_frame_rate_of_video(self, file_name: str) -> float:
+        """Get the frame rate of a video without requesting frames from it.
+
+        Args:
+            file_name (str): name of the video
+
+        Returns:
+            float: the frame rate
+        """
+        return self._videos[file_name].get_frame_rate()
 
     def get_first_video(self) -> Video:
-        return list(self._videos.values())[0]
+        return self._activate(self._ordered_videos[0])
+
+    def get_frame_cache_statistics(self) -> FrameCacheStatistics:
+        return self._frame_cache.get_statistics()
+
+    def get_decoder_settings(self) -> DecoderSettings:
+        return self._decoder_settings
 
     def is_empty(self) -> bool:
         return not self._videos
 
     def clear(self):
+        if self._active_video is not None:
+            self._active_video.stop_read_ahead()
+            self._active_video = None
         self._videos.clear()
+        self._clear_index()
+        self._frame_cache.clear()
+        self._keyframe_indexer.cancel_pending()
+        if self._frame_timestamp_recorder is not None:
+            self._frame_timestamp_recorder.cancel_pending()
+        self._capture_pool.close_all()
@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from OTGroundTruther.model.config import VIDEO_METADATA_FILE_SUFFIX
+from OTGroundTruther.model.decoder import DecoderSettings, VideoDecoder
+from OTGroundTruther.model.video_sidecar import read_sidecar, write_sidecar
+
+
+class NumberOfFramesUnknownError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class VideoMetadata:
+    frame_rate: float
+    number_of_frames: int
+    width: int
+    height: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(content: dict) -> "VideoMetadata":
+        return VideoMetadata(
+            frame_rate=float(content["frame_rate"]),
+            number_of_frames=int(content["number_of_frames"]),
+            width=int(content["width"]),
+            height=int(content["height"]),
+        )
+
+
+def load_video_metadata(
+    file: Path, decoder_settings: DecoderSettings = DecoderSettings()
+) -> VideoMetadata:
+    """Get the metadata of a video from its sidecar file or by probing the video.
+
+    Probed metadata is saved as sidecar file for the next start.
+
+    Args:
+        file (Path): the video file
+        decoder_settings (DecoderSettings): decoder to probe the video with
+
+    Returns:
+        VideoMetadata: the metadata of the video
+    """
+    metadata = _read_cached_video_metadata(file)
+    if metadata is not None:
+        return metadata
+    metadata = probe_video_metadata(file, decoder_settings)
+    write_sidecar(file, VIDEO_METADATA_FILE_SUFFIX, metadata.to_dict())
+    return metadata
+
+
+def load_all_video_metadata(
+    files: list[Path],
+    on_progress: Callable[[int, int], None] | None = None,
+    decoder_settings: DecoderSettings = DecoderSettings(),
+) -> dict[Path, VideoMetadata]:
+    """Get the metadata of several videos.
+
+    Videos without valid sidecar file are probed in parallel processes.
+
+    Args:
+        files (list[Path]): the video files
+        on_progress (Callable[[int, int], None] | None): called with the number of
+            videos done and the total number of videos after each video
+        decoder_settings (DecoderSettings): decoder to probe the videos with
+
+    Returns:
+        dict[Path, VideoMetadata]: the metadata of each video
+    """
+    all_metadata: dict[Path, VideoMetadata] = {}
+    files_to_probe: list[Path] = []
+    for file in files:
+        metadata = _read_cached_video_metadata(file)
+        if metadata is None:
+            files_to_probe.append(file)
+        else:
+            all_metadata[file] = metadata
+    _report_progress(on_progress, len(all_metadata), len(files))
+    if len(files_to_probe) < 2:
+        for file in files_to_probe:
+            all_metadata[file] = load_video_metadata(file, decoder_settings)
+            _report_progress(on_progress, len(all_metadata), len(files))
+        return all_metadata
+    with ProcessPoolExecutor(
+        max_workers=min(len(files_to_probe), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = {
+            executor.submit(load_video_metadata, file, decoder_settings): file
+            for file in files_to_probe
+        }
+        for future in as_completed(futures):
+            all_metadata[futures[future]] = future.result()
+            _report_progress(on_progress, len(all_metadata), len(files))
+    return all_metadata
+
+
+def _report_progress(
+    on_progress: Callable[[int, int], None] | None, done: int, total: int
+) -> None:
+    if on_progress is not None:
+        on_progress(done, total)
+
+
+def _read_cached_video_metadata(file: Path) -> VideoMetadata | None:
+    content = read_sidecar(file, VIDEO_METADATA_FILE_SUFFIX)
+    if content is None:
+        return None
+    try:
+        return VideoMetadata.from_dict(content)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def probe_video_metadata(
+    file: Path, decoder_settings: DecoderSettings = DecoderSettings()
+) -> VideoMetadata:
+    """Open a video and read its metadata.
+
+    The frame count reported by the container is not reliable, so the frames
+    around it are decoded to find the actual end of the video.
+
+    Args:
+        file (Path): the video file
+        decoder_settings (DecoderSettings): decoder to probe the video with
+
+    Raises:
+        ValueError: if the video can not be opened
+
+    Returns:
+        VideoMetadata: the metadata of the video
+    """
+    decoder = decoder_settings.open(file)
+    try:
+        return VideoMetadata(
+            frame_rate=decoder.get_frame_rate(),
+            number_of_frames=_probe_number_of_frames(decoder),
+            width=decoder.get_width(),
+            height=decoder.get_height(),
+        )
+    finally:
+        decoder.close()
+
+
+def _probe_number_of_frames(decoder: VideoDecoder) -> int:
+    calculated_frame_count = decoder.get_frame_count()
+    last_frame_number = calculated_frame_count + 3
+    for frame_number in range(calculated_frame_count - 3, last_frame_number):
+        if not _can_read_frame(decoder, frame_number):
+            if frame_number == calculated_frame_count - 3:
+                raise NumberOfFramesUnknownError
+            return frame_number
+    return last_frame_number
+
+
+def _can_read_frame(decoder: VideoDecoder, frame_number: int) -> bool:
+    if frame_number != decoder.get_position() + 1:
+        decoder.seek(max(frame_number - 1, 0))
+    return decoder.read() is not None
@@ -0,0 +1,103 @@
+import atexit
+import queue
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class VideoScanAbortedError(Exception):
+    pass
+
+
+class VideoScanner(ABC, Generic[T]):
+    """Provides videos with information found by scanning them.
+
+    Results are read from sidecar files next to the videos. Missing results are
+    found by scanning the videos one after another in a background thread and
+    saved as sidecar files for the next start.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[Path, Callable[[T], None]] | None] = (
+            queue.Queue()
+        )
+        self._thread: threading.Thread | None = None
+        self._stopped: bool = False
+        atexit.register(self.stop)
+
+    def request(self, video_file: Path, on_result: Callable[[T], None]) -> None:
+        """Request the result of scanning a video.
+
+        Args:
+            video_file (Path): the video to scan
+            on_result (Callable[[T], None]): called with the result once it is
+                available, never called if the video can not be scanned
+        """
+        result = self._read_sidecar(video_file)
+        if result is not None:
+            on_result(result)
+            return
+        self._start()
+        self._queue.put((video_file, on_result))
+
+    def cancel_pending(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def stop(self) -> None:
+        self._stopped = True
+        self.cancel_pending()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            if request is None or self._stopped:
+                return
+            video_file, on_result = request
+            try:
+                result = self._scan(video_file)
+            except VideoScanAbortedError:
+                return
+            if result is None:
+                print(f"Could not scan {video_file}")
+                continue
+            self._write_sidecar(video_file, result)
+            on_result(result)
+
+    def _raise_if_stopped(self) -> None:
+        """Abort a running scan once the scanner is stopped.
+
+        Raises:
+            VideoScanAbortedError: if the scanner was stopped
+        """
+        if self._stopped:
+            raise VideoScanAbortedError
+
+    @abstractmethod
+    def _read_sidecar(self, video_file: Path) -> T | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_sidecar(self, video_file: Path, result: T) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _scan(self, video_file: Path) -> T | None:
+        raise NotImplementedError
@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from OTGroundTruther.model.parse import parse, write_json
+
+FINGERPRINT: str = "fingerprint"
+FILE_SIZE: str = "file_size"
+MODIFICATION_TIME: str = "modification_time_ns"
+CONTENT: str = "content"
+ARRAY: str = "array"
+
+
+def get_sidecar_file(video_file: Path, suffix: str) -> Path:
+    """Get the path of a sidecar file stored next to a video.
+
+    Args:
+        video_file (Path): the video file
+        suffix (str): suffix of the sidecar file
+
+    Returns:
+        Path: the sidecar file
+    """
+    return video_file.with_suffix(suffix)
+
+
+def get_fingerprint(video_file: Path) -> dict[str, int]:
+    """Get size and modification time of a video to detect changed files.
+
+    Args:
+        video_file (Path): the video file
+
+    Returns:
+        dict[str, int]: size and modification time of the video
+    """
+    stat = video_file.stat()
+    return {FILE_SIZE: stat.st_size, MODIFICATION_TIME: stat.st_mtime_ns}
+
+
+def read_sidecar(video_file: Path, suffix: str) -> dict | None:
+    """Read the content of a sidecar file.
+
+    Args:
+        video_file (Path): the video file the sidecar belongs to
+        suffix (str): suffix of the sidecar file
+
+    Returns:
+        dict | None: the content or None if the sidecar is missing, unreadable or
+            the video changed since the sidecar was written
+    """
+    sidecar_file = get_sidecar_file(video_file, suffix)
+    if not sidecar_file.exists():
+        return None
+    try:
+        data = parse(sidecar_file)
+        fingerprint = get_fingerprint(video_file)
+    except (OSError, ValueError):
+        return None
+    if data.get(FINGERPRINT) != fingerprint:
+        return None
+    return data.get(CONTENT)
+
+
+def write_sidecar(video_file: Path, suffix: str, content: dict) -> None:
+    """Write content to a sidecar file.
+
+    Failing to write the sidecar, e.g. on a read only drive, is not an error as
+    sidecars only save work on the next start.
+
+    Args:
+        video_file (Path): the video file the sidecar belongs to
+        suffix (str): suffix of the sidecar file
+        content (dict): the content to write
+    """
+    sidecar_file = get_sidecar_file(video_file, suffix)
+    try:
+        write_json(
+            data={FINGERPRINT: get_fingerprint(video_file), CONTENT: content},
+            path=sidecar_file,
+        )
+    except OSError:
+        print(f"Could not write {sidecar_file}")
+
+
+def read_array_sidecar(video_file: Path, suffix: str) -> npt.NDArray | None:
+    """Read an array from a binary sidecar file.
+
+    Args:
+        video_file (Path): the video file the sidecar belongs to
+        suffix (str): suffix of the sidecar file
+
+    Returns:
+        npt.NDArray | None: the array or None if the sidecar is missing,
+            unreadable or the video changed since the sidecar was written
+    """
+    sidecar_file = get_sidecar_file(video_file, suffix)
+    if not sidecar_file.exists():
+        return None
+    try:
+        with np.load(sidecar_file) as data:
+            fingerprint = dict(zip([FILE_SIZE, MODIFICATION_TIME], data[FINGERPRINT]))
+            if fingerprint != get_fingerprint(video_file):
+                return None
+            return data[ARRAY]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_array_sidecar(video_file: Path, suffix: str, array: npt.NDArray) -> None:
+    """Write an array to a compressed binary sidecar file.
+
+    Args:
+        video_file (Path): the video file the sidecar belongs to
+        suffix (str): suffix of the sidecar file
+        array (npt.NDArray): the array to write
+    """
+    sidecar_file = get_sidecar_file(video_file, suffix)
+    fingerprint = get_fingerprint(video_file)
+    try:
+        with open(sidecar_file, "wb") as file:
+            np.savez_compressed(
+                file,
+                fingerprint=np.array(
+                    [fingerprint[FILE_SIZE], fingerprint[MODIFICATION_TIME]],
+                    dtype=np.int64,
+                ),
+                array=array,
+            )
+    except OSError:
+        print(f"Could not write {sidecar_file}")
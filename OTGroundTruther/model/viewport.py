@@ -0,0 +1,247 @@
+from dataclasses import dataclass, replace
+
+import cv2
+import numpy.typing as npt
+
+from OTGroundTruther.model.coordinate import Coordinate
+from OTGroundTruther.model.overlay_layer import Region
+
+MAX_ZOOM: float = 8.0
+"""Largest zoom relative to the whole frame fitted into the canvas."""
+MAX_FIT_SCALE: float = 1.0
+"""Largest scale a frame is shown at without zooming, small videos are not
+enlarged."""
+DOWNSCALE_INTERPOLATION: int = cv2.INTER_LINEAR
+UPSCALE_INTERPOLATION: int = cv2.INTER_NEAREST
+"""Zoomed in frames show their pixels sharply to place events precisely."""
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """The part of a frame shown and the scale it is shown at.
+
+    Args:
+        region (Region): the visible part of the frame in video pixels
+        scale (float): image pixels per video pixel
+    """
+
+    region: Region
+    scale: float = 1.0
+
+    @staticmethod
+    def of_frame(width: int, height: int) -> "Viewport":
+        return Viewport(region=Region(left=0, top=0, right=width, bottom=height))
+
+    def get_width(self) -> int:
+        return max(round((self.region.right - self.region.left) * self.scale), 1)
+
+    def get_height(self) -> int:
+        return max(round((self.region.bottom - self.region.top) * self.scale), 1)
+
+    def rescale(self, factor: float) -> "Viewport":
+        """Get the viewport showing the same region at another resolution.
+
+        Args:
+            factor (float): factor to multiply the scale with
+
+        Returns:
+            Viewport: the rescaled viewport
+        """
+        if factor == 1:
+            return self
+        return Viewport(region=self.region, scale=self.scale * factor)
+
+    def to_image(self, coordinate: Coordinate) -> Coordinate:
+        """Convert video pixel coordinates into image pixel coordinates.
+
+        Args:
+            coordinate (Coordinate): the coordinate in the video
+
+        Returns:
+            Coordinate: the coordinate in the image
+        """
+        return Coordinate(
+            x=round((coordinate.x - self.region.left) * self.scale),
+            y=round((coordinate.y - self.region.top) * self.scale),
+        )
+
+    def to_video(self, x: float, y: float) -> Coordinate:
+        """Convert image pixel coordinates into video pixel coordinates.
+
+        Args:
+            x (float): x in the image
+            y (float): y in the image
+
+        Returns:
+            Coordinate: the coordinate in the video
+        """
+        return Coordinate(
+            x=round(self.region.left + x / self.scale),
+            y=round(self.region.top + y / self.scale),
+        )
+
+    def render(self, frame: npt.NDArray) -> npt.NDArray:
+        """Cut the region out of a frame and resize it to the scale.
+
+        Args:
+            frame (npt.NDArray): the whole frame
+
+        Returns:
+            npt.NDArray: the image, a view of the frame if it is not resized
+        """
+        image = frame[self.region.get_slices()]
+        if self.scale == 1:
+            return image
+        return cv2.resize(
+            image,
+            dsize=(self.get_width(), self.get_height()),
+            interpolation=(
+                DOWNSCALE_INTERPOLATION if self.scale < 1 else UPSCALE_INTERPOLATION
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class ViewportSettings:
+    """Where the user zoomed and panned to on a canvas of a given size.
+
+    Frames are fitted into the canvas and enlarged by the zoom. The center is
+    relative to the frame size, so that the settings apply to videos of any
+    resolution. Without a canvas size frames are shown whole at full resolution.
+
+    Args:
+        canvas_width (int): width of the canvas, 0 if not known yet
+        canvas_height (int): height of the canvas, 0 if not known yet
+        zoom (float): enlargement of the fitted frame, at least 1
+        center_x (float): horizontal center of the visible part between 0 and 1
+        center_y (float): vertical center of the visible part between 0 and 1
+    """
+
+    canvas_width: int = 0
+    canvas_height: int = 0
+    zoom: float = 1.0
+    center_x: float = 0.5
+    center_y: float = 0.5
+
+    def get_viewport(self, frame_width: int, frame_height: int) -> Viewport:
+        """Get the part of a frame to show and its scale.
+
+        Args:
+            frame_width (int): width of the frame in video pixels
+            frame_height (int): height of the frame in video pixels
+
+        Returns:
+            Viewport: the viewport inside the frame
+        """
+        if not self._has_canvas():
+            return Viewport.of_frame(frame_width, frame_height)
+        scale = self._get_fit_scale(frame_width, frame_height) * self.zoom
+        width = min(round(self.canvas_width / scale), frame_width)
+        height = min(round(self.canvas_height / scale), frame_height)
+        left = self._get_start(self.center_x * frame_width, width, frame_width)
+        top = self._get_start(self.center_y * frame_height, height, frame_height)
+        return Viewport(
+            region=Region(left=left, top=top, right=left + width, bottom=top + height),
+            scale=scale,
+        )
+
+    def _has_canvas(self) -> bool:
+        return self.canvas_width > 0 and self.canvas_height > 0
+
+    def _get_fit_scale(self, frame_width: int, frame_height: int) -> float:
+        return min(
+            self.canvas_width / frame_width,
+            self.canvas_height / frame_height,
+            MAX_FIT_SCALE,
+        )
+
+    def _get_start(self, center: float, length: int, frame_length: int) -> int:
+        return min(max(round(center - length / 2), 0), frame_length - length)
+
+    def resize(self, canvas_width: int, canvas_height: int) -> "ViewportSettings":
+        return replace(self, canvas_width=canvas_width, canvas_height=canvas_height)
+
+    def zoom_at(
+        self,
+        factor: float,
+        x: float,
+        y: float,
+        frame_width: int,
+        frame_height: int,
+    ) -> "ViewportSettings":
+        """Zoom keeping the point under the cursor in place.
+
+        Args:
+            factor (float): factor to multiply the zoom with
+            x (float): x of the cursor on the canvas
+            y (float): y of the cursor on the canvas
+            frame_width (int): width of the frame shown in video pixels
+            frame_height (int): height of the frame shown in video pixels
+
+        Returns:
+            ViewportSettings: the zoomed settings
+        """
+        if not self._has_canvas():
+            return self
+        viewport = self.get_viewport(frame_width, frame_height)
+        zoom = min(max(self.zoom * factor, 1.0), MAX_ZOOM)
+        scale = viewport.scale * zoom / self.zoom
+        cursor_x = viewport.region.left + x / viewport.scale
+        cursor_y = viewport.region.top + y / viewport.scale
+        return self._centered_at(
+            center_x=cursor_x + (self.canvas_width / 2 - x) / scale,
+            center_y=cursor_y + (self.canvas_height / 2 - y) / scale,
+            zoom=zoom,
+            frame_width=frame_width,
+            frame_height=frame_height,
+        )
+
+    def pan(
+        self, delta_x: float, delta_y: float, frame_width: int, frame_height: int
+    ) -> "ViewportSettings":
+        """Move the visible part of the frame with the cursor.
+
+        Args:
+            delta_x (float): horizontal movement of the cursor on the canvas
+            delta_y (float): vertical movement of the cursor on the canvas
+            frame_width (int): width of the frame shown in video pixels
+            frame_height (int): height of the frame shown in video pixels
+
+        Returns:
+            ViewportSettings: the moved settings
+        """
+        if not self._has_canvas():
+            return self
+        scale = self._get_fit_scale(frame_width, frame_height) * self.zoom
+        return self._centered_at(
+            center_x=self.center_x * frame_width - delta_x / scale,
+            center_y=self.center_y * frame_height - delta_y / scale,
+            zoom=self.zoom,
+            frame_width=frame_width,
+            frame_height=frame_height,
+        )
+
+    def _centered_at(
+        self,
+        center_x: float,
+        center_y: float,
+        zoom: float,
+        frame_width: int,
+        frame_height: int,
+    ) -> "ViewportSettings":
+        """Get the settings centered as close to a point as the frame allows.
+
+        The center is kept where the visible part lies inside the frame, so that
+        moving beyond the border of the frame is not accumulated.
+        """
+        scale = self._get_fit_scale(frame_width, frame_height) * zoom
+        half_width = min(self.canvas_width / scale, frame_width) / 2
+        half_height = min(self.canvas_height / scale, frame_height) / 2
+        return replace(
+            self,
+            zoom=zoom,
+            center_x=min(max(center_x, half_width), frame_width - half_width)
+            / frame_width,
+            center_y=min(max(center_y, half_height), frame_height - half_height)
+            / frame_height,
+        )
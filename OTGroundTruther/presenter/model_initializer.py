@@ -7,6 +7,7 @@ from OTGroundTruther.model.model import Model
 from OTGroundTruther.model.road_user_class import ValidRoadUserClasses
 from OTGroundTruther.model.section import SectionParser, SectionRepository
 from OTGroundTruther.model.video import Video, VideoRepository
+from OTGroundTruther.model.video_metadata import load_all_video_metadata
 
 ROAD_USER_CLASSES_YAML_FILE: Path = Path(r"OTGroundTruther/road_user_classes_v1_2.yaml")
 
@@ -15,10 +16,11 @@ class ModelInitializer:
     def __init__(self) -> None:
         parser = CliArgumentParser()
         cli_args: CliArguments = parser.parse()
+        self._cli_args = cli_args
         self._valid_road_user_classes: ValidRoadUserClasses = (
             ValidRoadUserClasses.from_yaml(ROAD_USER_CLASSES_YAML_FILE)
         )
-        self._create_repositories()
+        self._create_repositories(cli_args)
         self._prefill_repositories(cli_args)
         active_count = None
         self._model = Model(
@@ -29,8 +31,15 @@ class ModelInitializer:
             valid_road_user_classes=self._valid_road_user_classes,
         )
 
-    def _create_repositories(self) -> None:
-        self._video_repository = VideoRepository()
+    def _create_repositories(self, cli_args: CliArguments) -> None:
+        self._video_repository = VideoRepository(
+            read_ahead_frames=cli_args.read_ahead_frames,
+            frame_cache_size_in_mb=cli_args.frame_cache_size_in_mb,
+            max_open_videos=cli_args.max_open_videos,
+            record_frame_timestamps=cli_args.record_frame_timestamps,
+            decoder_backend=cli_args.decoder_backend,
+            decoder_threads=cli_args.decoder_threads,
+        )
         self._section_repository = SectionRepository()
         self._count_repository = CountRepository()
 
@@ -46,9 +55,20 @@ class ModelInitializer:
     def _prefill_video_repository(self, files: set[Path]) -> None:
         files_list: list[Path] = list(files)
         files_list.sort()
-        video_files = [Video(file) for file in files_list]
+        all_metadata = load_all_video_metadata(
+            files=files_list,
+            on_progress=self._print_video_loading_progress,
+            decoder_settings=self._video_repository.get_decoder_settings(),
+        )
+        video_files = [Video(file, metadata=all_metadata[file]) for file in files_list]
         self._video_repository.add_all(video_files)
 
+    @staticmethod
+    def _print_video_loading_progress(
+        number_of_loaded_videos: int, number_of_videos: int
+    ) -> None:
+        print(f"Videos loaded: {number_of_loaded_videos}/{number_of_videos}")
+
     def _prefill_section_repository(self, file: Path) -> None:
         sections, otanalytics_file_content = SectionParser().parse(file)
         self._section_repository.add_all(sections)
@@ -64,3 +84,6 @@ class ModelInitializer:
 
     def get(self) -> Model:
         return self._model
+
+    def get_cli_arguments(self) -> CliArguments:
+        return self._cli_args
@@ -1,20 +1,30 @@
 from pathlib import Path
 from tkinter.filedialog import askopenfilename, askopenfilenames, asksaveasfilename
 
+from OTGroundTruther.gui.constants import FACTOR_LARGE_SCROLLING
 from OTGroundTruther.gui.gui import Gui
 from OTGroundTruther.gui.presenter_interface import PresenterInterface
+from OTGroundTruther.model.coalescing_worker import CoalescingWorker
 from OTGroundTruther.model.config import (
     DEFAULT_VIDEO_FILE_SUFFIX,
     GROUND_TRUTH_EVENTS_FILE_SUFFIX,
     OTANALYTICS_FILE_SUFFIX,
     OTEVENTS_FILE_SUFFIX,
 )
-from OTGroundTruther.model.coordinate import Coordinate
-from OTGroundTruther.model.count import MissingRoadUserClassError, TooFewEventsError
+from OTGroundTruther.model.count import (
+    CountRepository,
+    MissingRoadUserClassError,
+    TooFewEventsError,
+)
 from OTGroundTruther.model.model import Model
-from OTGroundTruther.model.overlayed_frame import OverlayedFrame
+from OTGroundTruther.model.overlayed_frame import OverlayedFrame, RenderedFrame
+from OTGroundTruther.model.playback import PlaybackClock
 
 MAX_SCROLL_STEP: int = 50
+SCRUB_SCALE: float = 0.25
+SCRUB_SETTLE_DELAY_MS: int = 200
+TIMELINE_REFRESH_INTERVAL_MS: int = 1000
+RENDER_POLL_INTERVAL_MS: int = 5
 
 
 class Presenter(PresenterInterface):
@@ -22,6 +32,14 @@ class Presenter(PresenterInterface):
         self._model = model
         self._gui = Gui(presenter=self)
         self._current_frame: OverlayedFrame | None = None
+        self._settle_job: str | None = None
+        self._timeline_refresh_job: str | None = None
+        self._playback_clock = PlaybackClock()
+        self._playback_job: str | None = None
+        self._playback_position: int | None = None
+        self._render_worker: CoalescingWorker[RenderedFrame] = CoalescingWorker()
+        self._render_poll_job: str | None = None
+        self._navigation_target: int | None = None
 
     def run_gui(self) -> None:
         self._gui.run()
@@ -30,15 +48,14 @@ class Presenter(PresenterInterface):
         self._gui.frame_treeview.combobox_counts.fill_and_set(
             class_names=self._model._valid_road_user_classes.get_class_names()
         )
+        self.refresh_treeview()
         if self._model._video_repository.is_empty():
             return
         self._display_first_frame()
+        self._start_thumbnail_timeline()
         if self._model._section_repository.is_empty():
             return
         self._refresh_current_frame()
-        self.refresh_treeview()
-
-        # TODO: Also refresh when count_repository not empty
 
     def load_video_files(self) -> None:
         output_askfile = askopenfilenames(
@@ -48,8 +65,68 @@ class Presenter(PresenterInterface):
             ],
         )
         if output_askfile:
-            self._model.load_videos_from_files([Path(file) for file in output_askfile])
+            self._stop_navigation()
+            self._model.load_videos_from_files(
+                files=sorted(Path(file) for file in output_askfile),
+                on_progress=self._show_video_loading_progress,
+            )
+            self._gui.frame_canvas.refresh_info_text()
             self._display_first_frame()
+            self._start_thumbnail_timeline()
+
+    def _show_video_loading_progress(
+        self, number_of_loaded_videos: int, number_of_videos: int
+    ) -> None:
+        self._gui.frame_canvas.show_info_text(
+            f"Loading videos: {number_of_loaded_videos}/{number_of_videos}"
+        )
+
+    def _start_thumbnail_timeline(self) -> None:
+        self._model.start_thumbnail_timeline()
+        self.refresh_timeline()
+
+    def refresh_timeline(self) -> None:
+        """Show the extracted thumbnails and refresh them until all are extracted."""
+        if self._timeline_refresh_job is not None:
+            self._gui.after_cancel(self._timeline_refresh_job)
+            self._timeline_refresh_job = None
+        width, height = self._gui.frame_canvas.timeline.get_size()
+        strip = self._model.get_thumbnail_timeline_strip(width=width, height=height)
+        if strip is None:
+            return
+        self._gui.frame_canvas.timeline.update_strip(strip)
+        self._show_position_on_timeline()
+        if not self._model.thumbnail_timeline_is_complete():
+            self._timeline_refresh_job = self._gui.after(
+                TIMELINE_REFRESH_INTERVAL_MS, self.refresh_timeline
+            )
+
+    def _show_position_on_timeline(self) -> None:
+        if self._current_frame is None:
+            return
+        position = self._model.get_position_on_thumbnail_timeline(self._current_frame)
+        if position is not None:
+            self._gui.frame_canvas.timeline.show_position(position)
+
+    def jump_to_timeline_position(self, relative_position: float) -> None:
+        """Render the frame of the thumbnail at a position in the background.
+
+        Args:
+            relative_position (float): position between 0 (start) and 1 (end of
+                the timeline)
+        """
+        if self._playback_job is not None:
+            self._stop_playback()
+        self._stop_navigation()
+        global_frame_number = (
+            self._model.get_global_frame_number_by_thumbnail_timeline_position(
+                relative_position
+            )
+        )
+        if global_frame_number is None:
+            return
+        self._navigation_target = global_frame_number
+        self._request_frame(global_frame_number=global_frame_number, scale=1.0)
 
     def _display_first_frame(self) -> None:
         overlayed_first_frame = self._model.get_first_frame(
@@ -68,6 +145,7 @@ class Presenter(PresenterInterface):
             ],
         )
         if output_askfile:
+            self._stop_navigation()
             self._model.read_sections_from_file(Path(output_askfile))
             if self._current_frame is None:
                 return
@@ -82,6 +160,7 @@ class Presenter(PresenterInterface):
             ],
         )
         if output_askfile:
+            self._stop_navigation()
             self._model.read_sections_from_file(Path(output_askfile))
             self._model.read_events_from_file(Path(output_askfile))
             self.refresh_treeview()
@@ -110,6 +189,7 @@ class Presenter(PresenterInterface):
             )
 
     def _refresh_current_frame(self) -> None:
+        self._stop_navigation()
         if self._current_frame is None:
             return
         overlayed_frame = self._model.refresh_current_frame(
@@ -130,43 +210,242 @@ class Presenter(PresenterInterface):
             capped_scroll_delta = max(scroll_delta, -MAX_SCROLL_STEP)
         else:
             capped_scroll_delta = min(scroll_delta, MAX_SCROLL_STEP)
-        overlayed_frame = self._model.get_frame_by_delta_frames_or_time(
-            current_frame=self._current_frame,
-            selected_classes=self.get_selected_classes_from_gui(),
-            selected_count_ids=(
-                self._gui.frame_treeview.treeview_counts.get_selected_count_ids()
-            ),
+        self._navigate(
             delta_of_frames=capped_scroll_delta,
-            delta_of_time=0,
+            large_step=abs(capped_scroll_delta) >= FACTOR_LARGE_SCROLLING,
         )
-        self._update_canvas_image(overlayed_frame=overlayed_frame)
 
-    def jump_by_delta_time_in_sec(self, delta_of_time: float) -> None:
-        if self._current_frame is not None:
-            overlayed_frame = self._model.get_frame_by_delta_frames_or_time(
-                current_frame=self._current_frame,
-                selected_classes=self.get_selected_classes_from_gui(),
-                selected_count_ids=(
-                    self._gui.frame_treeview.treeview_counts.get_selected_count_ids()
-                ),
-                delta_of_frames=0,
-                delta_of_time=delta_of_time,
+    def _navigate(
+        self,
+        delta_of_frames: int = 0,
+        delta_of_time: float = 0,
+        large_step: bool = False,
+    ) -> None:
+        """Move from the frame navigated to last and render it in the background.
+
+        Steps are added to the target of the navigation before the frames are
+        rendered, so that the frame shown last matches all steps, even if frames
+        of intermediate targets were never rendered.
+
+        Args:
+            delta_of_frames (int): number of frames to move. Defaults to 0.
+            delta_of_time (float): number of seconds to move. Defaults to 0.
+            large_step (bool): whether the step is a large one. Defaults to False.
+        """
+        if self._current_frame is None:
+            return
+        if self._playback_job is not None:
+            self._stop_playback()
+        if self._navigation_target is None:
+            self._navigation_target = self._model.get_global_frame_number(
+                self._current_frame
             )
-            self._update_canvas_image(overlayed_frame=overlayed_frame)
+        self._navigation_target = self._model.get_global_frame_number_by_delta(
+            global_frame_number=self._navigation_target,
+            delta_of_frames=delta_of_frames,
+            delta_of_time=delta_of_time,
+        )
+        self._request_frame(
+            global_frame_number=self._navigation_target,
+            scale=self._get_scale_for_navigation(large_step=large_step),
+        )
+
+    def _request_frame(self, global_frame_number: int, scale: float) -> None:
+        selected_classes = self.get_selected_classes_from_gui()
+        selected_count_ids = (
+            self._gui.frame_treeview.treeview_counts.get_selected_count_ids()
+        )
+        self._render_worker.request(
+            lambda: self._model.get_frame_by_global_frame_number(
+                global_frame_number=global_frame_number,
+                selected_classes=selected_classes,
+                selected_count_ids=selected_count_ids,
+                scale=scale,
+            ).render()
+        )
+        if self._render_poll_job is None:
+            self._render_poll_job = self._gui.after(
+                RENDER_POLL_INTERVAL_MS, self._show_rendered_frame
+            )
+
+    def _show_rendered_frame(self) -> None:
+        """Show the frame rendered last and keep polling while frames are rendered.
+
+        If rendering failed, the frame shown stays and the next navigation starts
+        from it.
+        """
+        self._render_poll_job = None
+        try:
+            rendered_frame = self._render_worker.take_result()
+        except Exception as cause:
+            print(f"Frame could not be rendered: {cause!r}")
+            rendered_frame = None
+            self._navigation_target = None
+        if rendered_frame is not None:
+            self._show_frame(rendered_frame)
+        if self._render_worker.is_busy():
+            self._render_poll_job = self._gui.after(
+                RENDER_POLL_INTERVAL_MS, self._show_rendered_frame
+            )
+        else:
+            self._navigation_target = None
+
+    def _stop_navigation(self) -> None:
+        """Stay at the frame shown and drop the frames still being rendered.
+
+        The frame the render worker is rendering is not waited for, its result is
+        dropped. The pending full resolution render of a large step is dropped as
+        well.
+        """
+        self._render_worker.cancel()
+        self._navigation_target = None
+        if self._render_poll_job is not None:
+            self._gui.after_cancel(self._render_poll_job)
+            self._render_poll_job = None
+        self._cancel_settle_job()
+
+    def _cancel_settle_job(self) -> None:
+        if self._settle_job is not None:
+            self._gui.after_cancel(self._settle_job)
+            self._settle_job = None
+
+    def toggle_playback(self) -> None:
+        if self._playback_job is not None:
+            self._stop_playback()
+        elif self._current_frame is not None:
+            self._stop_navigation()
+            self._playback_position = self._model.get_global_frame_number(
+                self._current_frame
+            )
+            self._playback_clock.restart()
+            self._show_playback_info_text()
+            self._playback_job = self._gui.after(1, self._play_next_frame)
+
+    def switch_playback_speed(self) -> None:
+        self._playback_clock.switch_to_next_speed()
+        if self._playback_job is not None:
+            self._show_playback_info_text()
+
+    def _show_playback_info_text(self) -> None:
+        self._gui.frame_canvas.show_info_text(
+            f"Playback: {self._playback_clock.get_speed():g}x"
+        )
+
+    def _stop_playback(self) -> None:
+        """Stop playing, navigation continues from the frame played last."""
+        if self._playback_job is not None:
+            self._gui.after_cancel(self._playback_job)
+            self._playback_job = None
+        if self._playback_position is not None:
+            self._navigation_target = self._playback_position
+            self._playback_position = None
+        self._gui.frame_canvas.refresh_info_text()
+
+    def _play_next_frame(self) -> None:
+        """Render the frame due by the wall clock and schedule the next one.
+
+        Frames are rendered by the render worker like navigation steps. If
+        rendering takes longer than a frame lasts, frames due meanwhile replace
+        the ones waiting, so that playback keeps up with real time.
+
+        Playback continues across video boundaries and stops at the end of the
+        last video.
+        """
+        self._playback_job = None
+        if self._current_frame is None or self._playback_position is None:
+            return
+        frame_rate = self._model.get_frame_rate_of(self._current_frame)
+        frames_due = self._playback_clock.get_frames_due(frame_rate)
+        if frames_due > 0:
+            last_frame = self._model.get_number_of_frames_of_all_videos() - 1
+            self._playback_position = min(
+                self._playback_position + frames_due, last_frame
+            )
+            self._request_frame(global_frame_number=self._playback_position, scale=1.0)
+            if self._playback_position == last_frame:
+                self._stop_playback()
+                return
+        self._playback_job = self._gui.after(
+            self._playback_clock.get_delay_until_next_frame_in_ms(frame_rate),
+            self._play_next_frame,
+        )
+
+    def jump_by_delta_time_in_sec(self, delta_of_time: float) -> None:
+        self._navigate(delta_of_time=delta_of_time, large_step=True)
+
+    def _get_scale_for_navigation(self, large_step: bool) -> float:
+        """Show large steps at reduced resolution until the navigation settles.
+
+        Args:
+            large_step (bool): whether the navigation step is a large one
+
+        Returns:
+            float: scale to show the next frame at
+        """
+        self._cancel_settle_job()
+        if not large_step:
+            return 1.0
+        self._settle_job = self._gui.after(
+            SCRUB_SETTLE_DELAY_MS, self._on_navigation_settled
+        )
+        return SCRUB_SCALE
+
+    def _on_navigation_settled(self) -> None:
+        self._settle_job = None
+        self._navigate()
+
+    def resize_canvas(self, width: int, height: int) -> None:
+        self._model.resize_canvas(width=width, height=height)
+        self._show_new_viewport()
+
+    def zoom(self, factor: float, x: int, y: int) -> None:
+        if self._current_frame is None:
+            return
+        self._model.zoom(current_frame=self._current_frame, factor=factor, x=x, y=y)
+        self._show_new_viewport()
+
+    def pan(self, delta_x: int, delta_y: int) -> None:
+        if self._current_frame is None:
+            return
+        self._model.pan(
+            current_frame=self._current_frame, delta_x=delta_x, delta_y=delta_y
+        )
+        self._show_new_viewport()
+
+    def _show_new_viewport(self) -> None:
+        """Render the frame navigated to last with the zoom and pan changed.
+
+        Renders are coalesced like navigation steps, so that dragging and zooming
+        only render the latest viewport. Playback shows its next frame with the
+        new viewport anyway.
+        """
+        if self._current_frame is None or self._playback_job is not None:
+            return
+        self._navigate()
 
     def _update_canvas_image(self, overlayed_frame: OverlayedFrame) -> None:
+        self._show_frame(overlayed_frame.render())
+
+    def _show_frame(self, rendered_frame: RenderedFrame) -> None:
         self._gui.frame_canvas.canvas_background.update_image(
-            image=overlayed_frame.get()
+            image=rendered_frame.image
         )
-        self._current_frame = overlayed_frame
+        self._current_frame = rendered_frame.overlayed_frame
+        self._show_position_on_timeline()
 
     def refresh_treeview(self) -> None:
-        self._gui.frame_treeview.treeview_counts.refresh_treeview(
-            count_repository=self._model._count_repository
-        )
+        self._gui.frame_treeview.treeview_counts.refresh_treeview()
+
+    def get_count_repository(self) -> CountRepository:
+        return self._model._count_repository
 
     def try_add_event(self, x: int, y: int) -> None:
-        coordinate = Coordinate(x, y)
+        self._stop_navigation()
+        if self._current_frame is None:
+            return
+        coordinate = self._model.get_video_coordinate(
+            current_frame=self._current_frame, x=x, y=y
+        )
         event = self._model.get_event_for(
             coordinate=coordinate, current_frame=self._current_frame
         )
@@ -177,9 +456,18 @@ class Presenter(PresenterInterface):
         if not self._model.active_count_class_is_set():
             self._gui.frame_treeview.treeview_counts.selection_set("")
             self._gui.frame_treeview.class_label.set_blank()
-        self.update_canvas_image_with_new_overlay()
+        self._update_canvas_image_with_new_active_count()
+
+    def _update_canvas_image_with_new_active_count(self) -> None:
+        if self._current_frame is not None:
+            self._update_canvas_image(
+                overlayed_frame=self._model.refresh_active_count_overlay(
+                    current_frame=self._current_frame
+                )
+            )
 
     def update_canvas_image_with_new_overlay(self) -> None:
+        self._stop_navigation()
         if self._current_frame is not None:
             overlayed_frame = self._model._get_overlayed_frame(
                 background_frame=self._current_frame.background_frame,
@@ -191,14 +479,16 @@ class Presenter(PresenterInterface):
             self._update_canvas_image(overlayed_frame=overlayed_frame)
 
     def set_road_user_class_for_active_count(self, key: str) -> None:
+        self._stop_navigation()
         road_user_class = self._model.set_road_user_class_for_active_count(key)
         if road_user_class is not None:
-            self.update_canvas_image_with_new_overlay()
+            self._update_canvas_image_with_new_active_count()
             self._gui.frame_treeview.class_label.show_class_img(
                 road_user_class=road_user_class
             )
 
     def finsh_active_count(self) -> None:
+        self._stop_navigation()
         try:
             count = self._model.add_active_count_to_repository()
         except TooFewEventsError:
@@ -214,12 +504,14 @@ class Presenter(PresenterInterface):
         return
 
     def abort_active_count(self) -> None:
+        self._stop_navigation()
         self._model.clear_active_count()
         self._gui.frame_treeview.treeview_counts.selection_set("")
         self._gui.frame_treeview.class_label.set_blank()
-        self.update_canvas_image_with_new_overlay()
+        self._update_canvas_image_with_new_active_count()
 
     def delete_selected_counts(self) -> None:
+        self._stop_navigation()
         to_delete_count_ids = (
             self._gui.frame_treeview.treeview_counts.get_selected_count_ids()
         )
@@ -230,6 +522,7 @@ class Presenter(PresenterInterface):
         self._gui.frame_treeview.class_label.set_blank()
 
     def show_start_of_count(self, count_id: str):
+        self._stop_navigation()
         overlayed_frame = self._model.get_start_frame_of_count(
             count_id=count_id,
             selected_classes=self.get_selected_classes_from_gui(),
@@ -239,7 +532,7 @@ class Presenter(PresenterInterface):
         )
         self._update_canvas_image(overlayed_frame=overlayed_frame)
 
-    def get_selected_classes_from_gui(self) -> list[str]:
+    def get_selected_classes_from_gui(self) -> frozenset[str]:
         return self._gui.frame_treeview.combobox_counts.get_selected_classes()
 
     def show_class_image_by_count_id(self, count_id: str) -> None: